@@ -0,0 +1,66 @@
+"""Per-request overhead of AuthMiddleware with the verified-token cache on and off.
+
+Runs in-process through falcon.testing; no database is needed:
+
+    python -m benchmarks.bench_auth_middleware --requests 20000 --tokens 1000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, UTC
+
+import falcon
+import falcon.testing
+import jwt
+
+from src.interfaces.api.middleware.auth_middleware import AuthMiddleware
+
+SECRET_KEY = "bench-secret"
+
+
+class PingResource:
+    def on_get(self, req, resp):
+        resp.media = {"ok": True}
+
+
+def build_client(middleware):
+    app = falcon.App(middleware=middleware)
+    app.add_route("/ping", PingResource())
+    return falcon.testing.TestClient(app)
+
+
+def make_tokens(count: int):
+    expires = datetime.now(UTC) + timedelta(hours=1)
+    return [
+        jwt.encode({"sub": f"user-{i}", "email": f"user-{i}@example.com", "role": "owner", "exp": expires},
+                   SECRET_KEY, algorithm="HS256")
+        for i in range(count)
+    ]
+
+
+def run(client, tokens, requests: int) -> float:
+    headers = [{"Authorization": f"Bearer {token}"} for token in tokens]
+    start = time.perf_counter()
+    for i in range(requests):
+        client.simulate_get("/ping", headers=headers[i % len(headers)])
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=1000, help="Distinct active tokens")
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    baseline = run(build_client([]), tokens, args.requests)
+    uncached = run(build_client([AuthMiddleware(SECRET_KEY, token_cache_size=0)]), tokens, args.requests)
+    cached = run(build_client([AuthMiddleware(SECRET_KEY)]), tokens, args.requests)
+
+    print(f"{'variant':>14} {'us/request':>11} {'middleware us':>14}")
+    print(f"{'no middleware':>14} {baseline:>11.1f} {0:>14.1f}")
+    print(f"{'cache off':>14} {uncached:>11.1f} {uncached - baseline:>14.1f}")
+    print(f"{'cache on':>14} {cached:>11.1f} {cached - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Per-request cost of the metrics middleware and per-command cost of the Mongo listener.
+
+Times the middleware hooks on a routed request (a whole falcon.testing
+round trip is ~200 us and too noisy to show a few microseconds), feeds
+synthetic command events to MongoCommandMetrics and times rendering
+/metrics; no database is needed:
+
+    python -m benchmarks.bench_metrics_overhead --requests 200000 --routes 20
+"""
+import argparse
+import time
+from types import SimpleNamespace
+
+import falcon
+import falcon.testing
+
+from src.infrastructure.metrics import MetricsRegistry, MongoCommandMetrics
+from src.interfaces.api.middleware.metrics_middleware import MetricsMiddleware
+
+
+def request_micros(middleware: MetricsMiddleware, routes: int, count: int) -> float:
+    requests = []
+    for route in range(routes):
+        req = falcon.testing.create_req(path=f"/route{route}/1")
+        req.uri_template = f"/route{route}/{{item_id}}"
+        requests.append(req)
+    resp = falcon.Response()
+    start = time.perf_counter()
+    for i in range(count):
+        req = requests[i % routes]
+        middleware.process_request(req, resp)
+        middleware.process_response(req, resp, None, True)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def command_micros(listener: MongoCommandMetrics, count: int) -> float:
+    events = [
+        (SimpleNamespace(command={"find": f"collection{i % 4}"}, command_name="find",
+                         connection_id=("localhost", 27017), request_id=i),
+         SimpleNamespace(command_name="find", connection_id=("localhost", 27017), request_id=i,
+                         duration_micros=900))
+        for i in range(count)
+    ]
+    start = time.perf_counter()
+    for started, succeeded in events:
+        listener.started(started)
+        listener.succeeded(succeeded)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--routes", type=int, default=20)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    print(f"request hooks           {request_micros(MetricsMiddleware(registry), args.routes, args.requests):7.2f} us")
+    print(f"mongo command events    {command_micros(MongoCommandMetrics(registry), args.requests):7.2f} us")
+
+    start = time.perf_counter()
+    body = registry.render()
+    print(f"render /metrics         {(time.perf_counter() - start) * 1e3:7.2f} ms ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
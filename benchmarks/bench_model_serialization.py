@@ -0,0 +1,131 @@
+"""Per-resume memory and serialization throughput for large resume aggregates.
+
+Compares the slotted models and generated converters against the previous
+__dict__-backed dataclasses, copy-and-**kwargs loading and json.dumps over
+vars(). Runs in-process on synthetic Mongo documents; no database is needed:
+
+    python -m benchmarks.bench_model_serialization --resumes 500 --children 50
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime, UTC
+
+from bson import ObjectId
+
+from src.domain.models.change_tracking import ChangeTracking
+from src.domain.models.resume import Resume, Contact, Education, Experience, Skill
+from src.domain.models.serialization import to_dict
+from src.infrastructure.repositories.mongodb_resume_documents import ResumeDocumentMapper
+from src.interfaces.api.media import dumps, orjson
+
+# __dict__-backed dataclasses with the same fields and change tracking,
+# standing in for the models before slots
+LEGACY_MODELS = {
+    model: make_dataclass(f"Legacy{model.__name__}", [(field.name, field.type) for field in fields(model)],
+                          bases=(ChangeTracking,))
+    for model in (Resume, Contact, Education, Experience, Skill)
+}
+
+
+def documents(count: int, children: int):
+    now = datetime.now(UTC)
+    for i in range(count):
+        resume_id = str(ObjectId())
+        yield (
+            {"_id": resume_id, "user_id": "bench-user", "title": f"Resume {i}", "summary": "Synthetic " * 20,
+             "contact": {"email": "bench@example.com", "phone": "555-0100", "location": "Remote",
+                         "linkedin": None, "github": None},
+             "created_at": now, "updated_at": now},
+            [{"_id": str(ObjectId()), "resume_id": resume_id, "institution": "University", "degree": "BSc",
+              "field_of_study": "Computer Science", "start_date": now, "end_date": None, "description": None}
+             for _ in range(children)],
+            [{"_id": str(ObjectId()), "resume_id": resume_id, "company": "Company", "position": "Engineer",
+              "start_date": now, "end_date": None, "description": "Built things",
+              "achievements": ["Shipped it", "Scaled it"]}
+             for _ in range(children)],
+            [{"_id": str(ObjectId()), "resume_id": resume_id, "name": f"Skill {j}", "level": "Advanced"}
+             for j in range(children)]
+        )
+
+
+def legacy_child(model, record: dict):
+    # The previous mapping: copy the record, rename _id, spread as **kwargs
+    record_copy = record.copy()
+    record_copy["id"] = str(record_copy.pop("_id"))
+    record_copy.pop("resume_id", None)
+    return LEGACY_MODELS[model](**record_copy)
+
+
+def legacy_resume(resume_dict, education, experience, skills):
+    resume = LEGACY_MODELS[Resume](
+        id=str(resume_dict["_id"]),
+        user_id=resume_dict["user_id"],
+        title=resume_dict["title"],
+        contact=LEGACY_MODELS[Contact](**resume_dict["contact"]),
+        summary=resume_dict["summary"],
+        education=[legacy_child(Education, record) for record in education],
+        experience=[legacy_child(Experience, record) for record in experience],
+        skills=[legacy_child(Skill, record) for record in skills],
+        created_at=resume_dict["created_at"],
+        updated_at=resume_dict["updated_at"]
+    )
+    resume.mark_clean()
+    return resume
+
+
+def legacy_serialize(resume) -> bytes:
+    serialized = dict(vars(resume))
+    serialized["contact"] = vars(resume.contact)
+    for name in ("education", "experience", "skills"):
+        serialized[name] = [vars(item) for item in serialized[name]]
+    return json.dumps(serialized, default=lambda value: value.isoformat()).encode("utf-8")
+
+
+def current_serialize(resume) -> bytes:
+    encoded = dumps(to_dict(resume))
+    return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+
+def measure(label: str, docs, load, serialize):
+    # Memory is traced on a separate pass; tracemalloc slows allocation down
+    tracemalloc.start()
+    resumes = [load(*doc) for doc in docs]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resumes
+
+    start = time.perf_counter()
+    resumes = [load(*doc) for doc in docs]
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    payload_bytes = sum(len(serialize(resume)) for resume in resumes)
+    serialize_seconds = time.perf_counter() - start
+
+    count = len(resumes)
+    print(f"{label:>8}: {memory / count / 1024:8.1f} KiB/resume  "
+          f"load {count / load_seconds:8.0f} resumes/s  "
+          f"serialize {count / serialize_seconds:8.0f} resumes/s "
+          f"({payload_bytes / serialize_seconds / 1e6:6.1f} MB/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--children", type=int, default=50)
+    args = parser.parse_args()
+
+    docs = list(documents(args.resumes, args.children))
+    mapper = ResumeDocumentMapper()
+
+    print(f"{args.resumes} resumes, {args.children} entries per child collection, "
+          f"JSON encoder: {'orjson' if orjson else 'json'}")
+    measure("legacy", docs, legacy_resume, legacy_serialize)
+    measure("slotted", docs, mapper._dict_to_resume, current_serialize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Single-resume latency with sequential and pooled child-collection fetches.
+
+Runs against a local mongod (MONGODB_URI) in a throwaway database. Latency
+is dominated by round trips, so point it at a server with realistic network
+distance, or add delay with e.g. `tc qdisc ... netem delay 2ms`:
+
+    python -m benchmarks.bench_parallel_child_fetch --repeat 200 --threads 1 16
+"""
+import argparse
+import os
+import statistics
+import threading
+import time
+
+from pymongo import MongoClient
+
+from benchmarks.bench_resume_loading import seed
+from src.infrastructure.repositories.child_fetch_pool import ChildFetchPool
+from src.infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+
+
+def run(repository: MongoDBResumeRepository, resume_ids, repeat: int, threads: int):
+    timings = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            repository.find_by_id(resume_ids[i % len(resume_ids)])
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            timings.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 16])
+    args = parser.parse_args()
+
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"))
+    database_name = "resume_api_bench_child_fetch"
+    client.drop_database(database_name)
+
+    pool = ChildFetchPool.for_client(client)
+    sequential = MongoDBResumeRepository(client, database_name)
+    parallel = MongoDBResumeRepository(client, database_name, child_fetch_pool=pool)
+    try:
+        sequential.ensure_indexes()
+        seed(sequential, "bench-user", args.resumes)
+        resume_ids = [resume.id for resume in sequential.find_by_user_id("bench-user")]
+
+        print(f"pool of {pool.max_workers} workers "
+              f"(maxPoolSize {client.options.pool_options.max_pool_size})")
+        print(f"{'threads':>8} {'sequential p50':>15} {'p99':>8} {'pooled p50':>11} {'p99':>8}")
+        for threads in args.threads:
+            seq_p50, seq_p99 = run(sequential, resume_ids, args.repeat, threads)
+            par_p50, par_p99 = run(parallel, resume_ids, args.repeat, threads)
+            print(f"{threads:>8} {seq_p50:>12.2f} ms {seq_p99:>5.2f} ms {par_p50:>8.2f} ms {par_p99:>5.2f} ms")
+        print(f"pool stats: {pool.stats()}")
+    finally:
+        pool.shutdown()
+        client.drop_database(database_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""CPU cost of gzip response compression against the bytes it saves.
+
+Serves synthetic resume payloads in-process through falcon.testing, with and
+without the compression middleware, at several compression levels; no
+database is needed:
+
+    python -m benchmarks.bench_response_compression --levels 1 6 9 --mbps 50
+"""
+import argparse
+import random
+import time
+from datetime import datetime, UTC
+
+import falcon
+import falcon.testing
+from bson import ObjectId
+
+from src.domain.models.resume import Resume, Contact, Education, Experience, Skill, SKILL_LEVELS
+from src.interfaces.api.media import register_json_handler
+from src.interfaces.api.middleware.compression_middleware import CompressionMiddleware
+from src.interfaces.api.resources.resume_resource import ResumeResource
+
+WORDS = ("designed built scaled migrated led owned reduced latency throughput services platform pipeline "
+         "customers payments search analytics infrastructure reliability observability team roadmap").split()
+
+
+def synthetic_resume(rng: random.Random) -> Resume:
+    now = datetime.now(UTC)
+
+    def sentence(low, high):
+        return " ".join(rng.choices(WORDS, k=rng.randint(low, high))).capitalize() + "."
+
+    return Resume(
+        id=str(ObjectId()), user_id="bench-user", title="Senior Engineer",
+        contact=Contact(email="bench@example.com", phone="555-0100", location="Remote", linkedin=None, github=None),
+        summary=" ".join(sentence(10, 25) for _ in range(4)),
+        education=[Education(str(ObjectId()), "University", "BSc", "Computer Science", now, now, None)
+                   for _ in range(2)],
+        experience=[Experience(str(ObjectId()), f"Company {i}", "Engineer", now, None,
+                               " ".join(sentence(12, 30) for _ in range(3)),
+                               [sentence(8, 16) for _ in range(rng.randint(3, 6))])
+                    for i in range(rng.randint(4, 8))],
+        skills=[Skill(str(ObjectId()), f"Skill {i}", rng.choice(SKILL_LEVELS)) for i in range(15)],
+        created_at=now, updated_at=now
+    )
+
+
+class PayloadResource:
+    # Serializes like ResumeResource; the resumes are fixed, so only
+    # rendering and compression are measured
+    def __init__(self, resumes):
+        self.serializer = ResumeResource(None)
+        self.resumes = resumes
+
+    def on_get(self, req, resp, kind):
+        if kind == "resume":
+            resp.media = self.serializer._serialize_resume(self.resumes[0])
+        elif kind == "listing":
+            resp.media = [self.serializer._serialize_resume(resume) for resume in self.resumes]
+        else:
+            resp.content_type = "application/x-ndjson"
+            resp.stream = self.serializer._stream_ndjson(self.resumes)
+
+
+def client(resumes, level):
+    middleware = [CompressionMiddleware(level=level)] if level else []
+    app = falcon.App(middleware=middleware)
+    register_json_handler(app)
+    app.add_route("/{kind}", PayloadResource(resumes))
+    return falcon.testing.TestClient(app)
+
+
+def measure(test_client, kind: str, repeat: int):
+    headers = {"Accept-Encoding": "gzip"}
+    test_client.simulate_get(f"/{kind}", headers=headers)
+    start = time.process_time()
+    for _ in range(repeat):
+        body = test_client.simulate_get(f"/{kind}", headers=headers).content
+    return (time.process_time() - start) / repeat, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=50, help="Resumes per listing and stream")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--mbps", type=float, default=50.0, help="Link speed for the transfer-time column")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    resumes = [synthetic_resume(rng) for _ in range(args.resumes)]
+
+    print(f"{'payload':>8} {'level':>5} {'bytes':>9} {'saved':>6} {'cpu/req':>10} {'+cpu':>9} "
+          f"{'cpu/KiB saved':>14} {'transfer saved':>15}")
+    for kind in ("resume", "listing", "ndjson"):
+        baseline_cpu, raw_bytes = measure(client(resumes, 0), kind, args.repeat)
+        print(f"{kind:>8} {'off':>5} {raw_bytes:>9} {'':>6} {baseline_cpu * 1e6:>7.0f} us")
+        for level in args.levels:
+            cpu, sent_bytes = measure(client(resumes, level), kind, args.repeat)
+            saved = raw_bytes - sent_bytes
+            extra = cpu - baseline_cpu
+            transfer_ms = saved * 8 / (args.mbps * 1e6) * 1000
+            print(f"{kind:>8} {level:>5} {sent_bytes:>9} {saved / raw_bytes:>6.0%} {cpu * 1e6:>7.0f} us "
+                  f"{extra * 1e6:>6.0f} us {extra * 1e6 / (saved / 1024):>11.1f} us {transfer_ms:>12.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Round trips and latency of resume loading as the resume count grows.
+
+Runs against a local mongod (MONGODB_URI, default mongodb://localhost:27017)
+and uses a throwaway database that is dropped afterwards:
+
+    python -m benchmarks.bench_resume_loading --counts 1 10 40 100
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, UTC
+
+from pymongo import MongoClient, monitoring
+
+from src.domain.models.resume import Resume, Contact, Education, Experience, Skill
+from src.infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+
+
+class RoundTripCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def legacy_find_by_user_id(repository: MongoDBResumeRepository, user_id: str):
+    # The original 1 + 3·N access pattern, kept here as the baseline
+    resumes = []
+    for resume_dict in repository.resumes.find({"user_id": user_id}):
+        resume_id = str(resume_dict["_id"])
+        education_records = list(repository.education.find({"resume_id": resume_id}))
+        experience_records = list(repository.experience.find({"resume_id": resume_id}))
+        skill_records = list(repository.skills.find({"resume_id": resume_id}))
+        resumes.append(repository._dict_to_resume(resume_dict, education_records, experience_records, skill_records))
+    return resumes
+
+
+def seed(repository: MongoDBResumeRepository, user_id: str, count: int):
+    now = datetime.now(UTC)
+    for i in range(count):
+        repository.save(Resume(
+            id=None,
+            user_id=user_id,
+            title=f"Resume {i}",
+            contact=Contact(email="bench@example.com", phone=None, location=None, linkedin=None, github=None),
+            summary="Synthetic resume used for benchmarking",
+            education=[
+                Education(None, "University", "BSc", "Computer Science", now, None, None)
+                for _ in range(2)
+            ],
+            experience=[
+                Experience(None, "Company", "Engineer", now, None, "Built things", ["Shipped it"])
+                for _ in range(3)
+            ],
+            skills=[Skill(None, f"Skill {j}", "Advanced") for j in range(5)],
+            created_at=now,
+            updated_at=now
+        ))
+
+
+def measure(fn, counter: RoundTripCounter, repeat: int):
+    timings = []
+    round_trips = 0
+    for _ in range(repeat):
+        counter.count = 0
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+        round_trips = counter.count
+    return round_trips, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 5, 10, 20, 40, 80])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"), event_listeners=[counter])
+    database_name = "resume_api_bench_loading"
+    client.drop_database(database_name)
+
+    batched = MongoDBResumeRepository(client, database_name, load_mode="batched")
+    lookup = MongoDBResumeRepository(client, database_name, load_mode="lookup")
+
+    print(f"{'resumes':>8} {'mode':>8} {'round trips':>12} {'median ms':>10}")
+    try:
+        for count in args.counts:
+            user_id = f"bench-user-{count}"
+            seed(batched, user_id, count)
+            for mode, fn in (
+                ("legacy", lambda: legacy_find_by_user_id(batched, user_id)),
+                ("batched", lambda: batched.find_by_user_id(user_id)),
+                ("lookup", lambda: lookup.find_by_user_id(user_id)),
+            ):
+                round_trips, median_ms = measure(fn, counter, args.repeat)
+                print(f"{count:>8} {mode:>8} {round_trips:>12} {median_ms:>10.2f}")
+    finally:
+        client.drop_database(database_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Round trips and latency of MongoDBResumeRepository.save for large resumes.
+
+Compares the original one-write-per-child path with the bulk_write path,
+and with the transactional path when --transactions is given (requires a
+replica set). Runs against a local mongod (MONGODB_URI) in a throwaway
+database:
+
+    python -m benchmarks.bench_resume_save --children 30 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, UTC
+
+from pymongo import MongoClient
+
+from benchmarks.bench_resume_loading import RoundTripCounter
+from src.domain.models.resume import Resume, Contact, Education, Experience, Skill
+from src.infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+
+
+def build_resume(children: int) -> Resume:
+    now = datetime.now(UTC)
+    per_kind = max(children // 3, 1)
+    return Resume(
+        id=None,
+        user_id="bench-user",
+        title="Benchmark resume",
+        contact=Contact(email="bench@example.com", phone=None, location=None, linkedin=None, github=None),
+        summary="Synthetic resume used for benchmarking",
+        education=[Education(None, "University", "BSc", "Computer Science", now, None, None) for _ in range(per_kind)],
+        experience=[Experience(None, "Company", "Engineer", now, None, "Built things", ["Shipped it"]) for _ in range(per_kind)],
+        skills=[Skill(None, f"Skill {i}", "Advanced") for i in range(per_kind)],
+        created_at=now,
+        updated_at=now
+    )
+
+
+def legacy_save(repository: MongoDBResumeRepository, resume: Resume) -> Resume:
+    # The original path: one insert_one per record
+    resume_dict = repository._resume_document(resume)
+    resume.id = str(repository.resumes.insert_one(resume_dict).inserted_id)
+    for collection, children in (
+        (repository.education, resume.education),
+        (repository.experience, resume.experience),
+        (repository.skills, resume.skills),
+    ):
+        for child in children:
+            child.id = str(collection.insert_one(repository._child_document(child, resume.id)).inserted_id)
+    return resume
+
+
+def measure(save, children: int, counter: RoundTripCounter, repeat: int):
+    timings = []
+    round_trips = 0
+    for _ in range(repeat):
+        resume = build_resume(children)
+        counter.count = 0
+        start = time.perf_counter()
+        save(resume)
+        timings.append((time.perf_counter() - start) * 1000)
+        round_trips = counter.count
+    return round_trips, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, nargs="+", default=[3, 30, 90])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--transactions", action="store_true")
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"), event_listeners=[counter])
+    database_name = "resume_api_bench_save"
+    client.drop_database(database_name)
+
+    repository = MongoDBResumeRepository(client, database_name)
+    paths = [("legacy", lambda resume: legacy_save(repository, resume)), ("bulk", repository.save)]
+    if args.transactions:
+        transactional = MongoDBResumeRepository(client, database_name, use_transactions=True)
+        paths.append(("txn", transactional.save))
+
+    print(f"{'children':>8} {'path':>8} {'round trips':>12} {'median ms':>10}")
+    try:
+        for children in args.children:
+            for name, save in paths:
+                round_trips, median_ms = measure(save, children, counter, args.repeat)
+                print(f"{children:>8} {name:>8} {round_trips:>12} {median_ms:>10.2f}")
+    finally:
+        client.drop_database(database_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Build time, memory and query latency of the in-process resume search index.
+
+Generates a synthetic corpus in memory (no database needed) and compares
+indexed queries against scanning every resume, which is what answering
+them from the listing endpoints amounts to:
+
+    python -m benchmarks.bench_resume_search --resumes 100000 --queries 200
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, UTC
+
+from bson import ObjectId
+
+from src.domain.models.resume import Resume, Contact, Experience, Skill, SKILL_LEVELS
+from src.infrastructure.repositories.resume_search_index import ResumeSearchIndex, LEVEL_RANKS, tokenize
+
+SKILLS = ["Python", "Java", "Go", "Rust", "C++", "C#", "JavaScript", "TypeScript", "Kotlin", "Scala",
+          "SQL", "MongoDB", "PostgreSQL", "Kubernetes", "Docker", "Terraform", "AWS", "GCP", "Azure",
+          "React", "Vue", "Django", "Flask", "Falcon", "Spark", "Kafka", "Airflow", "Pandas", "PyTorch",
+          "TensorFlow"]
+POSITIONS = ["Software Engineer", "Senior Software Engineer", "Staff Engineer", "Data Scientist",
+             "Data Engineer", "Backend Developer", "Frontend Developer", "Site Reliability Engineer",
+             "Engineering Manager", "Machine Learning Engineer", "DevOps Engineer", "Product Manager"]
+COMPANIES = [f"Company{i}" for i in range(2000)]
+WORDS = ("built scaled designed maintained led migrated services platform pipeline latency throughput "
+         "distributed systems teams customers payments search analytics realtime infrastructure api "
+         "reliability observability security billing mobile web cloud storage streaming").split()
+
+QUERIES = [
+    ("skill", {"skill": "Python", "min_skill_level": "Advanced"}),
+    ("skill + text", {"skill": "Kubernetes", "min_skill_level": "Intermediate", "text": "platform reliability"}),
+    ("text, common", {"text": "engineer"}),
+    ("text, selective", {"text": "Company42 staff"}),
+]
+
+
+def corpus(count: int, seed: int):
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    for i in range(count):
+        yield Resume(
+            id=str(ObjectId()),
+            user_id=f"user-{i % 5000}",
+            title=f"Resume {i}",
+            contact=Contact(email="bench@example.com", phone=None, location=None, linkedin=None, github=None),
+            summary=" ".join(rng.choices(WORDS, k=rng.randint(15, 40))),
+            education=[],
+            experience=[
+                Experience(str(ObjectId()), rng.choice(COMPANIES), rng.choice(POSITIONS), now, None,
+                           "Built things", [])
+                for _ in range(rng.randint(1, 5))
+            ],
+            skills=[
+                Skill(str(ObjectId()), name, rng.choice(SKILL_LEVELS))
+                for name in rng.sample(SKILLS, rng.randint(3, 12))
+            ],
+            created_at=now,
+            updated_at=now
+        )
+
+
+def build(resumes) -> ResumeSearchIndex:
+    index = ResumeSearchIndex()
+    for resume in resumes:
+        index.add(resume)
+    return index
+
+
+def scan(resumes, text=None, skill=None, min_skill_level=None):
+    # Baseline: look at every resume, as a client paging through listings would
+    words = set(tokenize(text))
+    min_rank = LEVEL_RANKS.get(min_skill_level, -1)
+    matches = []
+    for resume in resumes:
+        if skill and not any(s.name.lower() == skill.lower() and LEVEL_RANKS.get(s.level, -1) >= min_rank
+                             for s in resume.skills):
+            continue
+        if words:
+            found = set(tokenize(resume.summary))
+            for s in resume.skills:
+                found.update(tokenize(s.name))
+            for experience in resume.experience:
+                found.update(tokenize(experience.position))
+                found.update(tokenize(experience.company))
+            if not words <= found:
+                continue
+        matches.append(resume.id)
+    return matches
+
+
+def timed(call, repeat: int):
+    call()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return result, statistics.median(timings), timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200, help="Repetitions per indexed query")
+    parser.add_argument("--scans", type=int, default=5, help="Repetitions per full scan")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    resumes = list(corpus(args.resumes, args.seed))
+
+    # Memory is traced on a separate build; tracemalloc slows allocation down
+    tracemalloc.start()
+    index = build(resumes)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+
+    start = time.perf_counter()
+    index = build(resumes)
+    build_seconds = time.perf_counter() - start
+
+    # The corpus stays alive only for the scan baseline; keep the collector
+    # from walking it (and the index) in the middle of timed queries
+    gc.freeze()
+
+    print(f"{args.resumes} resumes indexed in {build_seconds:.1f}s, "
+          f"{memory / 1024 / 1024:.1f} MiB, {memory / args.resumes:.0f} B/resume")
+    print(f"{'query':>16} {'matches':>8} {'index p50':>10} {'p99':>9} {'scan p50':>10} {'speedup':>8}")
+    for label, query in QUERIES:
+        (hits, total), p50, p99 = timed(lambda: index.search(limit=20, **query), args.queries)
+        matches, scan_p50, _ = timed(lambda: scan(resumes, **query), args.scans)
+        if total != len(matches):
+            raise RuntimeError(f"{label}: index found {total} matches, scan found {len(matches)}")
+        print(f"{label:>16} {total:>8} {p50:>7.2f} ms {p99:>6.2f} ms {scan_p50:>7.0f} ms {scan_p50 / p50:>7.0f}x")
+
+    # Deep pages rank everything up to the page
+    (_, _), p50, p99 = timed(lambda: index.search(text="engineer", limit=20, offset=5000), args.queries)
+    print(f"{'offset 5000':>16} {'':>8} {p50:>7.2f} ms {p99:>6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""Throughput, latency, allocations and Mongo round trips of every API route.
+
+Builds the app with create_app and drives each route in-process through
+falcon.testing, so the numbers cover routing, middleware, validation,
+repositories and serialization but no network or server. Runs against a
+local mongod (MONGODB_URI, throwaway database) and/or the in-memory backend
+(STORAGE_BACKEND=memory),
+seeded with synthetic users and resumes:
+
+    python -m benchmarks.bench_routes --backends mongod memory --users 20 --resumes 5 \\
+        --children 10 --output before.json
+    python -m benchmarks.bench_routes --backends mongod memory --compare before.json
+
+With --compare, routes slower, hungrier or chattier than the baseline by more
+than the thresholds are listed and the exit status is 1. Round trips are only
+counted against mongod.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, UTC
+
+import falcon.testing
+import jwt
+from pymongo import MongoClient
+
+from benchmarks.bench_resume_loading import RoundTripCounter
+from src.app import create_app
+from src.interfaces.api.resources.resume_resource import NDJSON
+
+SECRET_KEY = "bench-secret"
+DATABASE_NAME = "resume_api_bench_routes"
+IMPORT_USER_ID = "bench-import"
+CHILD_NAMES = ("education", "experience", "skills")
+
+# Settings for every run, on top of the environment and --env; the search
+# index is enabled so /resumes:search is measured too
+APP_ENV = {
+    "SECRET_KEY": SECRET_KEY,
+    "MONGODB_DATABASE": DATABASE_NAME,
+    "RESUME_SEARCH_INDEX": "true",
+}
+
+CHILD_BODIES = {
+    "education": {"institution": "University", "degree": "BSc", "field_of_study": "Computer Science",
+                  "start_date": "2015-09-01T00:00:00", "end_date": "2019-06-30T00:00:00",
+                  "description": "Distributed systems"},
+    "experience": {"company": "Company", "position": "Senior Engineer", "start_date": "2019-07-01T00:00:00",
+                   "end_date": None, "description": "Built and scaled the payments platform",
+                   "achievements": ["Cut p99 latency in half", "Led the storage migration"]},
+    "skills": {"name": "Python", "level": "Expert"},
+}
+CHILD_PATCHES = {
+    "education": {"description": "Databases and distributed systems"},
+    "experience": {"position": "Staff Engineer"},
+    "skills": {"level": "Advanced"},
+}
+
+
+def synthetic_resume(index: int, children: int) -> dict:
+    return {
+        "title": f"Backend engineer {index}",
+        "contact": {"email": f"candidate{index}@example.com", "phone": "555-0100", "location": "Remote"},
+        "summary": "Python engineer working on search, payments and observability infrastructure",
+        "education": [dict(CHILD_BODIES["education"], degree=f"Degree {j}") for j in range(children)],
+        "experience": [dict(CHILD_BODIES["experience"], company=f"Company {j}") for j in range(children)],
+        "skills": [{"name": f"Skill {j}", "level": "Advanced"} for j in range(children)],
+    }
+
+
+def owner_headers(user_id: str) -> dict:
+    token = jwt.encode({"sub": user_id, "email": "bench@example.com", "role": "owner",
+                        "exp": datetime.now(UTC) + timedelta(hours=1)}, SECRET_KEY, algorithm="HS256")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def build_app(mongo_client, env: dict):
+    # create_app reads its settings from the environment
+    os.environ.update(APP_ENV, **env)
+    return create_app(mongo_client)
+
+
+class Context:
+    def __init__(self, client: falcon.testing.TestClient, user_ids, headers):
+        self.client = client
+        self.user_ids = user_ids
+        self.headers = headers
+        self.resume_ids = []
+        self.created_resume_ids = []
+
+    def request(self, method: str, path: str, expected: int, **kwargs):
+        result = self.client.simulate_request(method, path, headers=dict(self.headers, **kwargs.pop("headers", {})),
+                                              **kwargs)
+        if result.status_code != expected:
+            raise RuntimeError(f"{method} {path}: {result.status_code}, expected {expected}: {result.text[:200]}")
+        return result
+
+    def resume_id(self, i: int) -> str:
+        return self.resume_ids[i % len(self.resume_ids)]
+
+    def child_ref(self, resume_id: str, name: str, position: int) -> str:
+        # The id of the child at position in the list, looked up before the timed request
+        children = self.request("GET", f"/resumes/{resume_id}/{name}", 200).json
+        return children[position]["id"]
+
+
+def seed(context: Context, resumes: int, children: int) -> None:
+    index = 0
+    for user_id in context.user_ids:
+        lines = []
+        for _ in range(resumes):
+            lines.append(json.dumps(synthetic_resume(index, children)))
+            index += 1
+        report = context.request("POST", "/resumes:bulk", 200, params={"user_id": user_id},
+                                 body="\n".join(lines), headers={"Content-Type": NDJSON}).json
+        if report["failed"]:
+            raise RuntimeError(f"seeding failed: {report['errors'][:3]}")
+        listing = context.request("GET", "/resumes", 200, params={"user_id": user_id, "fields": "title"}).json
+        context.resume_ids.extend(resume["id"] for resume in listing)
+
+
+# Route name -> prepare(context, i) returning (method, path, expected status,
+# simulate_request keyword arguments). Preparation is not timed. Reads come
+# first; every write that adds data is followed by one that removes it, so
+# the reads of later runs see the same data.
+def routes(import_lines: int):
+    def user(context, i):
+        return context.user_ids[i % len(context.user_ids)]
+
+    def page(context, i):
+        return "GET", "/resumes", 200, {"params": {"user_id": user(context, i), "limit": "2"}}
+
+    def not_modified(context, i):
+        resume_id = context.resume_id(i)
+        etag = context.request("GET", f"/resumes/{resume_id}", 200).headers["etag"]
+        return "GET", f"/resumes/{resume_id}", 304, {"headers": {"If-None-Match": etag}}
+
+    def create_resume(context, i):
+        body = synthetic_resume(i, 0)
+        return "POST", "/resumes", 201, {"params": {"user_id": user(context, i)},
+                                         "json": {key: body[key] for key in ("title", "contact", "summary")}}
+
+    def delete_resume(context, i):
+        return "DELETE", f"/resumes/{context.created_resume_ids.pop()}", 204, {}
+
+    def bulk_import(context, i):
+        body = "\n".join(json.dumps(synthetic_resume(i, 2)) for _ in range(import_lines))
+        return "POST", "/resumes:bulk", 200, {"params": {"user_id": IMPORT_USER_ID}, "body": body,
+                                              "headers": {"Content-Type": NDJSON}}
+
+    table = {
+        "POST /auth": lambda c, i: ("POST", "/auth", 200, {"json": {"email": f"bench{i % 100}@example.com"}}),
+        "GET /metrics": lambda c, i: ("GET", "/metrics", 200, {}),
+        "GET /resumes": lambda c, i: ("GET", "/resumes", 200, {"params": {"user_id": user(c, i)}}),
+        "GET /resumes?fields": lambda c, i: ("GET", "/resumes", 200,
+                                             {"params": {"user_id": user(c, i), "fields": "title,skills"}}),
+        "GET /resumes?limit": page,
+        "GET /resumes ndjson": lambda c, i: ("GET", "/resumes", 200, {"params": {"user_id": user(c, i)},
+                                                                      "headers": {"Accept": NDJSON}}),
+        "GET /resumes:export": lambda c, i: ("GET", "/resumes:export", 200, {"params": {"user_id": user(c, i)}}),
+        "GET /resumes:search": lambda c, i: ("GET", "/resumes:search", 200,
+                                             {"params": {"q": "python engineer", "skill": "Skill 1"}}),
+        "GET /resumes/{resume_id}": lambda c, i: ("GET", f"/resumes/{c.resume_id(i)}", 200, {}),
+        "GET /resumes/{resume_id} 304": not_modified,
+        "GET /resumes/{resume_id}/contact": lambda c, i: ("GET", f"/resumes/{c.resume_id(i)}/contact", 200, {}),
+    }
+    for name in CHILD_NAMES:
+        table[f"GET /resumes/{{resume_id}}/{name}"] = (
+            lambda c, i, name=name: ("GET", f"/resumes/{c.resume_id(i)}/{name}", 200, {}))
+        table[f"GET /resumes/{{resume_id}}/{name}/{{id}}"] = (
+            lambda c, i, name=name: ("GET", f"/resumes/{c.resume_id(i)}/{name}/"
+                                            f"{c.child_ref(c.resume_id(i), name, 0)}", 200, {}))
+
+    table["PUT /resumes/{resume_id}"] = lambda c, i: (
+        "PUT", f"/resumes/{c.resume_id(i)}", 200,
+        {"json": {"title": f"Backend engineer {i}", "contact": {"email": "candidate@example.com"},
+                  "summary": "Updated summary"}})
+    table["PATCH /resumes/{resume_id}/contact"] = lambda c, i: (
+        "PATCH", f"/resumes/{c.resume_id(i)}/contact", 200, {"json": {"phone": f"555-{i % 10000:04d}"}})
+    for name in CHILD_NAMES:
+        table[f"POST /resumes/{{resume_id}}/{name}"] = (
+            lambda c, i, name=name: ("POST", f"/resumes/{c.resume_id(i)}/{name}", 201, {"json": CHILD_BODIES[name]}))
+        table[f"PATCH /resumes/{{resume_id}}/{name}/{{id}}"] = (
+            lambda c, i, name=name: ("PATCH", f"/resumes/{c.resume_id(i)}/{name}/"
+                                              f"{c.child_ref(c.resume_id(i), name, 0)}", 200,
+                                     {"json": CHILD_PATCHES[name]}))
+        # Removes what the POST above added, last first
+        table[f"DELETE /resumes/{{resume_id}}/{name}/{{id}}"] = (
+            lambda c, i, name=name: ("DELETE", f"/resumes/{c.resume_id(i)}/{name}/"
+                                               f"{c.child_ref(c.resume_id(i), name, -1)}", 204, {}))
+    table["POST /resumes"] = create_resume
+    table["DELETE /resumes/{resume_id}"] = delete_resume
+    table["POST /resumes:bulk"] = bulk_import
+    return table
+
+
+# Writes that add data -> the route that takes it out again, which runs after
+# it. With --routes, either one runs only if the other is selected too, so a
+# run never leaves data behind for, or takes seeded data away from, the reads
+# of another. POST /resumes:bulk runs last and writes under its own user.
+CLEANUP_ROUTES = {"POST /resumes": "DELETE /resumes/{resume_id}"}
+CLEANUP_ROUTES.update({f"POST /resumes/{{resume_id}}/{name}": f"DELETE /resumes/{{resume_id}}/{name}/{{id}}"
+                       for name in CHILD_NAMES})
+
+
+def unpaired_routes(names) -> dict:
+    # Selected route -> its partner, for writes selected without their partner
+    partners = dict(CLEANUP_ROUTES, **{remover: adder for adder, remover in CLEANUP_ROUTES.items()})
+    return {name: partners[name] for name in names if name in partners and partners[name] not in names}
+
+
+def measure(context: Context, prepare, requests: int, warmup: int, counter) -> dict:
+    def run(i):
+        method, path, expected, kwargs = prepare(context, i)
+        start = time.perf_counter()
+        result = context.request(method, path, expected, **kwargs)
+        elapsed = time.perf_counter() - start
+        if method == "POST" and path == "/resumes":
+            context.created_resume_ids.append(result.json["id"])
+        return elapsed
+
+    for i in range(warmup):
+        run(i)
+
+    timings = []
+    round_trips = 0
+    for i in range(warmup, warmup + requests):
+        before = counter.count if counter else 0
+        timings.append(run(i))
+        round_trips += (counter.count - before) if counter else 0
+
+    # Allocations on a separate pass; tracing slows allocation down. Peak bytes
+    # allocated while handling one request, above what was live before it.
+    samples = min(requests, 50)
+    allocations = []
+    tracemalloc.start()
+    try:
+        for i in range(warmup + requests, warmup + requests + samples):
+            method, path, expected, kwargs = prepare(context, i)
+            tracemalloc.reset_peak()
+            live, _ = tracemalloc.get_traced_memory()
+            result = context.request(method, path, expected, **kwargs)
+            allocations.append(tracemalloc.get_traced_memory()[1] - live)
+            if method == "POST" and path == "/resumes":
+                context.created_resume_ids.append(result.json["id"])
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "requests": requests,
+        "rps": requests / sum(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+        "alloc_kib": statistics.median(allocations) / 1024,
+        "round_trips": round_trips / requests if counter else None,
+    }
+
+
+def run_backend(backend: str, args, env: dict) -> dict:
+    counter = None
+    mongo_client = None
+    if backend == "mongod":
+        counter = RoundTripCounter()
+        mongo_client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"), event_listeners=[counter])
+        mongo_client.drop_database(DATABASE_NAME)
+
+    try:
+        app = build_app(mongo_client, dict(env, STORAGE_BACKEND="memory" if backend == "memory" else "mongodb"))
+        user_ids = [f"bench-user-{i}" for i in range(args.users)]
+        context = Context(falcon.testing.TestClient(app), user_ids, owner_headers(user_ids[0]))
+        seed(context, args.resumes, args.children)
+
+        results = {}
+        table = routes(args.import_lines)
+        unpaired = unpaired_routes(args.routes) if args.routes else {}
+        for name, partner in unpaired.items():
+            print(f"{backend:>9} {name:<45} skipped, runs only together with {partner}", flush=True)
+        for name, prepare in table.items():
+            if args.routes and name not in args.routes or name in unpaired:
+                continue
+            results[name] = measure(context, prepare, args.requests, args.warmup, counter)
+            print(format_result(backend, name, results[name]), flush=True)
+        return results
+    finally:
+        if backend == "mongod":
+            mongo_client.drop_database(DATABASE_NAME)
+            mongo_client.close()
+
+
+def format_result(backend: str, name: str, result: dict) -> str:
+    round_trips = "-" if result["round_trips"] is None else f"{result['round_trips']:.1f}"
+    return (f"{backend:>9} {name:<45} {result['rps']:9.0f} req/s  p50 {result['p50_ms']:7.2f} ms  "
+            f"p99 {result['p99_ms']:7.2f} ms  {result['alloc_kib']:8.1f} KiB  {round_trips:>5} round trips")
+
+
+def compare(results: dict, baseline: dict, args) -> list:
+    # Relative thresholds for timings and allocations; round trips are exact
+    limits = (("rps", -args.threshold), ("p50_ms", args.threshold), ("p99_ms", args.p99_threshold),
+              ("alloc_kib", args.alloc_threshold))
+    regressions = []
+    for backend, routes_results in results["backends"].items():
+        for name, result in routes_results.items():
+            base = baseline.get("backends", {}).get(backend, {}).get(name)
+            if not base:
+                continue
+            for metric, limit in limits:
+                if not base[metric]:
+                    continue
+                change = result[metric] / base[metric] - 1
+                if (limit < 0 and change < limit) or (limit > 0 and change > limit):
+                    regressions.append(f"{backend} {name}: {metric} {base[metric]:.2f} -> {result[metric]:.2f} "
+                                       f"({change:+.0%})")
+            if base["round_trips"] is not None and result["round_trips"] is not None \
+                    and result["round_trips"] > base["round_trips"]:
+                regressions.append(f"{backend} {name}: round trips {base['round_trips']:.1f} -> "
+                                   f"{result['round_trips']:.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", choices=("mongod", "memory"), default=["memory"])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--resumes", type=int, default=5, help="resumes per user")
+    parser.add_argument("--children", type=int, default=10, help="entries per child list")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per route")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--import-lines", type=int, default=10, help="resumes per POST /resumes:bulk")
+    parser.add_argument("--routes", nargs="*", help="only these route names")
+    parser.add_argument("--env", nargs="*", default=[], metavar="NAME=VALUE", help="extra app settings")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file from an earlier --output")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p50 and throughput change")
+    parser.add_argument("--p99-threshold", type=float, default=0.5)
+    parser.add_argument("--alloc-threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    env = dict(setting.split("=", 1) for setting in args.env)
+    results = {
+        "settings": {"users": args.users, "resumes": args.resumes, "children": args.children,
+                     "requests": args.requests, "import_lines": args.import_lines, "env": env,
+                     "python": platform.python_version(), "created_at": datetime.now(UTC).isoformat()},
+        "backends": {backend: run_backend(backend, args, env) for backend in args.backends},
+    }
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("settings", {}).get("children") != args.children:
+            print("warning: baseline was seeded differently", baseline.get("settings"))
+        regressions = compare(results, baseline, args)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Throughput and tail latency of the WSGI and ASGI apps at equal worker counts.
+
+Starts each app as a real server against a local mongod (MONGODB_URI) and a
+throwaway database, seeds one user's resumes over HTTP, then drives
+GET /resumes/{id} and GET /resumes?user_id= from --connections keep-alive
+clients for --duration seconds:
+
+    python -m benchmarks.bench_wsgi_vs_asgi --workers 4 --connections 64 --duration 15
+
+WSGI runs under gunicorn sync workers, ASGI under uvicorn workers.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, UTC
+
+import jwt
+from pymongo import MongoClient
+
+SECRET_KEY = "bench-secret"
+DATABASE_NAME = "resume_api_bench_servers"
+USER_ID = "bench-user"
+
+
+def server_command(kind: str, port: int, workers: int):
+    if kind == "wsgi":
+        return [sys.executable, "-m", "gunicorn", "--workers", str(workers), "--bind", f"127.0.0.1:{port}",
+                "--log-level", "warning", "src.app:app"]
+    return [sys.executable, "-m", "uvicorn", "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--no-access-log", "src.asgi:app"]
+
+
+def start_server(kind: str, port: int, workers: int):
+    return start_command(server_command(kind, port, workers), port)
+
+
+def start_command(command, port: int, env=None):
+    # Starts a server and waits until it answers on port
+    env = dict(os.environ, SECRET_KEY=SECRET_KEY, MONGODB_DATABASE=DATABASE_NAME, **(env or {}))
+    process = subprocess.Popen(command, env=env, start_new_session=True)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("POST", "/auth", body=json.dumps({"email": "probe@example.com"}),
+                               headers={"Content-Type": "application/json"})
+            connection.getresponse().read()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(f"{' '.join(command)} did not start on port {port}")
+
+
+def stop_server(process):
+    os.killpg(process.pid, signal.SIGTERM)
+    process.wait(timeout=30)
+
+
+def owner_headers():
+    token = jwt.encode({"sub": USER_ID, "email": "bench@example.com", "role": "owner",
+                        "exp": datetime.now(UTC) + timedelta(hours=1)}, SECRET_KEY, algorithm="HS256")
+    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+
+def seed(port: int, resumes: int, children: int):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    headers = owner_headers()
+
+    def post(path, body):
+        connection.request("POST", path, body=json.dumps(body), headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        if response.status != 201:
+            raise RuntimeError(f"POST {path}: {response.status} {payload[:200]}")
+        return json.loads(payload)
+
+    resume_ids = []
+    for i in range(resumes):
+        resume = post(f"/resumes?user_id={USER_ID}", {
+            "title": f"Resume {i}", "contact": {"email": "bench@example.com"}, "summary": "Benchmark resume"
+        })
+        for j in range(children):
+            post(f"/resumes/{resume['id']}/skills", {"name": f"Skill {j}", "level": "Advanced"})
+            post(f"/resumes/{resume['id']}/experience", {
+                "company": "Company", "position": "Engineer", "start_date": "2020-01-01T00:00:00",
+                "description": "Built things", "achievements": ["Shipped it"]
+            })
+        resume_ids.append(resume["id"])
+    return resume_ids
+
+
+def drive(port: int, paths, connections: int, duration: float):
+    headers = owner_headers()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local_latencies = []
+        local_errors = 0
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                connection.request("GET", random.choice(paths), headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            local_latencies.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local_latencies)
+            errors.append(local_errors)
+
+    threads = [threading.Thread(target=client) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--children", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"))
+    client.drop_database(DATABASE_NAME)
+    try:
+        results = {}
+        for kind in ("wsgi", "asgi"):
+            process = start_server(kind, args.port, args.workers)
+            try:
+                # Both apps read the same data; it is seeded once
+                if not results:
+                    resume_ids = seed(args.port, args.resumes, args.children)
+                    paths = [f"/resumes/{resume_id}" for resume_id in resume_ids] + [f"/resumes?user_id={USER_ID}"]
+                # Warm up connections, pools and caches before measuring
+                drive(args.port, paths, args.connections, min(2.0, args.duration))
+                results[kind] = drive(args.port, paths, args.connections, args.duration)
+            finally:
+                stop_server(process)
+
+        print(f"{args.workers} workers, {args.connections} connections, {args.duration:.0f}s per app")
+        for kind, result in results.items():
+            print(f"{kind}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.2f} ms  "
+                  f"p99 {result['p99_ms']:7.2f} ms  ({result['requests']} requests, {result['errors']} errors)")
+    finally:
+        client.drop_database(DATABASE_NAME)
+
+
+if __name__ == "__main__":
+    main()
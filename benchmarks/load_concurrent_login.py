@@ -0,0 +1,84 @@
+"""Concurrent first logins for the same email must create exactly one user.
+
+Fires --concurrency simultaneous AuthService.authenticate_user calls per
+round against a local mongod (MONGODB_URI) in a throwaway database, then
+checks the users collection and reports round trips per login:
+
+    python -m benchmarks.load_concurrent_login --concurrency 32 --rounds 20
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+from pymongo import MongoClient
+
+from benchmarks.bench_resume_loading import RoundTripCounter
+from src.application.services.auth_service import AuthService
+from src.infrastructure.repositories.mongodb_user_repository import MongoDBUserRepository
+
+
+def fire(auth_service: AuthService, email: str, concurrency: int):
+    barrier = threading.Barrier(concurrency)
+    errors = []
+
+    def login():
+        barrier.wait()
+        try:
+            auth_service.authenticate_user(email)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=login) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"), event_listeners=[counter])
+    database_name = "resume_api_load_login"
+    client.drop_database(database_name)
+
+    repository = MongoDBUserRepository(client, database_name)
+    repository.ensure_indexes()
+    auth_service = AuthService(repository, "load-test-secret")
+
+    failures = 0
+    try:
+        counter.count = 0
+        start = time.perf_counter()
+        for round_number in range(args.rounds):
+            email = f"user-{round_number}@example.com"
+            errors = fire(auth_service, email, args.concurrency)
+            users = repository.collection.count_documents({"email": email})
+            if errors or users != 1:
+                failures += 1
+                print(f"round {round_number}: {users} users, {len(errors)} errors {errors[:1]}")
+        elapsed = time.perf_counter() - start
+
+        # Returning users: every login is a plain lookup
+        counter.count = 0
+        auth_service.authenticate_user("user-0@example.com")
+        returning_round_trips = counter.count
+
+        logins = args.rounds * args.concurrency
+        print(f"{logins} concurrent logins in {elapsed:.2f}s, {failures} failed rounds")
+        print(f"round trips per returning login: {returning_round_trips}")
+    finally:
+        client.drop_database(database_name)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
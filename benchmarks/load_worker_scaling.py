@@ -0,0 +1,67 @@
+"""Throughput and tail latency as gunicorn workers and the Mongo pool grow.
+
+Starts the WSGI app under gunicorn with gunicorn.conf.py (preloaded, gthread
+workers) for every combination of --workers and --pool-sizes, against a local
+mongod (MONGODB_URI) and a throwaway database, and drives GET /resumes/{id}
+and GET /resumes?user_id= from --connections keep-alive clients:
+
+    python -m benchmarks.load_worker_scaling --workers 1 2 4 8 --pool-sizes 4 16 64
+
+Pool size is per worker process: the server holds up to workers x pool size
+connections in total.
+"""
+import argparse
+import os
+import sys
+
+from pymongo import MongoClient
+
+from benchmarks.bench_wsgi_vs_asgi import DATABASE_NAME, USER_ID, drive, seed, start_command, stop_server
+
+
+def gunicorn_command(port: int):
+    return [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}",
+            "--log-level", "warning", "src.app:app"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--threads", type=int, default=8, help="gthread threads per worker")
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--children", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    client = MongoClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"))
+    client.drop_database(DATABASE_NAME)
+    paths = None
+    try:
+        print(f"{args.threads} threads per worker, {args.connections} connections, {args.duration:.0f}s per run")
+        print(f"{'workers':>8} {'pool':>5} {'req/s':>9} {'p50':>9} {'p99':>9} {'errors':>7} {'server conns':>13}")
+        for workers in args.workers:
+            for pool_size in args.pool_sizes:
+                env = {"GUNICORN_WORKERS": str(workers), "GUNICORN_THREADS": str(args.threads),
+                       "MONGODB_MAX_POOL_SIZE": str(pool_size)}
+                process = start_command(gunicorn_command(args.port), args.port, env)
+                try:
+                    if paths is None:
+                        resume_ids = seed(args.port, args.resumes, args.children)
+                        paths = [f"/resumes/{resume_id}" for resume_id in resume_ids] + [f"/resumes?user_id={USER_ID}"]
+                    drive(args.port, paths, args.connections, min(2.0, args.duration))
+                    result = drive(args.port, paths, args.connections, args.duration)
+                    # Connections held open by everyone, this client included, at the end of the run
+                    connections = client.admin.command("serverStatus")["connections"]["current"]
+                finally:
+                    stop_server(process)
+                print(f"{workers:>8} {pool_size:>5} {result['rps']:>9.1f} {result['p50_ms']:>6.2f} ms "
+                      f"{result['p99_ms']:>6.2f} ms {result['errors']:>7} {connections:>13}")
+    finally:
+        client.drop_database(DATABASE_NAME)
+
+
+if __name__ == "__main__":
+    main()
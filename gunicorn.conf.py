@@ -0,0 +1,42 @@
+# gunicorn settings for src.app:app, read from ./gunicorn.conf.py by default:
+#
+#     gunicorn src.app:app
+#
+# Each value can be overridden from the environment (GUNICORN_*), and the
+# Mongo pool from MONGODB_* (see src/infrastructure/mongodb_client.py).
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Requests spend most of their time waiting on Mongo, so each worker serves
+# several at once from threads; workers then only need to cover the CPUs
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() + 1)))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Builds the app (index checks, search index) once in the master and shares
+# it copy-on-write. Safe: every worker opens its own Mongo client on first use.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true") == "true"
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Recycle workers now and then, staggered so they do not all restart at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "20000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "2000"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+# A worker holds at most one connection per thread, plus the child fetch
+# pool's when enabled; a larger pool only adds idle sockets
+os.environ.setdefault("MONGODB_MAX_POOL_SIZE", str(threads * 2))
+
+
+def when_ready(server):
+    # With preload_app the master used Mongo while building the app; it serves
+    # no requests, so its connections are closed before workers are forked
+    from src.infrastructure.mongodb_client import close_mongo_clients
+    close_mongo_clients()
@@ -1,43 +1,155 @@
 import os
 from dotenv import load_dotenv
-from pymongo import MongoClient
 from falcon import App
-from interfaces.api.resources.resume_resource import ResumeResource
-from interfaces.api.resources.contact_resource import ContactResource
-from interfaces.api.resources.education_resource import EducationResource
-from interfaces.api.resources.experience_resource import ExperienceResource
-from interfaces.api.resources.skill_resource import SkillResource
-from interfaces.api.resources.auth_resource import AuthResource
-from interfaces.api.middleware.auth_middleware import AuthMiddleware
-from infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
-from infrastructure.repositories.mongodb_user_repository import MongoDBUserRepository
-from application.services.resume_service import ResumeService
-from application.services.auth_service import AuthService
+from .interfaces.api.resources.resume_resource import ResumeResource
+from .interfaces.api.resources.resume_import_resource import ResumeImportResource
+from .interfaces.api.resources.resume_export_resource import ResumeExportResource
+from .interfaces.api.resources.resume_search_resource import ResumeSearchResource
+from .interfaces.api.resources.contact_resource import ContactResource
+from .interfaces.api.resources.education_resource import EducationResource
+from .interfaces.api.resources.experience_resource import ExperienceResource
+from .interfaces.api.resources.skill_resource import SkillResource
+from .interfaces.api.resources.auth_resource import AuthResource
+from .interfaces.api.resources.metrics_resource import MetricsResource
+from .interfaces.api.media import register_json_handler
+from .interfaces.api.middleware.auth_middleware import AuthMiddleware
+from .interfaces.api.middleware.compression_middleware import CompressionMiddleware
+from .interfaces.api.middleware.metrics_middleware import METRICS_PATH, MetricsMiddleware
+from .infrastructure.metrics import MetricsRegistry, MongoCommandMetrics
+from .infrastructure.mongodb_client import LazyMongoClient, mongo_client_settings, DRIVER_MAX_POOL_SIZE
+from .infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+from .infrastructure.repositories.mongodb_embedded_resume_repository import MongoDBEmbeddedResumeRepository
+from .infrastructure.repositories.mongodb_user_repository import MongoDBUserRepository
+from .infrastructure.repositories.caching_resume_repository import CachingResumeRepository
+from .infrastructure.repositories.search_indexed_resume_repository import SearchIndexedResumeRepository
+from .infrastructure.repositories.child_fetch_pool import ChildFetchPool
+from .infrastructure.repositories.memory_resume_repository import InMemoryResumeRepository
+from .infrastructure.repositories.memory_user_repository import InMemoryUserRepository
+from .infrastructure.repositories.memory_snapshots import MemorySnapshots
+from .application.services.resume_service import ResumeService
+from .application.services.auth_service import AuthService
 
 # Load environment variables
 load_dotenv()
 
-def create_app():
-    # Initialize MongoDB connection
-    mongo_client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+def create_app(mongo_client=None):
+    metrics = MetricsRegistry() if os.getenv('METRICS_ENABLED', 'true') == 'true' else None
+    if mongo_client is None:
+        # Opened on first use in each process, so a client is never shared across
+        # forked workers; pool and timeout settings come from MONGODB_* variables
+        event_listeners = [MongoCommandMetrics(metrics)] if metrics else []
+        mongo_client = LazyMongoClient.from_env(
+            os.getenv('MONGODB_URI', 'mongodb://localhost:27017'), event_listeners=event_listeners
+        )
     database_name = os.getenv('MONGODB_DATABASE', 'resume_api')
     secret_key = os.getenv('SECRET_KEY', 'your-secret-key-here')
     
     # Initialize repositories
-    resume_repository = MongoDBResumeRepository(mongo_client, database_name)
-    user_repository = MongoDBUserRepository(mongo_client, database_name)
+    child_fetch_pool = None
+    storage_backend = os.getenv('STORAGE_BACKEND', 'mongodb')
+    if storage_backend not in ('mongodb', 'memory'):
+        raise ValueError(f"Unknown storage backend: {storage_backend}")
+    if storage_backend == 'memory':
+        # Process-local data: for tests, benchmarks and throwaway environments
+        # served by a single process
+        resume_repository = InMemoryResumeRepository()
+        user_repository = InMemoryUserRepository()
+        snapshot_dir = os.getenv('MEMORY_SNAPSHOT_DIR')
+        if snapshot_dir:
+            snapshots = MemorySnapshots({
+                os.path.join(snapshot_dir, 'resumes.pickle'): resume_repository,
+                os.path.join(snapshot_dir, 'users.pickle'): user_repository
+            }, interval_seconds=float(os.getenv('MEMORY_SNAPSHOT_SECONDS', '0')))
+            snapshots.restore()
+            snapshots.start()
+    elif os.getenv('RESUME_STORAGE_LAYOUT', 'split') == 'embedded':
+        # Dual read keeps unmigrated resumes readable while the migration runs
+        resume_repository = MongoDBEmbeddedResumeRepository(
+            mongo_client, database_name, dual_read=os.getenv('RESUME_DUAL_READ', 'true') == 'true'
+        )
+    else:
+        # One pool per process, sized from the client's connection pool unless overridden.
+        # The size comes from the settings: asking the client would open it here,
+        # before gunicorn forks the workers that are meant to open their own
+        if os.getenv('RESUME_PARALLEL_CHILD_FETCH', 'false') == 'true':
+            child_fetch_workers = int(os.getenv('RESUME_CHILD_FETCH_WORKERS', '0'))
+            # maxPoolSize=0 lifts the driver's limit; share its default then
+            max_pool_size = mongo_client_settings().get('maxPoolSize') or DRIVER_MAX_POOL_SIZE
+            child_fetch_pool = (ChildFetchPool(child_fetch_workers) if child_fetch_workers > 0
+                                else ChildFetchPool.for_pool_size(max_pool_size))
+        resume_repository = MongoDBResumeRepository(
+            mongo_client, database_name,
+            load_mode=os.getenv('RESUME_LOAD_MODE', 'batched'),
+            use_transactions=os.getenv('MONGODB_TRANSACTIONS', 'false') == 'true',
+            child_fetch_pool=child_fetch_pool
+        )
+    if storage_backend != 'memory':
+        user_repository = MongoDBUserRepository(mongo_client, database_name)
+        if os.getenv('MONGODB_ENSURE_INDEXES', 'true') == 'true':
+            resume_repository.ensure_indexes()
+            user_repository.ensure_indexes()
+
+    # Per-process search index, built from the whole store at startup and
+    # kept in step with writes; other workers' writes show up within the refresh interval
+    resume_search = None
+    if os.getenv('RESUME_SEARCH_INDEX', 'false') == 'true':
+        resume_repository = resume_search = SearchIndexedResumeRepository(
+            resume_repository,
+            refresh_seconds=float(os.getenv('RESUME_SEARCH_REFRESH_SECONDS', '5')),
+            rebuild_seconds=float(os.getenv('RESUME_SEARCH_REBUILD_SECONDS', '3600'))
+        )
+        resume_search.rebuild()
+        if metrics:
+            metrics.add_collector(lambda: [
+                ('resume_search_index_resumes', 'gauge', 'Resumes in the search index', len(resume_search.index))
+            ])
+
+    # Per-process cache; the TTL bounds staleness from writes in other workers
+    cache_max_entries = int(os.getenv('RESUME_CACHE_MAX_ENTRIES', '0'))
+    if cache_max_entries > 0:
+        resume_repository = CachingResumeRepository(
+            resume_repository,
+            max_entries=cache_max_entries,
+            max_bytes=int(os.getenv('RESUME_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv('RESUME_CACHE_TTL_SECONDS', '60'))
+        )
+        if metrics:
+            metrics.add_stats('resume_cache', resume_repository.stats,
+                              counters=('hits', 'misses', 'evictions', 'expirations', 'invalidations'))
+    if metrics and child_fetch_pool:
+        metrics.add_stats('child_fetch_pool', child_fetch_pool.stats, counters=('submitted', 'inline'))
     
     # Initialize services
-    resume_service = ResumeService(resume_repository)
+    resume_service = ResumeService(resume_repository, resume_search)
     auth_service = AuthService(user_repository, secret_key)
     
     # Create Falcon app with middleware
-    app = App(middleware=[AuthMiddleware(secret_key)])
+    middleware = [
+        AuthMiddleware(secret_key, token_cache_size=int(os.getenv('AUTH_TOKEN_CACHE_SIZE', '10000')))
+    ]
+    if os.getenv('RESPONSE_COMPRESSION', 'true') == 'true':
+        # First, so its process_response runs last, on the finished response
+        middleware.insert(0, CompressionMiddleware(
+            min_size=int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024')),
+            level=int(os.getenv('RESPONSE_COMPRESSION_LEVEL', '1'))
+        ))
+    if metrics:
+        # Outermost, so latency covers the rest of the stack
+        middleware.insert(0, MetricsMiddleware(metrics))
+    app = App(middleware=middleware)
     
+    register_json_handler(app)
+
     # Add routes
     app.add_route('/auth', AuthResource(auth_service))
+    if metrics:
+        app.add_route(METRICS_PATH, MetricsResource(metrics))
     
     app.add_route('/resumes', ResumeResource(resume_service))
+    app.add_route('/resumes:bulk', ResumeImportResource(resume_service))
+    app.add_route('/resumes:export', ResumeExportResource(resume_service))
+    if resume_search is not None:
+        app.add_route('/resumes:search', ResumeSearchResource(resume_service))
     app.add_route('/resumes/{resume_id}', ResumeResource(resume_service))
     
     # Contact routes
@@ -57,4 +169,10 @@ def create_app():
     
     return app
 
-app = create_app() 
\ No newline at end of file
+def __getattr__(name):
+    # src.app:app is built on first access rather than on import, so
+    # create_app can be imported without touching a database
+    if name == 'app':
+        app = globals()['app'] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
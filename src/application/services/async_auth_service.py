@@ -0,0 +1,18 @@
+from ...domain.models.user import User, UserRole
+from ...domain.repositories.async_user_repository import AsyncUserRepository
+from .auth_service import AuthService
+
+class AsyncAuthService(AuthService):
+    def __init__(self, user_repository: AsyncUserRepository, secret_key: str):
+        self.user_repository = user_repository
+        self.secret_key = secret_key
+
+    async def create_user(self, email: str, role: UserRole = UserRole.GUEST) -> User:
+        if await self.user_repository.find_by_email(email):
+            raise ValueError("Email already registered")
+
+        return await self.user_repository.save(self._new_user(email, role))
+
+    async def authenticate_user(self, email: str) -> str:
+        user = await self.user_repository.find_or_create(self._new_user(email))
+        return self._create_access_token(user)
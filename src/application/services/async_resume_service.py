@@ -0,0 +1,84 @@
+from typing import AsyncIterator, Collection, List, Optional, Tuple
+from datetime import datetime, UTC
+from ...domain.models.resume import Resume, Contact
+from ...domain.repositories.async_resume_repository import AsyncResumeRepository
+from .resume_service import ResumeService, CHILD_MODELS
+
+# ResumeService over an AsyncResumeRepository; building and updating the
+# aggregate is shared, only the repository calls are awaited
+class AsyncResumeService(ResumeService):
+    def __init__(self, resume_repository: AsyncResumeRepository):
+        self.resume_repository = resume_repository
+
+    async def create_resume(self, user_id: str, title: str, contact: dict, summary: str) -> Resume:
+        return await self.resume_repository.save(self._new_resume(user_id, title, contact, summary))
+
+    async def import_resumes(self, user_id: str, records: List[dict]) -> List[Resume]:
+        return await self.resume_repository.save_many([self._imported_resume(user_id, record) for record in records])
+
+    async def get_resume(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        return await self.resume_repository.find_by_id(resume_id, fields)
+
+    async def get_resume_version(self, resume_id: str) -> Optional[datetime]:
+        return await self.resume_repository.find_version(resume_id)
+
+    async def get_resume_children(self, resume_id: str, name: str) -> Optional[list]:
+        return await self.resume_repository.find_children(resume_id, name)
+
+    async def get_resume_child(self, resume_id: str, name: str, child_id: str):
+        return await self.resume_repository.find_child(resume_id, name, child_id)
+
+    async def get_user_resumes(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return await self.resume_repository.find_by_user_id(user_id, fields)
+
+    def iter_user_resumes(self, user_id: str, fields: Optional[Collection[str]] = None) -> AsyncIterator[Resume]:
+        return self.resume_repository.iter_by_user_id(user_id, fields)
+
+    async def get_user_resumes_page(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                              fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return await self.resume_repository.find_page_by_user_id(user_id, limit, after, fields)
+
+    def export_resumes(self, user_id: Optional[str] = None,
+                       updated_since: Optional[datetime] = None) -> AsyncIterator[Resume]:
+        return self.resume_repository.iter_all(user_id, updated_since)
+
+    async def update_resume(self, resume_id: str, updates: dict) -> Optional[Resume]:
+        resume = await self.resume_repository.find_by_id(resume_id)
+        if not resume:
+            return None
+        return await self.resume_repository.save(self._apply_updates(resume, updates))
+
+    async def add_resume_child(self, resume_id: str, name: str, data: dict) -> Optional[Tuple[object, datetime]]:
+        updated_at = datetime.now(UTC)
+        child = self._to_model(CHILD_MODELS[name], data)
+        return self._versioned(await self.resume_repository.add_child(resume_id, name, child, updated_at), updated_at)
+
+    async def update_resume_child(self, resume_id: str, name: str, child_id: str,
+                                  changes: dict) -> Optional[Tuple[object, datetime]]:
+        if not changes:
+            return self._versioned(await self.resume_repository.find_child(resume_id, name, child_id),
+                                   await self.resume_repository.find_version(resume_id))
+        updated_at = datetime.now(UTC)
+        return self._versioned(
+            await self.resume_repository.update_child(resume_id, name, child_id, changes, updated_at), updated_at
+        )
+
+    async def remove_resume_child(self, resume_id: str, name: str, child_id: str) -> bool:
+        return await self.resume_repository.remove_child(resume_id, name, child_id, datetime.now(UTC))
+
+    async def update_resume_contact(self, resume_id: str, changes: dict) -> Optional[Tuple[Contact, datetime]]:
+        if not changes:
+            resume = await self.resume_repository.find_by_id(resume_id, fields=["contact", "updated_at"])
+            return self._versioned(resume.contact, resume.updated_at) if resume else None
+        updated_at = datetime.now(UTC)
+        return self._versioned(await self.resume_repository.update_contact(resume_id, changes, updated_at),
+                               updated_at)
+
+    async def replace_resume_contact(self, resume_id: str, data: dict) -> Optional[Tuple[Contact, datetime]]:
+        updated_at = datetime.now(UTC)
+        contact = self._to_model(Contact, data)
+        return self._versioned(await self.resume_repository.replace_contact(resume_id, contact, updated_at),
+                               updated_at)
+
+    async def delete_resume(self, resume_id: str) -> bool:
+        return await self.resume_repository.delete(resume_id)
@@ -12,8 +12,16 @@ class AuthService:
         if self.user_repository.find_by_email(email):
             raise ValueError("Email already registered")
 
+        return self.user_repository.save(self._new_user(email, role))
+
+    def authenticate_user(self, email: str) -> str:
+        # Create user if not exists, in the same round trip as the lookup
+        user = self.user_repository.find_or_create(self._new_user(email))
+        return self._create_access_token(user)
+
+    def _new_user(self, email: str, role: UserRole = UserRole.GUEST) -> User:
         now = datetime.now(UTC)
-        user = User(
+        return User(
             id=None,
             email=email,
             created_at=now,
@@ -21,15 +29,6 @@ class AuthService:
             password_hash="",
             role=role
         )
-        return self.user_repository.save(user)
-
-    def authenticate_user(self, email: str) -> str:
-        user = self.user_repository.find_by_email(email)
-        if not user:
-            # Create user if not exists
-            user = self.create_user(email)
-
-        return self._create_access_token(user)
 
     def _create_access_token(self, user: User) -> str:
         expires_delta = timedelta(days=1)
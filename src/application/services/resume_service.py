@@ -1,19 +1,106 @@
-from typing import List, Optional
+from dataclasses import fields
+from typing import Collection, Iterator, List, Optional, Tuple
 from datetime import datetime, UTC
-from ...domain.models.resume import Resume
+from ...domain.models.resume import Resume, Education, Experience, Skill, Contact
+from ...domain.models.resume_search import ResumeSearchHit
 from ...domain.repositories.resume_repository import ResumeRepository
+from ...domain.repositories.resume_search import ResumeSearch
+
+CHILD_MODELS = {"education": Education, "experience": Experience, "skills": Skill}
 
 class ResumeService:
-    def __init__(self, resume_repository: ResumeRepository):
+    def __init__(self, resume_repository: ResumeRepository, resume_search: Optional[ResumeSearch] = None):
         self.resume_repository = resume_repository
+        self.resume_search = resume_search
 
     def create_resume(self, user_id: str, title: str, contact: dict, summary: str) -> Resume:
+        return self.resume_repository.save(self._new_resume(user_id, title, contact, summary))
+
+    def import_resumes(self, user_id: str, records: List[dict]) -> List[Resume]:
+        return self.resume_repository.save_many([self._imported_resume(user_id, record) for record in records])
+
+    def get_resume(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        return self.resume_repository.find_by_id(resume_id, fields)
+
+    def get_resume_version(self, resume_id: str) -> Optional[datetime]:
+        return self.resume_repository.find_version(resume_id)
+
+    def get_resume_children(self, resume_id: str, name: str) -> Optional[list]:
+        return self.resume_repository.find_children(resume_id, name)
+
+    def get_resume_child(self, resume_id: str, name: str, child_id: str):
+        return self.resume_repository.find_child(resume_id, name, child_id)
+
+    def get_user_resumes(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.resume_repository.find_by_user_id(user_id, fields)
+
+    def iter_user_resumes(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        return self.resume_repository.iter_by_user_id(user_id, fields)
+
+    def get_user_resumes_page(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                              fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.resume_repository.find_page_by_user_id(user_id, limit, after, fields)
+
+    def export_resumes(self, user_id: Optional[str] = None,
+                       updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        return self.resume_repository.iter_all(user_id, updated_since)
+
+    def search_resumes(self, text: Optional[str] = None, skill: Optional[str] = None,
+                       min_skill_level: Optional[str] = None, limit: int = 20,
+                       offset: int = 0) -> Tuple[List[ResumeSearchHit], int]:
+        return self.resume_search.search(text, skill, min_skill_level, limit, offset)
+
+    def update_resume(self, resume_id: str, updates: dict) -> Optional[Resume]:
+        resume = self.resume_repository.find_by_id(resume_id)
+        if not resume:
+            return None
+        return self.resume_repository.save(self._apply_updates(resume, updates))
+
+    # Writes to one part of a resume: a single targeted write each, nothing
+    # read first. They return what was written with the resume's new version,
+    # or None when the resume (or entry) does not exist.
+
+    def add_resume_child(self, resume_id: str, name: str, data: dict) -> Optional[Tuple[object, datetime]]:
+        updated_at = datetime.now(UTC)
+        child = self._to_model(CHILD_MODELS[name], data)
+        return self._versioned(self.resume_repository.add_child(resume_id, name, child, updated_at), updated_at)
+
+    def update_resume_child(self, resume_id: str, name: str, child_id: str,
+                            changes: dict) -> Optional[Tuple[object, datetime]]:
+        if not changes:
+            # Nothing to write: the entry and the version stay as they are
+            return self._versioned(self.resume_repository.find_child(resume_id, name, child_id),
+                                   self.resume_repository.find_version(resume_id))
+        updated_at = datetime.now(UTC)
+        return self._versioned(
+            self.resume_repository.update_child(resume_id, name, child_id, changes, updated_at), updated_at
+        )
+
+    def remove_resume_child(self, resume_id: str, name: str, child_id: str) -> bool:
+        return self.resume_repository.remove_child(resume_id, name, child_id, datetime.now(UTC))
+
+    def update_resume_contact(self, resume_id: str, changes: dict) -> Optional[Tuple[Contact, datetime]]:
+        if not changes:
+            resume = self.resume_repository.find_by_id(resume_id, fields=["contact", "updated_at"])
+            return self._versioned(resume.contact, resume.updated_at) if resume else None
+        updated_at = datetime.now(UTC)
+        return self._versioned(self.resume_repository.update_contact(resume_id, changes, updated_at), updated_at)
+
+    def replace_resume_contact(self, resume_id: str, data: dict) -> Optional[Tuple[Contact, datetime]]:
+        updated_at = datetime.now(UTC)
+        contact = self._to_model(Contact, data)
+        return self._versioned(self.resume_repository.replace_contact(resume_id, contact, updated_at), updated_at)
+
+    def delete_resume(self, resume_id: str) -> bool:
+        return self.resume_repository.delete(resume_id) 
+
+    def _new_resume(self, user_id: str, title: str, contact: dict, summary: str) -> Resume:
         now = datetime.now(UTC)
-        resume = Resume(
+        return Resume(
             id=None,
             user_id=user_id,
             title=title,
-            contact=contact,
+            contact=self._to_model(Contact, contact),
             summary=summary,
             education=[],
             experience=[],
@@ -21,25 +108,32 @@ class ResumeService:
             created_at=now,
             updated_at=now
         )
-        return self.resume_repository.save(resume)
 
-    def get_resume(self, resume_id: str) -> Optional[Resume]:
-        return self.resume_repository.find_by_id(resume_id)
-
-    def get_user_resumes(self, user_id: str) -> List[Resume]:
-        return self.resume_repository.find_by_user_id(user_id)
-
-    def update_resume(self, resume_id: str, updates: dict) -> Optional[Resume]:
-        resume = self.resume_repository.find_by_id(resume_id)
-        if not resume:
-            return None
+    def _imported_resume(self, user_id: str, record: dict) -> Resume:
+        # A validated record carrying the whole aggregate, children included
+        resume = self._new_resume(user_id, record["title"], record["contact"], record["summary"])
+        for name, model in CHILD_MODELS.items():
+            getattr(resume, name).extend(self._to_model(model, item) for item in record.get(name, []))
+        return resume
 
+    def _apply_updates(self, resume: Resume, updates: dict) -> Resume:
         for key, value in updates.items():
+            if key in CHILD_MODELS:
+                value = [self._to_model(CHILD_MODELS[key], item) for item in value]
+            elif key == "contact":
+                value = self._to_model(Contact, value)
+            # Only assignments that actually change a value are written back
             if hasattr(resume, key):
                 setattr(resume, key, value)
 
         resume.updated_at = datetime.now(UTC)
-        return self.resume_repository.save(resume)
+        return resume
 
-    def delete_resume(self, resume_id: str) -> bool:
-        return self.resume_repository.delete(resume_id) 
\ No newline at end of file
+    def _versioned(self, result, updated_at: Optional[datetime]):
+        return (result, updated_at) if result is not None else None
+
+    def _to_model(self, model, value):
+        # Resources hand over validated dicts for new entries
+        if isinstance(value, dict):
+            return model(**{field.name: value.get(field.name) for field in fields(model)})
+        return value
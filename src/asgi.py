@@ -0,0 +1,101 @@
+import os
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from falcon.asgi import App
+from .interfaces.api.resources.async_resume_resource import AsyncResumeResource
+from .interfaces.api.resources.async_resume_import_resource import AsyncResumeImportResource
+from .interfaces.api.resources.async_resume_export_resource import AsyncResumeExportResource
+from .interfaces.api.resources.async_contact_resource import AsyncContactResource
+from .interfaces.api.resources.async_child_resources import (
+    AsyncEducationResource, AsyncExperienceResource, AsyncSkillResource
+)
+from .interfaces.api.resources.async_auth_resource import AsyncAuthResource
+from .interfaces.api.resources.async_metrics_resource import AsyncMetricsResource
+from .interfaces.api.media import register_json_handler
+from .interfaces.api.middleware.auth_middleware import AsyncAuthMiddleware
+from .interfaces.api.middleware.compression_middleware import AsyncCompressionMiddleware
+from .interfaces.api.middleware.metrics_middleware import METRICS_PATH, AsyncMetricsMiddleware
+from .infrastructure.metrics import MetricsRegistry, MongoCommandMetrics
+from .infrastructure.mongodb_client import mongo_client_settings
+from .infrastructure.repositories.motor_resume_repository import MotorResumeRepository
+from .infrastructure.repositories.motor_user_repository import MotorUserRepository
+from .application.services.async_resume_service import AsyncResumeService
+from .application.services.async_auth_service import AsyncAuthService
+
+# Load environment variables
+load_dotenv()
+
+# ASGI counterpart of app.create_app, served by e.g. `uvicorn src.asgi:app`.
+# Reads the same settings; only the split storage layout is supported.
+def create_asgi_app():
+    if os.getenv('RESUME_STORAGE_LAYOUT', 'split') != 'split':
+        raise ValueError("The ASGI app only supports the split storage layout")
+
+    # Motor binds to the running event loop on first use, not here
+    metrics = MetricsRegistry() if os.getenv('METRICS_ENABLED', 'true') == 'true' else None
+    event_listeners = [MongoCommandMetrics(metrics)] if metrics else []
+    mongo_client = AsyncIOMotorClient(
+        os.getenv('MONGODB_URI', 'mongodb://localhost:27017'), event_listeners=event_listeners,
+        **mongo_client_settings()
+    )
+    database_name = os.getenv('MONGODB_DATABASE', 'resume_api')
+    secret_key = os.getenv('SECRET_KEY', 'your-secret-key-here')
+
+    resume_repository = MotorResumeRepository(
+        mongo_client, database_name,
+        load_mode=os.getenv('RESUME_LOAD_MODE', 'batched'),
+        use_transactions=os.getenv('MONGODB_TRANSACTIONS', 'false') == 'true'
+    )
+    user_repository = MotorUserRepository(mongo_client, database_name)
+
+    resume_service = AsyncResumeService(resume_repository)
+    auth_service = AsyncAuthService(user_repository, secret_key)
+
+    middleware = [
+        AsyncAuthMiddleware(secret_key, token_cache_size=int(os.getenv('AUTH_TOKEN_CACHE_SIZE', '10000')))
+    ]
+    if os.getenv('RESPONSE_COMPRESSION', 'true') == 'true':
+        middleware.insert(0, AsyncCompressionMiddleware(
+            min_size=int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024')),
+            level=int(os.getenv('RESPONSE_COMPRESSION_LEVEL', '1'))
+        ))
+    if metrics:
+        middleware.insert(0, AsyncMetricsMiddleware(metrics))
+    if os.getenv('MONGODB_ENSURE_INDEXES', 'true') == 'true':
+        middleware.insert(0, EnsureIndexes(resume_repository, user_repository))
+
+    app = App(middleware=middleware)
+    register_json_handler(app)
+
+    app.add_route('/auth', AsyncAuthResource(auth_service))
+    if metrics:
+        app.add_route(METRICS_PATH, AsyncMetricsResource(metrics))
+
+    app.add_route('/resumes', AsyncResumeResource(resume_service))
+    app.add_route('/resumes:bulk', AsyncResumeImportResource(resume_service))
+    app.add_route('/resumes:export', AsyncResumeExportResource(resume_service))
+    app.add_route('/resumes/{resume_id}', AsyncResumeResource(resume_service))
+
+    app.add_route('/resumes/{resume_id}/contact', AsyncContactResource(resume_service))
+
+    app.add_route('/resumes/{resume_id}/education', AsyncEducationResource(resume_service))
+    app.add_route('/resumes/{resume_id}/education/{education_id}', AsyncEducationResource(resume_service))
+
+    app.add_route('/resumes/{resume_id}/experience', AsyncExperienceResource(resume_service))
+    app.add_route('/resumes/{resume_id}/experience/{experience_id}', AsyncExperienceResource(resume_service))
+
+    app.add_route('/resumes/{resume_id}/skills', AsyncSkillResource(resume_service))
+    app.add_route('/resumes/{resume_id}/skills/{skill_id}', AsyncSkillResource(resume_service))
+
+    return app
+
+class EnsureIndexes:
+    # Index creation needs the event loop, so it runs on ASGI lifespan startup
+    def __init__(self, *repositories):
+        self.repositories = repositories
+
+    async def process_startup(self, scope, event):
+        for repository in self.repositories:
+            await repository.ensure_indexes()
+
+app = create_asgi_app()
@@ -0,0 +1,117 @@
+from dataclasses import fields
+from typing import Callable, Dict, FrozenSet, Iterator, Set, Tuple
+
+# Shared by every clean object; the first change swaps in a set of its own
+_CLEAN: FrozenSet[str] = frozenset()
+
+# Model class -> its dataclass field names, resolved once
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+# Model class -> generated loader, see ChangeTracking.loader
+_LOADERS: Dict[type, Callable] = {}
+
+# Mixin for slotted dataclasses; the tracking state sits in its own slots,
+# next to but apart from the model's fields
+class ChangeTracking:
+    __slots__ = ("_changed_fields", "_loaded_child_ids")
+
+    def __setattr__(self, name, value):
+        changed = getattr(self, "_changed_fields", None)
+        # Re-assigning an equal value (e.g. the same child list) is not a change
+        if changed is not None and not name.startswith("_") and getattr(self, name, None) != value:
+            if not changed:
+                object.__setattr__(self, "_changed_fields", {name})
+            else:
+                changed.add(name)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def loader(cls) -> Callable[..., "ChangeTracking"]:
+        # Returns a function building instances from field values read from
+        # storage, positionally and already clean: no __init__, no per-field
+        # change checks. Only for models whose fields hold no tracked models.
+        loader = _LOADERS.get(cls)
+        if loader is None:
+            loader = _LOADERS[cls] = _compile_loader(cls)
+        return loader
+
+    @property
+    def is_tracked(self) -> bool:
+        # Objects that were never loaded or saved have no baseline to diff against
+        return getattr(self, "_changed_fields", None) is not None
+
+    @property
+    def changed_fields(self) -> FrozenSet[str]:
+        return frozenset(getattr(self, "_changed_fields", None) or ())
+
+    @property
+    def has_changes(self) -> bool:
+        if not self.is_tracked:
+            return True
+        if self._changed_fields:
+            return True
+        return any(
+            isinstance(value, ChangeTracking) and value.has_changes
+            for _, value in self._field_values()
+        )
+
+    def removed_child_ids(self, name: str) -> Set[str]:
+        loaded = (getattr(self, "_loaded_child_ids", None) or {}).get(name, set())
+        current = {getattr(child, "id", None) for child in getattr(self, name)}
+        return loaded - current
+
+    def mark_clean(self, deep: bool = True) -> None:
+        # deep=False when the nested models are known to be clean already
+        loaded_child_ids = {}
+        for name, value in self._field_values():
+            if isinstance(value, ChangeTracking):
+                if deep:
+                    value.mark_clean()
+            elif isinstance(value, list):
+                if deep:
+                    for item in value:
+                        if isinstance(item, ChangeTracking):
+                            item.mark_clean()
+                child_ids = {item.id for item in value if isinstance(item, ChangeTracking) and item.id}
+                if child_ids:
+                    loaded_child_ids[name] = child_ids
+
+        object.__setattr__(self, "_changed_fields", _CLEAN)
+        object.__setattr__(self, "_loaded_child_ids", loaded_child_ids or None)
+
+    def __getstate__(self) -> dict:
+        state = dict(self._field_values())
+        for name in ChangeTracking.__slots__:
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # copy/pickle restore: set values directly so nothing is recorded as a change
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _field_values(self) -> Iterator[Tuple[str, object]]:
+        for name in _field_names(type(self)):
+            yield name, getattr(self, name)
+
+def _field_names(model: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(model)
+    if names is None:
+        names = _FIELD_NAMES[model] = tuple(field.name for field in fields(model))
+    return names
+
+def _compile_loader(model: type) -> Callable:
+    # Slot descriptors are set directly, bypassing ChangeTracking.__setattr__
+    names = _field_names(model)
+    namespace = {"new": object.__new__, "model": model, "clean": _CLEAN}
+    lines = [f"def loader({', '.join(names)}):", "    obj = new(model)"]
+    for name in names + ChangeTracking.__slots__:
+        namespace[f"set_{name}"] = getattr(model, name).__set__
+    for name in names:
+        lines.append(f"    set_{name}(obj, {name})")
+    lines.append("    set__changed_fields(obj, clean)")
+    lines.append("    set__loaded_child_ids(obj, None)")
+    lines.append("    return obj")
+    exec("\n".join(lines) + "\n", namespace)
+    return namespace["loader"]
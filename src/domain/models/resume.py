@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
+from .change_tracking import ChangeTracking
 
-@dataclass
-class Education:
+# Skill levels, lowest first
+SKILL_LEVELS = ("Beginner", "Intermediate", "Advanced", "Expert")
+
+@dataclass(slots=True)
+class Education(ChangeTracking):
     id: Optional[str]
     institution: str
     degree: str
@@ -12,8 +16,8 @@ class Education:
     end_date: Optional[datetime]
     description: Optional[str]
 
-@dataclass
-class Experience:
+@dataclass(slots=True)
+class Experience(ChangeTracking):
     id: Optional[str]
     company: str
     position: str
@@ -22,22 +26,22 @@ class Experience:
     description: str
     achievements: List[str]
 
-@dataclass
-class Skill:
+@dataclass(slots=True)
+class Skill(ChangeTracking):
     id: Optional[str]
     name: str
-    level: str  # e.g., "Beginner", "Intermediate", "Advanced", "Expert"
+    level: str  # one of SKILL_LEVELS
 
-@dataclass
-class Contact:
+@dataclass(slots=True)
+class Contact(ChangeTracking):
     email: str
     phone: Optional[str]
     location: Optional[str]
     linkedin: Optional[str]
     github: Optional[str]
 
-@dataclass
-class Resume:
+@dataclass(slots=True)
+class Resume(ChangeTracking):
     id: Optional[str]
     user_id: str
     title: str
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+# A ranked search result: enough to list it, the full resume is a GET away
+@dataclass(slots=True)
+class ResumeSearchHit:
+    resume_id: str
+    user_id: str
+    title: str
+    updated_at: datetime
+    score: float
@@ -0,0 +1,51 @@
+from dataclasses import fields, is_dataclass
+from typing import Callable, Dict, List, Union, get_args, get_origin, get_type_hints
+
+# Model class -> generated function returning the model's fields as a dict
+_TO_DICT: Dict[type, Callable[[object], dict]] = {}
+
+def to_dict(model) -> dict:
+    converter = _TO_DICT.get(type(model))
+    if converter is None:
+        converter = compile_to_dict(type(model))
+    return converter(model)
+
+def compile_to_dict(model: type) -> Callable[[object], dict]:
+    # Generates e.g. `def to_dict(obj): return {'id': obj.id, 'name': obj.name}`
+    # once per class: no per-call reflection, and nested models and lists of
+    # models are converted inline
+    namespace = {}
+    items = []
+    hints = get_type_hints(model)
+    for field in fields(model):
+        nested, is_list = _nested_model(hints[field.name])
+        value = f"obj.{field.name}"
+        if nested is not None:
+            converter = f"_{field.name}_to_dict"
+            namespace[converter] = _TO_DICT.get(nested) or compile_to_dict(nested)
+            if is_list:
+                value = f"[{converter}(item) for item in {value}]"
+            else:
+                value = f"None if {value} is None else {converter}({value})"
+        items.append(f"{field.name!r}: {value}")
+
+    source = "def to_dict(obj):\n    return {" + ", ".join(items) + "}\n"
+    exec(source, namespace)
+    converter = namespace["to_dict"]
+    _TO_DICT[model] = converter
+    return converter
+
+def _nested_model(hint):
+    # Contact, Optional[Contact] -> (Contact, False); List[Skill] -> (Skill, True)
+    origin = get_origin(hint)
+    if origin is Union:
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else (None, False)
+    if origin in (list, List):
+        args = get_args(hint)
+        if args and is_dataclass(args[0]):
+            return args[0], True
+        return None, False
+    if isinstance(hint, type) and is_dataclass(hint):
+        return hint, False
+    return None, False
@@ -7,7 +7,7 @@ class UserRole(str, Enum):
     OWNER = "owner"
     GUEST = "guest"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[str]
     email: str
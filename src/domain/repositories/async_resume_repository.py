@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Collection, List, Optional, Tuple
+from ..models.resume import Resume, Contact
+
+# Same contract as ResumeRepository, for drivers that do I/O on an event loop
+class AsyncResumeRepository(ABC):
+    @abstractmethod
+    async def save(self, resume: Resume) -> Resume:
+        pass
+
+    @abstractmethod
+    async def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        pass
+
+    @abstractmethod
+    async def find_version(self, resume_id: str) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    async def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        pass
+
+    @abstractmethod
+    async def find_child(self, resume_id: str, name: str, child_id: str):
+        pass
+
+    @abstractmethod
+    async def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        pass
+
+    @abstractmethod
+    async def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        pass
+
+    @abstractmethod
+    async def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    async def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        pass
+
+    @abstractmethod
+    async def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        pass
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        pass
+
+    @abstractmethod
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> AsyncIterator[Resume]:
+        pass
+
+    @abstractmethod
+    async def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                            fields: Optional[Collection[str]] = None) -> List[Resume]:
+        # Up to limit resumes in listing order, starting after the resume
+        # whose (updated_at, id) key is given
+        pass
+
+    @abstractmethod
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> AsyncIterator[Resume]:
+        pass
+
+    @abstractmethod
+    async def delete(self, resume_id: str) -> bool:
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..models.user import User
+
+class AsyncUserRepository(ABC):
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        pass
+
+    @abstractmethod
+    async def find_or_create(self, user: User) -> User:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        pass
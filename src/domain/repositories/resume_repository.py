@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..models.resume import Resume
+from datetime import datetime
+from typing import Collection, Iterator, List, Optional, Tuple
+from ..models.resume import Resume, Contact
 
 class ResumeRepository(ABC):
     @abstractmethod
@@ -8,11 +9,77 @@ class ResumeRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_id(self, resume_id: str) -> Optional[Resume]:
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        # Inserts new resumes, children included, in as few writes as possible.
+        # A resume the store rejected is not written and is left without an id
         pass
 
     @abstractmethod
-    def find_by_user_id(self, user_id: str) -> List[Resume]:
+    def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, resume_ids: Collection[str]) -> List[Resume]:
+        # The resumes that exist among resume_ids, in one read
+        pass
+
+    @abstractmethod
+    def find_version(self, resume_id: str) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        # Entries of one child collection ("education", "experience" or "skills"),
+        # or None when the resume does not exist
+        pass
+
+    @abstractmethod
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        pass
+
+    @abstractmethod
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        # Writes one new entry and bumps the resume's updated_at; returns the
+        # entry with its id, or None when the resume does not exist
+        pass
+
+    @abstractmethod
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        # Sets the given fields of one entry; returns it as updated, or None
+        pass
+
+    @abstractmethod
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        # Sets the given contact fields; None when the resume has no contact
+        pass
+
+    @abstractmethod
+    def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        pass
+
+    @abstractmethod
+    def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        pass
+
+    @abstractmethod
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        pass
+
+    @abstractmethod
+    def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                            fields: Optional[Collection[str]] = None) -> List[Resume]:
+        # Up to limit resumes in listing order, starting after the resume
+        # whose (updated_at, id) key is given
+        pass
+
+    @abstractmethod
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        # Every matching resume in one pass, for exports
         pass
 
     @abstractmethod
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from ..models.resume_search import ResumeSearchHit
+
+class ResumeSearch(ABC):
+    @abstractmethod
+    def search(self, text: Optional[str] = None, skill: Optional[str] = None,
+               min_skill_level: Optional[str] = None, limit: int = 20,
+               offset: int = 0) -> Tuple[List[ResumeSearchHit], int]:
+        # Best matches first, with the total number of matches. Every word of
+        # text must match; skill must be held at min_skill_level or above.
+        pass
@@ -7,6 +7,10 @@ class UserRepository(ABC):
     def save(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    def find_or_create(self, user: User) -> User:
+        pass
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[User]:
         pass
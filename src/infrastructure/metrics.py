@@ -0,0 +1,136 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+from pymongo import monitoring
+
+# Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; most requests and commands finish in single-digit milliseconds,
+# the upper buckets are there to catch stalls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + '}'
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# Series are keyed by a tuple of label values in labelnames order, so
+# recording is one dict lookup and no string formatting
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> per-bucket counts (not cumulative), the +Inf count, then the sum
+        self._series: Dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        # Buckets are upper-inclusive, as Prometheus' le
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self, lines: List[str]) -> None:
+        with self._lock:
+            series = [(labels, list(values)) for labels, values in self._series.items()]
+        lines.append(f'# HELP {self.name} {self.documentation}')
+        lines.append(f'# TYPE {self.name} histogram')
+        bucket_names = self.labelnames + ('le',)
+        for labels, values in series:
+            count = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), values):
+                count += bucket_count
+                lines.append(f'{self.name}_bucket{_labels(bucket_names, labels + (_number(bound),))} {count}')
+            label_text = _labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {_number(values[-1])}')
+            lines.append(f'{self.name}_count{label_text} {count}')
+
+# (name, type, help, value) samples read when metrics are scraped
+Collector = Callable[[], Iterable[Tuple[str, str, str, float]]]
+
+# Metrics of one process. Behind gunicorn each worker has its own, and a
+# scrape reports the worker that answers it.
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+        self._collectors: List[Collector] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def add_stats(self, prefix: str, stats: Callable[[], Dict[str, float]], counters: Iterable[str] = ()) -> None:
+        # Exposes a component's stats() dict: counters get a _total suffix,
+        # every other key is a gauge
+        counters = frozenset(counters)
+
+        def collect():
+            for key, value in stats().items():
+                if key in counters:
+                    yield f'{prefix}_{key}_total', 'counter', f'{prefix} {key}'.replace('_', ' '), value
+                else:
+                    yield f'{prefix}_{key}', 'gauge', f'{prefix} {key}'.replace('_', ' '), value
+        self.add_collector(collect)
+
+    def render(self) -> bytes:
+        lines: List[str] = []
+        for metric in self._metrics:
+            metric.render(lines)
+        for collector in self._collectors:
+            for name, kind, documentation, value in collector():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {kind}')
+                lines.append(f'{name} {_number(value)}')
+        lines.append('')
+        return '\n'.join(lines).encode('utf-8')
+
+# Records every command a client sends: count and duration per collection
+# and command name. Pass it to the client as event_listeners=[...].
+class MongoCommandMetrics(monitoring.CommandListener):
+    def __init__(self, registry: MetricsRegistry):
+        self.duration = registry.histogram(
+            'mongodb_command_duration_seconds', 'MongoDB command round trips by collection and command',
+            ('collection', 'command', 'outcome')
+        )
+        # (connection, request id) -> collection, from the started event; the
+        # finishing events do not carry the command
+        self._collections: Dict[tuple, str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command = event.command
+        # The collection is the command's first value (find, insert, aggregate, ...)
+        collection = command.get('collection' if event.command_name == 'getMore' else event.command_name)
+        self._collections[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else ''
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event, 'success')
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event, 'failure')
+
+    def _record(self, event, outcome: str) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), '')
+        self.duration.observe((collection, event.command_name, outcome), event.duration_micros / 1e6)
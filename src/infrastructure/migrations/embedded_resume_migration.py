@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from pymongo import MongoClient, UpdateOne, ASCENDING
+from ..repositories.mongodb_resume_repository import MongoDBResumeRepository
+from ..repositories.mongodb_embedded_resume_repository import EMBEDDED_SCHEMA_VERSION
+
+# Only resumes without a schema_version are picked up, so the migration can be
+# interrupted and re-run at any time and never overwrites resumes already written
+# by MongoDBEmbeddedResumeRepository. The split collections are left untouched.
+# A resume whose children were written through the split path after its batch
+# was read is skipped, and left pending for the next run: those writes move the
+# resume's revision only once the entry is written, and are refused and redone
+# on the arrays by MongoDBEmbeddedResumeRepository once the resume is migrated.
+# Writers that do not know about the embedded layout must be stopped first.
+@dataclass
+class MigrationReport:
+    migrated: int = 0
+    skipped: int = 0
+
+class EmbeddedResumeMigration:
+    def __init__(self, mongo_client: MongoClient, database_name: str, batch_size: int = 500):
+        self.split_repository = MongoDBResumeRepository(mongo_client, database_name)
+        self.resumes = self.split_repository.resumes
+        self.batch_size = batch_size
+
+    def pending(self) -> int:
+        return self.resumes.count_documents(self._pending_query())
+
+    def run(self, max_batches: Optional[int] = None,
+            progress: Optional[Callable[[int], None]] = None) -> MigrationReport:
+        report = MigrationReport()
+        batches = 0
+        # Keyset on _id: each batch starts past the previous one, so the run
+        # reads the collection once and skipped resumes are not picked up again.
+        # $gt only compares ids of one BSON type: ids stored as ObjectId by
+        # older writes get a pass of their own.
+        for id_type in ("string", "objectId"):
+            last_id = None
+            while max_batches is None or batches < max_batches:
+                id_range = {"$type": id_type} if last_id is None else {"$gt": last_id}
+                resume_dicts = list(self.resumes.find(dict(self._pending_query(), _id=id_range))
+                                    .sort("_id", ASCENDING).limit(self.batch_size))
+                if not resume_dicts:
+                    break
+
+                self._migrate_batch(resume_dicts, report)
+                last_id = resume_dicts[-1]["_id"]
+                batches += 1
+                if progress:
+                    progress(report.migrated)
+        return report
+
+    def _migrate_batch(self, resume_dicts: List[dict], report: MigrationReport) -> None:
+        resume_ids = [str(resume_dict["_id"]) for resume_dict in resume_dicts]
+        children = self.split_repository._load_children(resume_ids)
+
+        operations = []
+        for resume_dict, resume_id in zip(resume_dicts, resume_ids):
+            embedded = {
+                name: [self._embed_child(record) for record in records]
+                for name, records in children[resume_id].items()
+            }
+            embedded["schema_version"] = EMBEDDED_SCHEMA_VERSION
+            # Guard against a concurrent embedded write landing first, and
+            # against a split child write since the read: those move the revision
+            # (missing on resumes never written since they were created)
+            filter_query = dict(self._pending_query(), _id=resume_dict["_id"],
+                                revision=resume_dict.get("revision"))
+            operations.append(UpdateOne(filter_query, {"$set": embedded}))
+
+        result = self.resumes.bulk_write(operations, ordered=False)
+        report.migrated += result.modified_count
+        # The guard missed: a concurrent write got there first
+        report.skipped += len(operations) - result.matched_count
+
+    def _embed_child(self, record: dict) -> dict:
+        child = {key: value for key, value in record.items() if key != "resume_id"}
+        child["_id"] = str(child["_id"])
+        return child
+
+    def _pending_query(self) -> dict:
+        return {"schema_version": {"$exists": False}}
@@ -0,0 +1,150 @@
+import os
+import weakref
+from threading import Lock
+from typing import Callable, Dict
+from pymongo import MongoClient
+from pymongo.database import Database
+
+# Environment variable -> (MongoClient option, parser). Unset variables leave
+# the driver default, except for the timeouts in CLIENT_DEFAULTS.
+CLIENT_SETTINGS = {
+    'MONGODB_MAX_POOL_SIZE': ('maxPoolSize', int),
+    'MONGODB_MIN_POOL_SIZE': ('minPoolSize', int),
+    'MONGODB_MAX_IDLE_TIME_MS': ('maxIdleTimeMS', int),
+    'MONGODB_MAX_CONNECTING': ('maxConnecting', int),
+    'MONGODB_WAIT_QUEUE_TIMEOUT_MS': ('waitQueueTimeoutMS', int),
+    'MONGODB_CONNECT_TIMEOUT_MS': ('connectTimeoutMS', int),
+    'MONGODB_SOCKET_TIMEOUT_MS': ('socketTimeoutMS', int),
+    'MONGODB_SERVER_SELECTION_TIMEOUT_MS': ('serverSelectionTimeoutMS', int),
+    'MONGODB_TIMEOUT_MS': ('timeoutMS', int),
+    # e.g. "zstd,snappy,zlib"; zstd and snappy need their optional packages
+    'MONGODB_COMPRESSORS': ('compressors', str),
+    'MONGODB_ZLIB_COMPRESSION_LEVEL': ('zlibCompressionLevel', int),
+    'MONGODB_APP_NAME': ('appname', str),
+}
+
+# pymongo's maxPoolSize when MONGODB_MAX_POOL_SIZE is unset
+DRIVER_MAX_POOL_SIZE = 100
+
+# The driver waits 20s to connect and 30s to find a server; a request
+# handler should fail well before a load balancer gives up on it
+CLIENT_DEFAULTS = {'connectTimeoutMS': 5000, 'serverSelectionTimeoutMS': 10000}
+
+def mongo_client_settings() -> Dict[str, object]:
+    settings = dict(CLIENT_DEFAULTS)
+    for variable, (option, parse) in CLIENT_SETTINGS.items():
+        value = os.getenv(variable)
+        if value:
+            settings[option] = parse(value)
+    return settings
+
+# Every LazyMongoClient in this process, so forks can reset them all
+_LAZY_CLIENTS = weakref.WeakSet()
+
+# Stands in for a MongoClient that is only opened on first use, once per
+# process. A client opened before a fork (gunicorn --preload builds the app in
+# the master) is dropped in the child, which opens its own: sockets, pool
+# locks and monitor threads cannot be shared across processes.
+# Databases and collections taken from it are proxies too, so repositories
+# built before the fork follow the client of whichever process uses them.
+class LazyMongoClient:
+    def __init__(self, factory: Callable[[], MongoClient]):
+        self._factory = factory
+        self._client = None
+        self._lock = Lock()
+        _LAZY_CLIENTS.add(self)
+
+    @classmethod
+    def from_env(cls, uri: str, **options) -> "LazyMongoClient":
+        # options are passed through as given, e.g. event_listeners
+        settings = dict(mongo_client_settings(), **options)
+        return cls(lambda: MongoClient(uri, **settings))
+
+    @property
+    def client(self) -> MongoClient:
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+                client = self._client
+        return client
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def __getitem__(self, name: str) -> "LazyDatabase":
+        return LazyDatabase(self, name)
+
+    def get_database(self, name: str) -> "LazyDatabase":
+        return LazyDatabase(self, name)
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _after_fork(self) -> None:
+        # Not closed: that would end the parent's sessions over sockets the child shares
+        self._client = None
+        self._lock = Lock()
+
+class LazyDatabase:
+    def __init__(self, lazy_client: LazyMongoClient, name: str):
+        self._lazy_client = lazy_client
+        self.name = name
+        # (client, database) as last resolved; stale once the process has a new client
+        self._resolved = (None, None)
+        self._collections: Dict[str, LazyCollection] = {}
+
+    @property
+    def database(self) -> Database:
+        client, database = self._resolved
+        if client is None or client is not self._lazy_client._client:
+            client = self._lazy_client.client
+            database = client[self.name]
+            self._resolved = (client, database)
+        return database
+
+    def __getattr__(self, name):
+        # Database methods pass through; any other name is a collection, as with pymongo
+        if name.startswith('_') or hasattr(Database, name):
+            return getattr(self.database, name)
+        return self[name]
+
+    def __getitem__(self, name: str) -> "LazyCollection":
+        # One proxy per collection, resolved once per client rather than per call
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self._collections.setdefault(name, LazyCollection(self, name))
+        return collection
+
+class LazyCollection:
+    def __init__(self, lazy_database: LazyDatabase, name: str):
+        self._lazy_database = lazy_database
+        self._lazy_client = lazy_database._lazy_client
+        self.name = name
+        self._resolved = (None, None)
+
+    @property
+    def collection(self):
+        client, collection = self._resolved
+        if client is None or client is not self._lazy_client._client:
+            client = self._lazy_client.client
+            collection = self._lazy_database.database[self.name]
+            self._resolved = (client, collection)
+        return collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+def close_mongo_clients() -> None:
+    for lazy_client in list(_LAZY_CLIENTS):
+        lazy_client.close()
+
+def _reset_after_fork() -> None:
+    for lazy_client in list(_LAZY_CLIENTS):
+        lazy_client._after_fork()
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,215 @@
+import copy
+import sys
+import time
+from datetime import datetime
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from threading import Lock
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+from ...domain.models.resume import Resume, Contact
+from ...domain.repositories.resume_repository import ResumeRepository
+
+class CachingResumeRepository(ResumeRepository):
+    def __init__(self, repository: ResumeRepository, max_entries: int = 1000,
+                 max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 60.0):
+        self.repository = repository
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # resume_id -> (expires_at, size, resume), least recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        # resume_id -> (generation, reads in flight); invalidating a resume
+        # while it is being read bumps its generation, and the read's result
+        # is then not cached
+        self._loads: Dict[str, Tuple[int, int]] = {}
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def save(self, resume: Resume) -> Resume:
+        saved = self.repository.save(resume)
+        self.invalidate(saved.id)
+        return saved
+
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        # New resumes only: there is nothing cached to invalidate
+        return self.repository.save_many(resumes)
+
+    def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        if fields is not None:
+            # Partial aggregates are cheap to read and are not cached
+            return self.repository.find_by_id(resume_id, fields)
+
+        cached = self._cached(resume_id)
+        if cached is not None:
+            # Callers mutate what they get back, so never hand out the cached instance
+            return copy.deepcopy(cached)
+
+        generation = self._begin_load(resume_id)
+        resume = None
+        try:
+            resume = self.repository.find_by_id(resume_id)
+        finally:
+            self._store(resume_id, copy.deepcopy(resume) if resume else None, generation)
+        return resume
+
+    def find_by_ids(self, resume_ids: Collection[str]) -> List[Resume]:
+        return self.repository.find_by_ids(resume_ids)
+
+    def find_version(self, resume_id: str) -> Optional[datetime]:
+        # Always asked of the store: freshness checks must see other workers' writes
+        return self.repository.find_version(resume_id)
+
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        # Served under an ETag read from the store: a cached aggregate another
+        # worker has written since would go out as the current version
+        return self.repository.find_children(resume_id, name)
+
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        return self.repository.find_child(resume_id, name, child_id)
+
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        added = self.repository.add_child(resume_id, name, child, updated_at)
+        self.invalidate(resume_id)
+        return added
+
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        updated = self.repository.update_child(resume_id, name, child_id, changes, updated_at)
+        self.invalidate(resume_id)
+        return updated
+
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        removed = self.repository.remove_child(resume_id, name, child_id, updated_at)
+        self.invalidate(resume_id)
+        return removed
+
+    def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        contact = self.repository.update_contact(resume_id, changes, updated_at)
+        self.invalidate(resume_id)
+        return contact
+
+    def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        replaced = self.repository.replace_contact(resume_id, contact, updated_at)
+        self.invalidate(resume_id)
+        return replaced
+
+    def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.repository.find_by_user_id(user_id, fields)
+
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        return self.repository.iter_by_user_id(user_id, fields)
+
+    def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                             fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.repository.find_page_by_user_id(user_id, limit, after, fields)
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        # Exports read everything once; caching them would only evict hot entries
+        return self.repository.iter_all(user_id, updated_since)
+
+    def delete(self, resume_id: str) -> bool:
+        deleted = self.repository.delete(resume_id)
+        self.invalidate(resume_id)
+        return deleted
+
+    def invalidate(self, resume_id: str) -> None:
+        with self._lock:
+            load = self._loads.get(resume_id)
+            if load:
+                # A read under way may have seen the state before this write
+                self._loads[resume_id] = (load[0] + 1, load[1])
+            if resume_id in self._entries:
+                self._remove(resume_id)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for resume_id, (generation, loads) in self._loads.items():
+                self._loads[resume_id] = (generation + 1, loads)
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
+
+    def _cached(self, resume_id: str) -> Optional[Resume]:
+        with self._lock:
+            entry = self._entries.get(resume_id)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(resume_id)
+                self.hits += 1
+                return entry[2]
+
+            if entry:
+                self._remove(resume_id)
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def _begin_load(self, resume_id: str) -> int:
+        with self._lock:
+            generation, loads = self._loads.get(resume_id, (0, 0))
+            self._loads[resume_id] = (generation, loads + 1)
+            return generation
+
+    def _store(self, resume_id: str, resume: Optional[Resume], generation: int) -> None:
+        # Ends the load begun at generation; the result is cached only if
+        # nothing invalidated the resume since
+        size = _estimate_size(resume) if resume else 0
+
+        with self._lock:
+            current, loads = self._loads.pop(resume_id)
+            if loads > 1:
+                self._loads[resume_id] = (current, loads - 1)
+            if resume is None or current != generation or size > self.max_bytes:
+                return
+
+            if resume_id in self._entries:
+                self._remove(resume_id)
+            self._entries[resume_id] = (time.monotonic() + self.ttl_seconds, size, resume)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_id = next(iter(self._entries))
+                self._remove(oldest_id)
+                self.evictions += 1
+
+    def _remove(self, resume_id: str) -> None:
+        _, size, _ = self._entries.pop(resume_id)
+        self._bytes -= size
+
+def _estimate_size(value, seen=None) -> int:
+    # Rough deep size of a resume aggregate, good enough to bound the cache
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_size(key, seen) + _estimate_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, seen) for item in value)
+    elif is_dataclass(value):
+        # Slotted models have no __dict__; walk their fields instead
+        size += sum(_estimate_size(getattr(value, field.name), seen) for field in fields(value))
+    elif hasattr(value, "__dict__"):
+        size += _estimate_size(vars(value), seen)
+    return size
@@ -0,0 +1,97 @@
+import os
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, List
+from pymongo import MongoClient
+
+# Share of the client's connection pool the fetch threads may hold at once,
+# so request threads can still check out a connection of their own
+DEFAULT_POOL_SHARE = 0.5
+
+# Every pool in this process, so forks can replace their executors
+_POOLS = weakref.WeakSet()
+
+# Process-wide, bounded pool for issuing independent queries concurrently
+# from sync code. When every worker is busy the query runs on the calling
+# thread instead of queueing, so a saturated pool degrades to sequential
+# fetches rather than adding wait time.
+class ChildFetchPool:
+    def __init__(self, max_workers: int):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="child-fetch")
+        self._lock = Lock()
+        self._active = 0
+        self.submitted = 0
+        self.inline = 0
+        self.peak_active = 0
+        _POOLS.add(self)
+
+    @classmethod
+    def for_client(cls, mongo_client: MongoClient, pool_share: float = DEFAULT_POOL_SHARE) -> "ChildFetchPool":
+        return cls.for_pool_size(mongo_client.options.pool_options.max_pool_size, pool_share)
+
+    @classmethod
+    def for_pool_size(cls, max_pool_size: int, pool_share: float = DEFAULT_POOL_SHARE) -> "ChildFetchPool":
+        return cls(max(1, int(max_pool_size * pool_share)))
+
+    def map(self, calls: List[Callable[[], object]]) -> list:
+        # The last call always runs on the calling thread, which would otherwise just wait
+        futures = [self._submit(call) for call in calls[:-1]]
+        results = [calls[-1]()] if calls else []
+        return [future.result() for future in futures] + results
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "peak_active": self.peak_active,
+                "submitted": self.submitted,
+                "inline": self.inline,
+                "saturation": self._active / self.max_workers
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, call: Callable[[], object]) -> Future:
+        with self._lock:
+            saturated = self._active >= self.max_workers
+            if saturated:
+                self.inline += 1
+            else:
+                self._active += 1
+                self.submitted += 1
+                self.peak_active = max(self.peak_active, self._active)
+
+        if saturated:
+            future = Future()
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        future = self._executor.submit(call)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def _after_fork(self) -> None:
+        # Worker threads do not survive a fork, but the executor would still
+        # count them and never start new ones
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="child-fetch")
+        self._lock = Lock()
+        self._active = 0
+
+def _reset_after_fork() -> None:
+    for pool in list(_POOLS):
+        pool._after_fork()
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,312 @@
+from datetime import datetime, UTC
+from threading import RLock
+from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple
+from bson import ObjectId
+from ...domain.models.resume import Resume, Contact
+from ...domain.repositories.resume_repository import ResumeRepository
+from .memory_snapshots import read_snapshot, write_snapshot
+from .mongodb_resume_documents import ResumeDocumentMapper, CHILD_COLLECTIONS, DOCUMENT_FIELDS, document_fields
+
+def stored_value(value):
+    # What Mongo would hand back for value: datetimes in naive UTC at
+    # millisecond precision, containers copied so the caller's stay its own
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: stored_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [stored_value(item) for item in value]
+    return value
+
+def copied_value(value):
+    if isinstance(value, dict):
+        return {key: copied_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copied_value(item) for item in value]
+    return value
+
+# Resumes kept in process memory as the same documents the split Mongo layout
+# stores, with hash indexes standing in for Mongo's: resumes by id and by
+# user_id, child records by id and by resume_id. Everything written is copied
+# in and everything read is built fresh, so callers never share state with
+# the store or each other, as with Mongo. One lock serializes access; reads
+# and writes are in-memory and short.
+class InMemoryResumeRepository(ResumeDocumentMapper, ResumeRepository):
+    def __init__(self):
+        self._lock = RLock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._resumes: Dict[str, dict] = {}
+        self._children: Dict[str, Dict[str, dict]] = {name: {} for name in CHILD_COLLECTIONS}
+        # user_id -> resume ids
+        self._user_index: Dict[str, Set[str]] = {}
+        # name -> resume_id -> child ids, in insertion order
+        self._resume_index: Dict[str, Dict[str, Dict[str, None]]] = {name: {} for name in CHILD_COLLECTIONS}
+
+    def save(self, resume: Resume) -> Resume:
+        with self._lock:
+            resume_id = resume.id or str(ObjectId())
+            new_child_ids = []
+            if not resume.id:
+                self._insert_resume(resume_id, self._resume_document(resume))
+            elif resume.is_tracked:
+                # Loaded aggregate: only what changed since it was read, so
+                # concurrent writes to other fields survive as they do in Mongo
+                self._update_resume(resume_id, self._resume_changes(resume))
+            else:
+                self._update_resume(resume_id, self._resume_document(resume))
+
+            # As with update_one, nothing is written for a resume that is gone
+            if resume_id in self._resumes:
+                for name in CHILD_COLLECTIONS:
+                    self._write_children(resume, resume_id, name, new_child_ids)
+
+        resume.id = resume_id
+        for child, child_id in new_child_ids:
+            child.id = child_id
+        resume.mark_clean()
+        return resume
+
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        documents, new_ids = self._plan_inserts(resumes)
+        with self._lock:
+            for resume_dict in documents["resumes"]:
+                self._insert_resume(resume_dict.pop("_id"), resume_dict)
+            for name in CHILD_COLLECTIONS:
+                for child_dict in documents[name]:
+                    self._insert_child(name, child_dict.pop("_id"), child_dict)
+
+        return self._assign_ids(resumes, new_ids, set())
+
+    def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        with self._lock:
+            if resume_id not in self._resumes:
+                return None
+            return self._load(resume_id, fields)
+
+    def find_by_ids(self, resume_ids: Collection[str]) -> List[Resume]:
+        with self._lock:
+            return [self._load(resume_id) for resume_id in resume_ids if resume_id in self._resumes]
+
+    def find_version(self, resume_id: str) -> Optional[datetime]:
+        with self._lock:
+            resume_dict = self._resumes.get(resume_id)
+            return resume_dict["updated_at"] if resume_dict else None
+
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        with self._lock:
+            if resume_id not in self._resumes:
+                return None
+            return [self._loaded_child(name, record) for record in self._child_records(name, resume_id)]
+
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        with self._lock:
+            record = self._children[name].get(child_id)
+            if record is None or record["resume_id"] != resume_id:
+                return None
+            return self._loaded_child(name, copied_value(record))
+
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        child_dict = self._new_child_document(child, resume_id)
+        with self._lock:
+            if resume_id not in self._resumes:
+                return None
+            self._insert_child(name, child_dict["_id"], child_dict)
+            self._update_resume(resume_id, {"updated_at": updated_at})
+        child.id = child_dict["_id"]
+        child.mark_clean()
+        return child
+
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        with self._lock:
+            records = self._children[name]
+            record = records.get(child_id)
+            if record is None or record["resume_id"] != resume_id:
+                return None
+            record = records[child_id] = dict(record, **stored_value(changes))
+            self._update_resume(resume_id, {"updated_at": updated_at})
+            return self._loaded_child(name, copied_value(record))
+
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        with self._lock:
+            record = self._children[name].get(child_id)
+            if record is None or record["resume_id"] != resume_id:
+                return False
+            del self._children[name][child_id]
+            self._resume_index[name][resume_id].pop(child_id, None)
+            self._update_resume(resume_id, {"updated_at": updated_at})
+            return True
+
+    def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        with self._lock:
+            resume_dict = self._resumes.get(resume_id)
+            # As with a dotted $set, there has to be a contact to set fields on
+            if resume_dict is None or not isinstance(resume_dict.get("contact"), dict):
+                return None
+            self._update_resume(resume_id, dict(self._contact_changes(changes), updated_at=updated_at))
+            # Contact fields are all scalars, so the stored values can be handed out
+            return self._loaded_contact(self._resumes[resume_id])
+
+    def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        with self._lock:
+            if resume_id not in self._resumes:
+                return None
+            self._update_resume(resume_id, {"contact": document_fields(contact), "updated_at": updated_at})
+        contact.mark_clean()
+        return contact
+
+    def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        with self._lock:
+            return [self._load(resume_id, fields) for resume_id in self._user_resume_ids(user_id)]
+
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        with self._lock:
+            resume_ids = self._user_resume_ids(user_id)
+        return self._iter(resume_ids, fields)
+
+    def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                            fields: Optional[Collection[str]] = None) -> List[Resume]:
+        with self._lock:
+            resume_ids = self._user_resume_ids(user_id)
+            if after is not None:
+                # Keyset on (updated_at, _id), descending, as USER_RESUMES_SORT
+                key = (stored_value(after[0]), after[1])
+                resume_ids = [resume_id for resume_id in resume_ids if self._sort_key(resume_id) < key]
+            return [self._load(resume_id, fields) for resume_id in resume_ids[:limit]]
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        with self._lock:
+            resume_ids = self._user_index.get(user_id, ()) if user_id is not None else self._resumes
+            if updated_since is not None:
+                since = stored_value(updated_since)
+                resume_ids = [resume_id for resume_id in resume_ids if self._resumes[resume_id]["updated_at"] >= since]
+            # EXPORT_SORT
+            resume_ids = sorted(resume_ids)
+        return self._iter(resume_ids)
+
+    def delete(self, resume_id: str) -> bool:
+        with self._lock:
+            resume_dict = self._resumes.pop(resume_id, None)
+            if resume_dict is None:
+                return False
+            self._unindex_user(resume_dict["user_id"], resume_id)
+            for name in CHILD_COLLECTIONS:
+                for child_id in self._resume_index[name].pop(resume_id, ()):
+                    del self._children[name][child_id]
+            return True
+
+    def snapshot(self, path: str) -> None:
+        with self._lock:
+            # Documents are replaced rather than mutated once stored, so a
+            # shallow copy is a consistent view to pickle outside the lock
+            state = {
+                "resumes": dict(self._resumes),
+                "children": {name: dict(records) for name, records in self._children.items()}
+            }
+        write_snapshot(path, state)
+
+    def restore(self, path: str) -> bool:
+        state = read_snapshot(path)
+        if state is None:
+            return False
+        with self._lock:
+            self._clear()
+            for resume_id, resume_dict in state["resumes"].items():
+                self._insert_resume(resume_id, resume_dict)
+            for name in CHILD_COLLECTIONS:
+                for child_id, child_dict in state["children"][name].items():
+                    self._insert_child(name, child_id, child_dict)
+        return True
+
+    def _insert_resume(self, resume_id: str, resume_dict: dict) -> None:
+        resume_dict = stored_value(resume_dict)
+        resume_dict["_id"] = resume_id
+        self._resumes[resume_id] = resume_dict
+        self._user_index.setdefault(resume_dict["user_id"], set()).add(resume_id)
+
+    def _update_resume(self, resume_id: str, changes: dict) -> None:
+        resume_dict = self._resumes.get(resume_id)
+        if resume_dict is None or not changes:
+            return
+        resume_dict = dict(resume_dict)
+        for key, value in stored_value(changes).items():
+            field, _, subfield = key.partition(".")
+            if subfield:
+                # contact.<field>, as written by $set on a dotted path
+                resume_dict[field] = dict(resume_dict.get(field) or {}, **{subfield: value})
+            else:
+                resume_dict[field] = value
+        previous = self._resumes[resume_id]
+        self._resumes[resume_id] = resume_dict
+        if previous["user_id"] != resume_dict["user_id"]:
+            self._unindex_user(previous["user_id"], resume_id)
+            self._user_index.setdefault(resume_dict["user_id"], set()).add(resume_id)
+
+    def _insert_child(self, name: str, child_id: str, child_dict: dict) -> None:
+        child_dict = stored_value(child_dict)
+        child_dict["_id"] = child_id
+        self._children[name][child_id] = child_dict
+        self._resume_index[name].setdefault(child_dict["resume_id"], {})[child_id] = None
+
+    def _write_children(self, resume: Resume, resume_id: str, name: str, new_child_ids: list) -> None:
+        records = self._children[name]
+        for child_id in resume.removed_child_ids(name):
+            record = records.get(child_id)
+            if record is not None:
+                del records[child_id]
+                self._resume_index[name][record["resume_id"]].pop(child_id, None)
+
+        for child in getattr(resume, name):
+            if not child.id:
+                child_id = str(ObjectId())
+                self._insert_child(name, child_id, self._child_document(child, resume_id))
+                new_child_ids.append((child, child_id))
+            elif child.id not in records:
+                continue
+            elif not child.is_tracked:
+                child_dict = stored_value(self._child_document(child, resume_id))
+                child_dict["_id"] = child.id
+                records[child.id] = child_dict
+            elif child.changed_fields:
+                changes = {field: getattr(child, field) for field in child.changed_fields}
+                records[child.id] = dict(records[child.id], **stored_value(changes))
+
+    def _unindex_user(self, user_id: str, resume_id: str) -> None:
+        resume_ids = self._user_index.get(user_id)
+        if resume_ids is not None:
+            resume_ids.discard(resume_id)
+            if not resume_ids:
+                del self._user_index[user_id]
+
+    def _sort_key(self, resume_id: str) -> Tuple[datetime, str]:
+        return self._resumes[resume_id]["updated_at"], resume_id
+
+    def _user_resume_ids(self, user_id: str) -> List[str]:
+        # USER_RESUMES_SORT: newest first, ties broken on id
+        return sorted(self._user_index.get(user_id, ()), key=self._sort_key, reverse=True)
+
+    def _child_records(self, name: str, resume_id: str) -> List[dict]:
+        records = self._children[name]
+        return [copied_value(records[child_id]) for child_id in self._resume_index[name].get(resume_id, ())]
+
+    def _iter(self, resume_ids: List[str], fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        # Built one at a time, like a cursor; resumes deleted meanwhile are skipped
+        for resume_id in resume_ids:
+            with self._lock:
+                resume = self._load(resume_id, fields) if resume_id in self._resumes else None
+            if resume is not None:
+                yield resume
+
+    def _load(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Resume:
+        resume_dict = self._resumes[resume_id]
+        if fields is not None:
+            # Same fields a Mongo projection would return
+            resume_dict = {key: value for key, value in resume_dict.items()
+                           if key == "_id" or (key in fields and key in DOCUMENT_FIELDS)}
+        child_names = self._child_names(fields)
+        records = [self._child_records(name, resume_id) if name in child_names else [] for name in CHILD_COLLECTIONS]
+        return self._dict_to_resume(copied_value(resume_dict), *records)
@@ -0,0 +1,87 @@
+import atexit
+import os
+import pickle
+import tempfile
+from threading import Event, Thread
+from typing import Dict, Optional
+
+# Bumped when the layout of a repository's state changes
+SNAPSHOT_VERSION = 1
+
+def write_snapshot(path: str, state: dict) -> None:
+    # Written beside the target and renamed over it, so a crash mid-write
+    # leaves the previous snapshot intact
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as snapshot:
+            pickle.dump({"version": SNAPSHOT_VERSION, "state": state}, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def read_snapshot(path: str) -> Optional[dict]:
+    # Snapshots are pickles: only load files this application wrote
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as snapshot:
+        payload = pickle.load(snapshot)
+    if payload.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"{path}: unsupported snapshot version {payload.get('version')}")
+    return payload["state"]
+
+# Writes the in-memory repositories to disk every interval_seconds (never
+# when 0) and once more at interpreter exit. Each process has its own data,
+# so only one process should write a given directory. When the process forks
+# (gunicorn's preload_app builds the app in the master), the child restores
+# the latest snapshot and takes over; the parent serves nothing and stops
+# writing, so its startup state never overwrites what the child saved.
+class MemorySnapshots:
+    def __init__(self, repositories: Dict[str, object], interval_seconds: float = 0.0):
+        # path -> repository with snapshot(path)
+        self.repositories = repositories
+        self.interval_seconds = interval_seconds
+        self._stopped = Event()
+        # pid of the process whose data is written
+        self._owner: Optional[int] = None
+
+    def restore(self) -> None:
+        for path, repository in self.repositories.items():
+            repository.restore(path)
+
+    def start(self) -> None:
+        self._start()
+        atexit.register(self.stop)
+        os.register_at_fork(after_in_parent=self._hand_over, after_in_child=self._take_over)
+
+    def write(self) -> None:
+        for path, repository in self.repositories.items():
+            repository.snapshot(path)
+
+    def stop(self) -> None:
+        if self._owner == os.getpid() and not self._stopped.is_set():
+            self._stopped.set()
+            self.write()
+
+    def _start(self) -> None:
+        self._owner = os.getpid()
+        self._stopped = Event()
+        if self.interval_seconds > 0:
+            Thread(target=self._run, name="memory-snapshots", daemon=True).start()
+
+    def _hand_over(self) -> None:
+        self._owner = None
+        self._stopped.set()
+
+    def _take_over(self) -> None:
+        # Threads do not survive fork; a recycled worker picks up what the
+        # previous one wrote at exit
+        self.restore()
+        self._start()
+
+    def _run(self) -> None:
+        stopped = self._stopped
+        while not stopped.wait(self.interval_seconds):
+            self.write()
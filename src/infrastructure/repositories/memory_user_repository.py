@@ -0,0 +1,72 @@
+from threading import Lock
+from typing import Dict, Optional
+from bson import ObjectId
+from ...domain.models.user import User
+from ...domain.repositories.user_repository import UserRepository
+from .memory_resume_repository import stored_value
+from .memory_snapshots import read_snapshot, write_snapshot
+from .mongodb_user_repository import UserDocumentMapper
+
+# Users kept in process memory as documents, indexed by id and by email. The
+# email index is unique, like the users collection's email_unique index.
+class InMemoryUserRepository(UserDocumentMapper, UserRepository):
+    def __init__(self):
+        self._lock = Lock()
+        self._users: Dict[str, dict] = {}
+        self._email_index: Dict[str, str] = {}
+
+    def save(self, user: User) -> User:
+        user_dict = stored_value(self._user_document(user))
+        with self._lock:
+            owner = self._email_index.get(user.email)
+            if owner is not None and owner != user.id:
+                raise ValueError("Email already registered")
+
+            if user.id:
+                previous = self._users.get(user.id)
+                if previous is None:
+                    # As with update_one: no such user, nothing written
+                    return user
+                del self._email_index[previous["email"]]
+                user_dict["_id"] = user.id
+            else:
+                user_dict["_id"] = str(ObjectId())
+            self._users[user_dict["_id"]] = user_dict
+            self._email_index[user.email] = user_dict["_id"]
+
+        user.id = user_dict["_id"]
+        return user
+
+    def find_or_create(self, user: User) -> User:
+        with self._lock:
+            user_id = self._email_index.get(user.email)
+            if user_id is None:
+                user_dict = stored_value(self._user_document(user))
+                user_id = user_dict["_id"] = str(ObjectId())
+                self._users[user_id] = user_dict
+                self._email_index[user.email] = user_id
+            return self._dict_to_user(self._users[user_id])
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        with self._lock:
+            user_id = self._email_index.get(email)
+            return self._dict_to_user(self._users[user_id]) if user_id is not None else None
+
+    def find_by_id(self, user_id: str) -> Optional[User]:
+        with self._lock:
+            user_dict = self._users.get(user_id)
+            return self._dict_to_user(user_dict) if user_dict is not None else None
+
+    def snapshot(self, path: str) -> None:
+        with self._lock:
+            state = {"users": dict(self._users)}
+        write_snapshot(path, state)
+
+    def restore(self, path: str) -> bool:
+        state = read_snapshot(path)
+        if state is None:
+            return False
+        with self._lock:
+            self._users = dict(state["users"])
+            self._email_index = {user_dict["email"]: user_id for user_id, user_dict in self._users.items()}
+        return True
@@ -0,0 +1,238 @@
+from datetime import datetime
+from typing import Collection, Iterator, List, Optional
+from bson import ObjectId
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import BulkWriteError
+from ...domain.models.resume import Resume
+from .mongodb_resume_repository import MongoDBResumeRepository
+from .mongodb_resume_documents import CHILD_COLLECTIONS, EXPORT_SORT, EXPORT_BATCH_SIZE, document_fields
+
+# Resume documents carrying this version hold their children inline;
+# documents without it still live in the split collections.
+EMBEDDED_SCHEMA_VERSION = 2
+
+class MongoDBEmbeddedResumeRepository(MongoDBResumeRepository):
+    def __init__(self, mongo_client: MongoClient, database_name: str, dual_read: bool = True):
+        super().__init__(mongo_client, database_name)
+        self.dual_read = dual_read
+
+    def save(self, resume: Resume) -> Resume:
+        if resume.id and resume.is_tracked:
+            self._save_changes(resume)
+            resume.mark_clean()
+            return resume
+
+        resume_dict = self._resume_to_document(resume)
+
+        # The whole aggregate is a single document, so this write is atomic
+        if resume.id:
+            result = self.resumes.replace_one(self._id_query(resume.id), resume_dict)
+            if result.matched_count:
+                resume.mark_clean()
+                return resume
+            resume_dict["_id"] = resume.id
+        else:
+            resume_dict["_id"] = str(ObjectId())
+            resume.id = resume_dict["_id"]
+
+        self.resumes.insert_one(resume_dict)
+        resume.mark_clean()
+
+        return resume
+
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        documents = []
+        for resume in resumes:
+            resume_dict = self._resume_to_document(resume)
+            resume_dict["_id"] = str(ObjectId())
+            documents.append(resume_dict)
+        rejected = set()
+        if documents:
+            try:
+                self.resumes.insert_many(documents, ordered=False)
+            except BulkWriteError as error:
+                # One document per resume: the rest of the batch is written
+                rejected = self._rejected_resume_ids("resumes", documents, error)
+
+        for resume, resume_dict in zip(resumes, documents):
+            if resume_dict["_id"] not in rejected:
+                resume.id = resume_dict["_id"]
+                resume.mark_clean()
+        return resumes
+
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        resume_dict = self.resumes.find_one(self._id_query(resume_id), {name: 1, "schema_version": 1})
+        if not resume_dict:
+            return None
+        if resume_dict.get("schema_version") != EMBEDDED_SCHEMA_VERSION:
+            return super().find_children(resume_id, name) if self.dual_read else []
+        return [self._loaded_child(name, record) for record in resume_dict.get(name, [])]
+
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        # $elemMatch projects just the requested entry out of the array
+        resume_dict = self.resumes.find_one(
+            self._id_query(resume_id),
+            {name: {"$elemMatch": {"_id": child_id}}, "schema_version": 1}
+        )
+        if not resume_dict:
+            return None
+        if resume_dict.get("schema_version") != EMBEDDED_SCHEMA_VERSION:
+            return super().find_child(resume_id, name, child_id) if self.dual_read else None
+        records = resume_dict.get(name, [])
+        return self._loaded_child(name, records[0]) if records else None
+
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        child_dict = self._new_child_document(child, resume_id)
+        if not self._push_child(resume_id, name, child_dict, updated_at):
+            if not self.dual_read:
+                return None
+            if not self._insert_split_child(resume_id, name, child_dict, updated_at):
+                if not self._migrated(resume_id):
+                    return None
+                # Migrated between the two writes: the entry belongs in the array,
+                # unless the migration already carried it over
+                self._push_child(resume_id, name, child_dict, updated_at)
+        child.id = child_dict["_id"]
+        child.mark_clean()
+        return child
+
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        # The positional operator sets fields of the entry the query matched
+        resume_dict = self.resumes.find_one_and_update(
+            dict(self._embedded_query(resume_id), **{f"{name}._id": child_id}),
+            self._version_update(updated_at, {f"{name}.$.{field}": value for field, value in changes.items()}),
+            {name: {"$elemMatch": {"_id": child_id}}}, return_document=ReturnDocument.AFTER
+        )
+        if not resume_dict:
+            if not self._read_from_split(resume_id):
+                return None
+            updated = super().update_child(resume_id, name, child_id, changes, updated_at)
+            if updated is None and self._migrated(resume_id):
+                # Migrated between the two writes: setting the fields again is harmless
+                return self.update_child(resume_id, name, child_id, changes, updated_at)
+            return updated
+        records = resume_dict.get(name, [])
+        return self._loaded_child(name, records[0]) if records else None
+
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        result = self.resumes.update_one(
+            dict(self._embedded_query(resume_id), **{f"{name}._id": child_id}),
+            {"$pull": {name: {"_id": child_id}}, **self._version_update(updated_at)}
+        )
+        if not result.matched_count:
+            if not self._read_from_split(resume_id):
+                return False
+            removed = self._remove_split_child(resume_id, name, child_id, updated_at)
+            if removed or not self._migrated(resume_id):
+                return bool(removed)
+            # Migrated meanwhile: the array holds the entry, or the migration
+            # already carried over its removal from the split copy
+            return self.remove_child(resume_id, name, child_id, updated_at) or removed is False
+        return True
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        # Children are inline; only resumes not migrated yet need a lookup
+        query = self._export_query(user_id, updated_since)
+        return self._iter(query, sort=EXPORT_SORT, batch_size=EXPORT_BATCH_SIZE)
+
+    def delete(self, resume_id: str) -> bool:
+        if self.dual_read:
+            # Not migrated yet: the children still live in the split collections
+            for collection in (self.education, self.experience, self.skills):
+                collection.delete_many({"resume_id": resume_id})
+
+        result = self.resumes.delete_one(self._id_query(resume_id))
+        return result.deleted_count > 0
+
+    def _projection(self, fields: Optional[Collection[str]]) -> Optional[dict]:
+        projection = super()._projection(fields)
+        if projection is not None:
+            projection.update({name: 1 for name in fields if name in CHILD_COLLECTIONS})
+            projection["schema_version"] = 1
+        return projection
+
+    def _assemble(self, resume_dicts: List[dict], child_names: Collection[str] = CHILD_COLLECTIONS) -> List[Resume]:
+        split_ids = [
+            str(resume_dict["_id"]) for resume_dict in resume_dicts
+            if resume_dict.get("schema_version") != EMBEDDED_SCHEMA_VERSION
+        ]
+        children = self._load_children(split_ids, child_names) if split_ids and self.dual_read else {}
+
+        resumes = []
+        for resume_dict in resume_dicts:
+            if resume_dict.get("schema_version") == EMBEDDED_SCHEMA_VERSION:
+                records = [resume_dict.pop(name, []) for name in CHILD_COLLECTIONS]
+            else:
+                resume_children = children.get(str(resume_dict["_id"]), {})
+                records = [resume_children.get(name, []) for name in CHILD_COLLECTIONS]
+            resumes.append(self._dict_to_resume(resume_dict, *records))
+        return resumes
+
+    def _save_changes(self, resume: Resume) -> None:
+        changes = self._resume_changes(resume)
+
+        children_changed = any(
+            name in resume.changed_fields
+            or resume.removed_child_ids(name)
+            or any(child.has_changes for child in getattr(resume, name))
+            for name in CHILD_COLLECTIONS
+        )
+        if children_changed:
+            # The arrays are rewritten together, which also embeds a resume
+            # that was still being read from the split collections
+            for name in CHILD_COLLECTIONS:
+                changes[name] = [self._child_to_document(child) for child in getattr(resume, name)]
+            changes["schema_version"] = EMBEDDED_SCHEMA_VERSION
+
+        if changes:
+            self.resumes.update_one(self._id_query(resume.id), {"$set": changes})
+
+    def _read_from_split(self, resume_id: str) -> bool:
+        # Migrated resumes leave their split copies behind: those are never
+        # written once the embedded arrays are authoritative
+        if not self.dual_read:
+            return False
+        resume_dict = self.resumes.find_one(self._id_query(resume_id), {"schema_version": 1})
+        return bool(resume_dict) and resume_dict.get("schema_version") != EMBEDDED_SCHEMA_VERSION
+
+    def _push_child(self, resume_id: str, name: str, child_dict: dict, updated_at: datetime) -> bool:
+        # One $push on the resume document; without dual read, a resume that
+        # was never migrated starts over from the pushed entry, as in save
+        entry = {key: value for key, value in child_dict.items() if key != "resume_id"}
+        result = self.resumes.update_one(
+            dict(self._embedded_query(resume_id), **{f"{name}._id": {"$ne": entry["_id"]}}),
+            {"$push": {name: entry}, **self._version_update(updated_at, {"schema_version": EMBEDDED_SCHEMA_VERSION})}
+        )
+        return result.matched_count > 0
+
+    def _migrated(self, resume_id: str) -> bool:
+        resume_dict = self.resumes.find_one(self._id_query(resume_id), {"schema_version": 1})
+        return bool(resume_dict) and resume_dict.get("schema_version") == EMBEDDED_SCHEMA_VERSION
+
+    def _split_parent_query(self, resume_id: str) -> dict:
+        # A split write to a resume migrated meanwhile is refused, and redone on the arrays
+        return dict(self._id_query(resume_id), schema_version={"$ne": EMBEDDED_SCHEMA_VERSION})
+
+    def _embedded_query(self, resume_id: str) -> dict:
+        query = self._id_query(resume_id)
+        if self.dual_read:
+            # Resumes not migrated yet keep their children in the split collections
+            query["schema_version"] = EMBEDDED_SCHEMA_VERSION
+        return query
+
+    def _resume_to_document(self, resume: Resume) -> dict:
+        resume_dict = self._resume_document(resume)
+        for name in CHILD_COLLECTIONS:
+            resume_dict[name] = [self._child_to_document(child) for child in getattr(resume, name)]
+        resume_dict["schema_version"] = EMBEDDED_SCHEMA_VERSION
+        return resume_dict
+
+    def _child_to_document(self, child) -> dict:
+        # Embedded children keep a stable _id so they can still be addressed individually
+        child_dict = document_fields(child)
+        child_dict["_id"] = child_dict.pop("id", None) or str(ObjectId())
+        child_dict.pop("resume_id", None)
+        if not isinstance(child, dict):
+            child.id = child_dict["_id"]
+        return child_dict
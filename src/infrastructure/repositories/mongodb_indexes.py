@@ -0,0 +1,75 @@
+from typing import Dict, List, NamedTuple, Optional, Set
+from pymongo import IndexModel
+from pymongo.database import Database
+
+class RepositoryQuery(NamedTuple):
+    name: str
+    collection: str
+    filter: dict
+    # Name of the index the query is meant to use
+    index: str
+    sort: Optional[list] = None
+
+class MongoIndexedRepository:
+    # Collection name -> indexes the repository's queries rely on
+    INDEXES: Dict[str, List[IndexModel]] = {}
+
+    db: Database
+
+    def ensure_indexes(self) -> None:
+        # create_indexes is a no-op for indexes that already exist with the same spec
+        for collection_name, indexes in self.INDEXES.items():
+            self.db[collection_name].create_indexes(indexes)
+
+    def missing_indexes(self) -> List[str]:
+        missing = []
+        for collection_name, indexes in self.INDEXES.items():
+            existing = self.db[collection_name].index_information()
+            for index in indexes:
+                name = index.document["name"]
+                if name not in existing:
+                    missing.append(f"{collection_name}.{name}")
+        return missing
+
+    def repository_queries(self) -> List[RepositoryQuery]:
+        # Representative shapes of every query the repository issues
+        return []
+
+    def misplanned_queries(self) -> List[str]:
+        # Queries whose winning plan does not use their index; a scan of some
+        # other index (e.g. _id for a sorted export) is as much a miss as a COLLSCAN
+        misplanned = []
+        for query in self.repository_queries():
+            cursor = self.db[query.collection].find(query.filter)
+            if query.sort:
+                cursor = cursor.sort(query.sort)
+            plan = cursor.explain()["queryPlanner"]["winningPlan"]
+            used = _index_names(plan)
+            if query.index not in used:
+                misplanned.append(f"{query.name} ({query.collection}) uses "
+                                  f"{', '.join(sorted(used)) or 'COLLSCAN'} instead of {query.index}")
+        return misplanned
+
+# Index management for repositories built on the async driver
+class MotorIndexedRepository:
+    INDEXES: Dict[str, List[IndexModel]] = {}
+
+    async def ensure_indexes(self) -> None:
+        for collection_name, indexes in self.INDEXES.items():
+            await self.db[collection_name].create_indexes(indexes)
+
+def _index_names(plan) -> Set[str]:
+    # Plans nest through inputStage/inputStages/queryPlan depending on the server version
+    names = set()
+    if isinstance(plan, dict):
+        if plan.get("indexName"):
+            names.add(plan["indexName"])
+        elif plan.get("stage") in ("IDHACK", "EXPRESS_IDHACK"):
+            # _id equality lookups skip the planner and name no index
+            names.add("_id_")
+        for value in plan.values():
+            names |= _index_names(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            names |= _index_names(value)
+    return names
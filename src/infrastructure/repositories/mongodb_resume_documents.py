@@ -0,0 +1,278 @@
+from dataclasses import fields
+from datetime import datetime
+from typing import Callable, Collection, Dict, List, Optional, Set, Tuple
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne, DeleteMany, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
+from ...domain.models.resume import Resume, Education, Experience, Skill, Contact
+from ...domain.models.serialization import to_dict
+
+CHILD_COLLECTIONS = ("education", "experience", "skills")
+
+CHILD_MODELS = {"education": Education, "experience": Experience, "skills": Skill}
+
+# Listings are newest first; _id breaks ties between equal timestamps
+USER_RESUMES_SORT = [("updated_at", DESCENDING), ("_id", DESCENDING)]
+
+# Exports walk resumes in _id order, with large cursor batches
+EXPORT_SORT = [("_id", ASCENDING)]
+EXPORT_BATCH_SIZE = 1000
+
+# Top-level resume fields that can be written with a plain $set
+RESUME_FIELDS = ("user_id", "title", "summary", "created_at", "updated_at")
+
+# Fields stored on the resume document itself, as opposed to child collections
+DOCUMENT_FIELDS = RESUME_FIELDS + ("contact",)
+
+def document_fields(value) -> Optional[dict]:
+    if value is None:
+        return None
+    # Handlers may hand us plain dicts as well as domain objects
+    return dict(value) if isinstance(value, dict) else to_dict(value)
+
+def _compile_from_document(model: type) -> Callable[[dict], object]:
+    # Generates e.g. `def from_document(doc): return loader(_id(doc.get('_id')),
+    # doc.get('name'), doc.get('level'))`: the record is read in place rather
+    # than copied and re-spread as **kwargs, keys the model does not know
+    # (resume_id) are never read, and the result starts out clean
+    args = []
+    for field in fields(model):
+        if field.name == "id":
+            args.append("_id(doc.get('_id'))")
+        else:
+            args.append(f"doc.get({field.name!r})")
+    source = "def from_document(doc):\n    return loader(" + ", ".join(args) + ")\n"
+    namespace = {"loader": model.loader(), "_id": lambda value: None if value is None else str(value)}
+    exec(source, namespace)
+    return namespace["from_document"]
+
+FROM_DOCUMENT = {model: _compile_from_document(model) for model in (Education, Experience, Skill, Contact)}
+
+# Mapping between the resume aggregate and its Mongo documents, shared by the
+# sync and async repositories. Nothing here performs I/O.
+class ResumeDocumentMapper:
+    def _id_query(self, resume_id: str) -> dict:
+        # Records inserted before ids were stored as strings still carry an ObjectId
+        if ObjectId.is_valid(resume_id):
+            return {"_id": {"$in": [resume_id, ObjectId(resume_id)]}}
+        return {"_id": resume_id}
+
+    def _ids_query(self, ids) -> dict:
+        keys = []
+        for record_id in ids:
+            keys.append(record_id)
+            if ObjectId.is_valid(record_id):
+                keys.append(ObjectId(record_id))
+        return {"_id": {"$in": keys}}
+
+    def _resume_changes(self, resume: Resume) -> dict:
+        changes = {
+            field: getattr(resume, field)
+            for field in RESUME_FIELDS
+            if field in resume.changed_fields
+        }
+
+        contact = resume.contact
+        if "contact" in resume.changed_fields or (contact is not None and not contact.is_tracked):
+            changes["contact"] = document_fields(contact)
+        elif contact is not None:
+            # Contact edited in place: set only the fields that moved
+            for field in contact.changed_fields:
+                changes[f"contact.{field}"] = getattr(contact, field)
+        return changes
+
+    def _plan_writes(self, resume: Resume, resume_id: str) -> Tuple[list, list]:
+        if not resume.id:
+            resume_dict = self._resume_document(resume)
+            # String ids, so the id handed to clients matches the stored _id
+            resume_dict["_id"] = resume_id
+            resume_operations = [InsertOne(resume_dict)]
+        elif resume.is_tracked:
+            # Loaded aggregate: only send what changed since it was read
+            changes = self._resume_changes(resume)
+            resume_operations = [UpdateOne(self._id_query(resume_id), {"$set": changes})] if changes else []
+        else:
+            resume_operations = [UpdateOne(self._id_query(resume_id), {"$set": self._resume_document(resume)})]
+
+        writes = [(self.resumes, resume_operations)]
+        new_child_ids = []
+        for collection, name in ((self.education, "education"), (self.experience, "experience"), (self.skills, "skills")):
+            operations = self._child_operations(resume, resume_id, name, new_child_ids)
+            writes.append((collection, operations))
+        return writes, new_child_ids
+
+    def _plan_inserts(self, resumes: List[Resume]) -> Tuple[Dict[str, List[dict]], list]:
+        # Documents for brand-new resumes, grouped by collection so each
+        # collection takes a single insert_many
+        documents = {name: [] for name in ("resumes",) + CHILD_COLLECTIONS}
+        new_ids = []
+        for resume in resumes:
+            resume_id = str(ObjectId())
+            resume_dict = self._resume_document(resume)
+            resume_dict["_id"] = resume_id
+            documents["resumes"].append(resume_dict)
+            new_ids.append((resume, resume_id, resume_id))
+            for name in CHILD_COLLECTIONS:
+                for child in getattr(resume, name):
+                    child_dict = self._new_child_document(child, resume_id)
+                    documents[name].append(child_dict)
+                    new_ids.append((child, child_dict["_id"], resume_id))
+        return documents, new_ids
+
+    def _rejected_resume_ids(self, name: str, documents: List[dict], error: BulkWriteError) -> Set[str]:
+        # insert_many reports each rejected document by its position in the batch
+        key = "_id" if name == "resumes" else "resume_id"
+        return {documents[write_error["index"]][key] for write_error in error.details.get("writeErrors", [])}
+
+    def _assign_ids(self, resumes: List[Resume], new_ids: list, rejected: Set[str]) -> List[Resume]:
+        # Resumes that were not written keep no id, so callers can tell them apart
+        for model, model_id, resume_id in new_ids:
+            if resume_id not in rejected:
+                model.id = model_id
+        for resume in resumes:
+            if resume.id:
+                resume.mark_clean()
+        return resumes
+
+    def _child_operations(self, resume: Resume, resume_id: str, name: str, new_child_ids: list) -> list:
+        operations = []
+        removed_ids = resume.removed_child_ids(name)
+        if removed_ids:
+            operations.append(DeleteMany(self._ids_query(removed_ids)))
+
+        for child in getattr(resume, name):
+            if not child.id:
+                child_dict = self._new_child_document(child, resume_id)
+                operations.append(InsertOne(child_dict))
+                new_child_ids.append((child, child_dict["_id"]))
+            elif not child.is_tracked:
+                operations.append(UpdateOne(self._id_query(child.id), {"$set": self._child_document(child, resume_id)}))
+            elif child.changed_fields:
+                changes = {field: getattr(child, field) for field in child.changed_fields}
+                operations.append(UpdateOne(self._id_query(child.id), {"$set": changes}))
+        return operations
+
+    def _new_child_document(self, child, resume_id: str) -> dict:
+        child_dict = self._child_document(child, resume_id)
+        child_dict["_id"] = str(ObjectId())
+        return child_dict
+
+    def _version_update(self, updated_at: datetime, changes: Optional[dict] = None) -> dict:
+        # Every write to a part of the resume moves its version along. The
+        # revision counter changes atomically with it, unlike the client-set
+        # millisecond timestamp, for writers that must detect any write in between
+        return {"$set": dict(changes or {}, updated_at=updated_at), "$inc": {"revision": 1}}
+
+    def _contact_changes(self, changes: dict) -> dict:
+        return {f"contact.{field}": value for field, value in changes.items()}
+
+    def _contact_query(self, resume_id: str) -> dict:
+        # Dotted $set cannot create fields inside a null contact
+        return dict(self._id_query(resume_id), contact={"$type": "object"})
+
+    def _loaded_contact(self, resume_dict: Optional[dict]) -> Optional[Contact]:
+        contact = resume_dict.get("contact") if resume_dict else None
+        return FROM_DOCUMENT[Contact](contact) if contact else None
+
+    def _resume_document(self, resume: Resume) -> dict:
+        return {
+            "user_id": resume.user_id,
+            "title": resume.title,
+            "contact": document_fields(resume.contact),
+            "summary": resume.summary,
+            "created_at": resume.created_at,
+            "updated_at": resume.updated_at
+        }
+
+    def _child_document(self, child, resume_id: str) -> dict:
+        child_dict = document_fields(child)
+        child_dict.pop("id", None)
+        child_dict["resume_id"] = resume_id
+        return child_dict
+
+    def _export_query(self, user_id: Optional[str], updated_since: Optional[datetime]) -> dict:
+        query = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if updated_since is not None:
+            query["updated_at"] = {"$gte": updated_since}
+        return query
+
+    def _page_query(self, user_id: str, after: Optional[Tuple[datetime, str]]) -> dict:
+        query = {"user_id": user_id}
+        if after is None:
+            return query
+        updated_at, resume_id = after
+        # Keyset on USER_RESUMES_SORT: the bound on updated_at keeps the scan a
+        # single range on the user_id_updated_at index, so a deep page starts
+        # where the previous one ended instead of skipping over it. Ties are
+        # broken on the string _id; a legacy ObjectId _id sharing its exact
+        # millisecond with other resumes of the user is the one case this
+        # ordering cannot resume from precisely.
+        query["updated_at"] = {"$lte": updated_at}
+        query["$or"] = [{"updated_at": {"$lt": updated_at}}, {"_id": {"$lt": resume_id}}]
+        return query
+
+    def _child_names(self, fields: Optional[Collection[str]]) -> List[str]:
+        # Child collections nobody asked for are never queried
+        return [name for name in CHILD_COLLECTIONS if fields is None or name in fields]
+
+    def _projection(self, fields: Optional[Collection[str]]) -> Optional[dict]:
+        if fields is None:
+            return None
+        # _id always comes back; an empty projection would return everything
+        projection = {name: 1 for name in fields if name in DOCUMENT_FIELDS}
+        projection["_id"] = 1
+        return projection
+
+    def _lookup_pipeline(self, query: dict, sort: Optional[list] = None, projection: Optional[dict] = None,
+                         child_names: Collection[str] = CHILD_COLLECTIONS, limit: int = 0) -> List[dict]:
+        pipeline = [{"$match": query}]
+        if sort:
+            pipeline.append({"$sort": dict(sort)})
+        if limit:
+            pipeline.append({"$limit": limit})
+        if projection:
+            pipeline.append({"$project": projection})
+        for name in child_names:
+            # Children reference the parent by the string form of its _id
+            pipeline.append({
+                "$lookup": {
+                    "from": name,
+                    "let": {"resume_id": {"$toString": "$_id"}},
+                    "pipeline": [{"$match": {"$expr": {"$eq": ["$resume_id", "$$resume_id"]}}}],
+                    "as": name
+                }
+            })
+        return pipeline
+
+    def _dict_to_resume(self, resume_dict: dict, education_records: List[dict], 
+                       experience_records: List[dict], skill_records: List[dict]) -> Resume:
+        education_from_document = FROM_DOCUMENT[Education]
+        experience_from_document = FROM_DOCUMENT[Experience]
+        skill_from_document = FROM_DOCUMENT[Skill]
+        contact = resume_dict.get("contact")
+
+        # Fields left out by a projection stay None
+        resume = Resume(
+            str(resume_dict["_id"]),
+            resume_dict.get("user_id"),
+            resume_dict.get("title"),
+            FROM_DOCUMENT[Contact](contact) if contact else None,
+            resume_dict.get("summary"),
+            [education_from_document(record) for record in education_records],
+            [experience_from_document(record) for record in experience_records],
+            [skill_from_document(record) for record in skill_records],
+            resume_dict.get("created_at"),
+            resume_dict.get("updated_at")
+        )
+        # Start tracking changes from the state that was read; contact and
+        # children were built clean
+        resume.mark_clean(deep=False)
+        return resume
+
+    def _loaded_child(self, name: str, record: dict):
+        return FROM_DOCUMENT[CHILD_MODELS[name]](record)
+
+    def _record_to_child(self, model, record: dict):
+        return FROM_DOCUMENT[model](record)
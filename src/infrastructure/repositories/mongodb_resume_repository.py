@@ -1,11 +1,44 @@
-from typing import List, Optional
-from pymongo import MongoClient
-from datetime import datetime
-from ...domain.models.resume import Resume, Education, Experience, Skill, Contact
+from typing import Callable, Collection, Dict, Iterator, List, Optional, Set, Tuple
+from bson import ObjectId
+from pymongo import MongoClient, IndexModel, ReturnDocument, ASCENDING
+from pymongo.errors import BulkWriteError
+from datetime import datetime, timedelta, UTC
+from ...domain.models.resume import Resume, Contact
 from ...domain.repositories.resume_repository import ResumeRepository
+from .child_fetch_pool import ChildFetchPool
+from .mongodb_indexes import MongoIndexedRepository, RepositoryQuery
+from .mongodb_resume_documents import (
+    ResumeDocumentMapper, CHILD_COLLECTIONS, USER_RESUMES_SORT, EXPORT_SORT, EXPORT_BATCH_SIZE, document_fields
+)
 
-class MongoDBResumeRepository(ResumeRepository):
-    def __init__(self, mongo_client: MongoClient, database_name: str):
+# "batched" issues one query per child collection with $in over all resume ids,
+# "lookup" builds the whole aggregate server-side with a single aggregation.
+LOAD_MODES = ("batched", "lookup")
+
+STREAM_BATCH_SIZE = 100
+
+class MongoDBResumeRepository(MongoIndexedRepository, ResumeDocumentMapper, ResumeRepository):
+    INDEXES = {
+        "resumes": [
+            IndexModel([("user_id", ASCENDING)] + USER_RESUMES_SORT, name="user_id_updated_at"),
+            # Exports and search index catch-ups of what changed since a point in time
+            IndexModel([("updated_at", ASCENDING)], name="updated_at")
+        ],
+        "education": [IndexModel([("resume_id", ASCENDING)], name="resume_id")],
+        "experience": [IndexModel([("resume_id", ASCENDING)], name="resume_id")],
+        "skills": [IndexModel([("resume_id", ASCENDING)], name="resume_id")]
+    }
+
+    def __init__(self, mongo_client: MongoClient, database_name: str, load_mode: str = "batched",
+                 use_transactions: bool = False, child_fetch_pool: Optional[ChildFetchPool] = None):
+        if load_mode not in LOAD_MODES:
+            raise ValueError(f"Unknown load mode: {load_mode}")
+        self.load_mode = load_mode
+        # Multi-document transactions need a replica set or sharded cluster
+        self.use_transactions = use_transactions
+        # Opt-in: child collections are read concurrently on this shared pool
+        self.child_fetch_pool = child_fetch_pool
+        self.mongo_client = mongo_client
         self.db = mongo_client[database_name]
         self.resumes = self.db.resumes
         self.education = self.db.education
@@ -13,74 +46,127 @@ class MongoDBResumeRepository(ResumeRepository):
         self.skills = self.db.skills
 
     def save(self, resume: Resume) -> Resume:
-        resume_dict = {
-            "user_id": resume.user_id,
-            "title": resume.title,
-            "contact": resume.contact.__dict__,
-            "summary": resume.summary,
-            "created_at": resume.created_at,
-            "updated_at": resume.updated_at
-        }
-
-        if resume.id:
-            self.resumes.update_one({"_id": resume.id}, {"$set": resume_dict})
+        # Ids are only assigned once the writes went through, so a retried
+        # transaction replays exactly the same operations
+        resume_id = resume.id or str(ObjectId())
+        writes, new_child_ids = self._plan_writes(resume, resume_id)
+
+        if self.use_transactions:
+            with self.mongo_client.start_session() as session:
+                session.with_transaction(lambda session: self._apply_writes(writes, session))
         else:
-            result = self.resumes.insert_one(resume_dict)
-            resume.id = str(result.inserted_id)
-
-        # Save education records
-        for edu in resume.education:
-            edu_dict = edu.__dict__
-            edu_dict["resume_id"] = resume.id
-            if hasattr(edu, "id") and edu.id:
-                self.education.update_one({"_id": edu.id}, {"$set": edu_dict})
-            else:
-                result = self.education.insert_one(edu_dict)
-                edu.id = str(result.inserted_id)
-
-        # Save experience records
-        for exp in resume.experience:
-            exp_dict = exp.__dict__
-            exp_dict["resume_id"] = resume.id
-            if hasattr(exp, "id") and exp.id:
-                self.experience.update_one({"_id": exp.id}, {"$set": exp_dict})
-            else:
-                result = self.experience.insert_one(exp_dict)
-                exp.id = str(result.inserted_id)
-
-        # Save skills records
-        for skill in resume.skills:
-            skill_dict = skill.__dict__
-            skill_dict["resume_id"] = resume.id
-            if hasattr(skill, "id") and skill.id:
-                self.skills.update_one({"_id": skill.id}, {"$set": skill_dict})
-            else:
-                result = self.skills.insert_one(skill_dict)
-                skill.id = str(result.inserted_id)
+            self._apply_writes(writes)
 
+        resume.id = resume_id
+        for child, child_id in new_child_ids:
+            child.id = child_id
+        resume.mark_clean()
         return resume
 
-    def find_by_id(self, resume_id: str) -> Optional[Resume]:
-        resume_dict = self.resumes.find_one({"_id": resume_id})
-        if not resume_dict:
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        documents, new_ids = self._plan_inserts(resumes)
+
+        if self.use_transactions:
+            try:
+                with self.mongo_client.start_session() as session:
+                    session.with_transaction(lambda session: self._insert_documents(documents, session))
+                rejected = set()
+            except BulkWriteError:
+                # The transaction took the whole batch back out
+                rejected = {resume_dict["_id"] for resume_dict in documents["resumes"]}
+        else:
+            rejected = self._insert_documents(documents)
+
+        return self._assign_ids(resumes, new_ids, rejected)
+
+    def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        if self.child_fetch_pool and self.load_mode == "batched":
+            return self._find_by_id_parallel(resume_id, fields)
+        resumes = self._load(self._id_query(resume_id), fields=fields)
+        return resumes[0] if resumes else None
+
+    def find_by_ids(self, resume_ids: Collection[str]) -> List[Resume]:
+        return self._load(self._ids_query(resume_ids)) if resume_ids else []
+
+    def find_version(self, resume_id: str) -> Optional[datetime]:
+        # Only the version field travels; no children are read
+        resume_dict = self.resumes.find_one(self._id_query(resume_id), {"updated_at": 1})
+        return resume_dict["updated_at"] if resume_dict else None
+
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        records = list(self.db[name].find({"resume_id": resume_id}))
+        # No children: tell an empty resume apart from a missing one
+        if not records and not self.resumes.find_one(self._id_query(resume_id), {"_id": 1}):
             return None
+        return [self._loaded_child(name, record) for record in records]
 
-        # Get related records
-        education_records = list(self.education.find({"resume_id": resume_id}))
-        experience_records = list(self.experience.find({"resume_id": resume_id}))
-        skill_records = list(self.skills.find({"resume_id": resume_id}))
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        # Scoping by resume_id doubles as the existence check on the parent
+        record = self.db[name].find_one(dict(self._id_query(child_id), resume_id=resume_id))
+        return self._loaded_child(name, record) if record else None
 
-        return self._dict_to_resume(resume_dict, education_records, experience_records, skill_records)
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        child_dict = self._new_child_document(child, resume_id)
+        if not self._write(lambda session: self._insert_split_child(resume_id, name, child_dict, updated_at, session)):
+            return None
+        child.id = child_dict["_id"]
+        child.mark_clean()
+        return child
+
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        def write(session):
+            record = self.db[name].find_one_and_update(
+                dict(self._id_query(child_id), resume_id=resume_id), {"$set": changes},
+                return_document=ReturnDocument.AFTER, session=session
+            )
+            if not record:
+                return None
+            result = self.resumes.update_one(self._split_parent_query(resume_id), self._version_update(updated_at),
+                                             session=session)
+            return record if result.matched_count else None
+
+        record = self._write(write)
+        return self._loaded_child(name, record) if record else None
 
-    def find_by_user_id(self, user_id: str) -> List[Resume]:
-        resumes = []
-        for resume_dict in self.resumes.find({"user_id": user_id}):
-            resume_id = str(resume_dict["_id"])
-            education_records = list(self.education.find({"resume_id": resume_id}))
-            experience_records = list(self.experience.find({"resume_id": resume_id}))
-            skill_records = list(self.skills.find({"resume_id": resume_id}))
-            resumes.append(self._dict_to_resume(resume_dict, education_records, experience_records, skill_records))
-        return resumes
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        return bool(self._write(
+            lambda session: self._remove_split_child(resume_id, name, child_id, updated_at, session)
+        ))
+
+    def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        # The contact lives on the resume document: one write, and only the contact comes back
+        resume_dict = self.resumes.find_one_and_update(
+            self._contact_query(resume_id), self._version_update(updated_at, self._contact_changes(changes)),
+            {"contact": 1}, return_document=ReturnDocument.AFTER
+        )
+        return self._loaded_contact(resume_dict)
+
+    def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        result = self.resumes.update_one(
+            self._id_query(resume_id), self._version_update(updated_at, {"contact": document_fields(contact)})
+        )
+        if not result.matched_count:
+            return None
+        contact.mark_clean()
+        return contact
+
+    def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self._load({"user_id": user_id}, sort=USER_RESUMES_SORT, fields=fields)
+
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        return self._iter({"user_id": user_id}, sort=USER_RESUMES_SORT, fields=fields)
+
+    def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                            fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self._load(self._page_query(user_id, after), sort=USER_RESUMES_SORT, fields=fields, limit=limit)
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        query = self._export_query(user_id, updated_since)
+        if query:
+            # A filtered export reads a slice of the resumes: look its children up by id
+            return self._iter(query, sort=EXPORT_SORT, batch_size=EXPORT_BATCH_SIZE)
+        return self._merge_join_all()
 
     def delete(self, resume_id: str) -> bool:
         # Delete related records first
@@ -89,51 +175,190 @@ class MongoDBResumeRepository(ResumeRepository):
         self.skills.delete_many({"resume_id": resume_id})
         
         # Delete the resume
-        result = self.resumes.delete_one({"_id": resume_id})
+        result = self.resumes.delete_one(self._id_query(resume_id))
         return result.deleted_count > 0
 
-    def _dict_to_resume(self, resume_dict: dict, education_records: List[dict], 
-                       experience_records: List[dict], skill_records: List[dict]) -> Resume:
-        # Transform MongoDB records to domain models by mapping _id to id
-        education_list = []
-        for edu in education_records:
-            edu_copy = edu.copy()
-            if "_id" in edu_copy:
-                edu_copy["id"] = str(edu_copy.pop("_id"))
-            # Remove resume_id as it's not part of the Education model
-            if "resume_id" in edu_copy:
-                edu_copy.pop("resume_id")
-            education_list.append(Education(**edu_copy))
-            
-        experience_list = []
-        for exp in experience_records:
-            exp_copy = exp.copy()
-            if "_id" in exp_copy:
-                exp_copy["id"] = str(exp_copy.pop("_id"))
-            # Remove resume_id as it's not part of the Experience model
-            if "resume_id" in exp_copy:
-                exp_copy.pop("resume_id")
-            experience_list.append(Experience(**exp_copy))
-            
-        skill_list = []
-        for skill in skill_records:
-            skill_copy = skill.copy()
-            if "_id" in skill_copy:
-                skill_copy["id"] = str(skill_copy.pop("_id"))
-            # Remove resume_id as it's not part of the Skill model
-            if "resume_id" in skill_copy:
-                skill_copy.pop("resume_id")
-            skill_list.append(Skill(**skill_copy))
-        
-        return Resume(
-            id=str(resume_dict["_id"]),
-            user_id=resume_dict["user_id"],
-            title=resume_dict["title"],
-            contact=Contact(**resume_dict["contact"]),
-            summary=resume_dict["summary"],
-            education=education_list,
-            experience=experience_list,
-            skills=skill_list,
-            created_at=resume_dict["created_at"],
-            updated_at=resume_dict["updated_at"]
-        ) 
\ No newline at end of file
+    def _insert_split_child(self, resume_id: str, name: str, child_dict: dict, updated_at: datetime,
+                            session=None) -> bool:
+        # The entry goes in first and the parent's revision moves last, so a
+        # migration that read the resume before the entry sees it move
+        self.db[name].insert_one(child_dict, session=session)
+        result = self.resumes.update_one(self._split_parent_query(resume_id), self._version_update(updated_at),
+                                         session=session)
+        if not result.matched_count:
+            # No such resume: take the entry back out
+            self.db[name].delete_one({"_id": child_dict["_id"]}, session=session)
+        return result.matched_count > 0
+
+    def _remove_split_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime,
+                            session=None) -> Optional[bool]:
+        # None when there is no such entry, otherwise whether the parent's revision moved
+        result = self.db[name].delete_one(dict(self._id_query(child_id), resume_id=resume_id), session=session)
+        if not result.deleted_count:
+            return None
+        result = self.resumes.update_one(self._split_parent_query(resume_id), self._version_update(updated_at),
+                                         session=session)
+        return result.matched_count > 0
+
+    def _split_parent_query(self, resume_id: str) -> dict:
+        # The resume whose revision a write to the split collections moves
+        return self._id_query(resume_id)
+
+    def _write(self, write: Callable):
+        # Writes that depend on each other's outcome, in one transaction when enabled
+        if self.use_transactions:
+            with self.mongo_client.start_session() as session:
+                return session.with_transaction(write)
+        return write(None)
+
+    def _apply_writes(self, writes: list, session=None) -> None:
+        # One bulk_write per collection instead of one round trip per record
+        for collection, operations in writes:
+            if operations:
+                collection.bulk_write(operations, ordered=True, session=session)
+
+    def _insert_documents(self, documents: Dict[str, List[dict]], session=None) -> Set[str]:
+        # Parents first, so no reader sees children of a resume that is not there yet.
+        # Outside a transaction the rest of the batch still goes in: returns the ids
+        # of resumes with a rejected document, whose other documents are taken out again
+        rejected = set()
+        for name, collection_documents in documents.items():
+            collection_documents = [document for document in collection_documents
+                                    if document.get("resume_id") not in rejected]
+            if collection_documents:
+                try:
+                    self.db[name].insert_many(collection_documents, ordered=False, session=session)
+                except BulkWriteError as error:
+                    if session is not None:
+                        raise
+                    rejected |= self._rejected_resume_ids(name, collection_documents, error)
+        if rejected:
+            for name in CHILD_COLLECTIONS:
+                self.db[name].delete_many({"resume_id": {"$in": list(rejected)}})
+            self.resumes.delete_many({"_id": {"$in": list(rejected)}})
+        return rejected
+
+    def repository_queries(self) -> List[RepositoryQuery]:
+        queries = [
+            RepositoryQuery("find_by_id", "resumes", self._id_query(str(ObjectId())), "_id_"),
+            RepositoryQuery("find_by_user_id", "resumes", {"user_id": "probe"}, "user_id_updated_at", USER_RESUMES_SORT),
+            RepositoryQuery("find_page_by_user_id", "resumes",
+                            self._page_query("probe", (datetime(2000, 1, 1), str(ObjectId()))),
+                            "user_id_updated_at", USER_RESUMES_SORT)
+        ]
+        # Shaped like an incremental export or search catch-up: a recent slice, not the whole collection
+        updated_since = datetime.now(UTC) - timedelta(hours=1)
+        queries.append(RepositoryQuery("iter_all", "resumes", self._export_query(None, updated_since),
+                                       "updated_at", EXPORT_SORT))
+        for name in CHILD_COLLECTIONS:
+            queries.append(RepositoryQuery("load children", name, {"resume_id": {"$in": ["probe"]}}, "resume_id"))
+            queries.append(RepositoryQuery("delete children", name, {"resume_id": "probe"}, "resume_id"))
+            queries.append(RepositoryQuery("export children", name, {}, "resume_id", [("resume_id", ASCENDING)]))
+        return queries
+
+    def _find_by_id_parallel(self, resume_id: str, fields: Optional[Collection[str]]) -> Optional[Resume]:
+        # Children carry the id as given, so they are read alongside the parent
+        # and the lookup costs about one round trip instead of four
+        child_names = self._child_names(fields)
+        calls = [lambda name=name: list(self.db[name].find({"resume_id": resume_id})) for name in child_names]
+        calls.append(lambda: self.resumes.find_one(self._id_query(resume_id), self._projection(fields)))
+        *records, resume_dict = self.child_fetch_pool.map(calls)
+        if not resume_dict:
+            return None
+        children = {name: [] for name in CHILD_COLLECTIONS}
+        children.update(zip(child_names, records))
+        return self._dict_to_resume(resume_dict, *children.values())
+
+    def _merge_join_all(self) -> Iterator[Resume]:
+        # Full export: resumes in _id order are zipped with each child
+        # collection read in resume_id order, one sequential pass over every
+        # collection and no per-resume queries. String ids and legacy ObjectIds
+        # do not sort together, so each kind gets its own pass.
+        for id_type in ("string", "objectId"):
+            query = {"_id": {"$type": id_type}}
+            if not self.resumes.find_one(query, {"_id": 1}):
+                continue
+            cursor = self.resumes.find(query).sort(EXPORT_SORT).batch_size(EXPORT_BATCH_SIZE)
+            children = {
+                name: SortedChildren(
+                    self.db[name].find().sort("resume_id", ASCENDING).batch_size(EXPORT_BATCH_SIZE)
+                )
+                for name in CHILD_COLLECTIONS
+            }
+            for resume_dict in cursor:
+                resume_id = str(resume_dict["_id"])
+                records = [children[name].take(resume_id) for name in CHILD_COLLECTIONS]
+                yield self._dict_to_resume(resume_dict, *records)
+
+    def _load(self, query: dict, sort: Optional[list] = None, fields: Optional[Collection[str]] = None,
+              limit: int = 0) -> List[Resume]:
+        return list(self._iter(query, sort=sort, fields=fields, limit=limit))
+
+    def _iter(self, query: dict, sort: Optional[list] = None, fields: Optional[Collection[str]] = None,
+              batch_size: int = STREAM_BATCH_SIZE, limit: int = 0) -> Iterator[Resume]:
+        child_names = self._child_names(fields)
+
+        # Resumes are assembled one cursor batch at a time, so memory stays bounded
+        # by batch_size however many resumes match
+        if self.load_mode == "lookup":
+            pipeline = self._lookup_pipeline(query, sort, self._projection(fields), child_names, limit)
+            for resume_dict in self.resumes.aggregate(pipeline, batchSize=batch_size):
+                records = {name: resume_dict.pop(name, []) for name in CHILD_COLLECTIONS}
+                yield self._dict_to_resume(resume_dict, *records.values())
+            return
+
+        cursor = self.resumes.find(query, self._projection(fields)).batch_size(batch_size)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        batch = []
+        for resume_dict in cursor:
+            batch.append(resume_dict)
+            if len(batch) == batch_size:
+                yield from self._assemble(batch, child_names)
+                batch = []
+        if batch:
+            yield from self._assemble(batch, child_names)
+
+    def _assemble(self, resume_dicts: List[dict], child_names: Collection[str] = CHILD_COLLECTIONS) -> List[Resume]:
+        children = self._load_children([str(resume_dict["_id"]) for resume_dict in resume_dicts], child_names)
+        return [
+            self._dict_to_resume(resume_dict, *children[str(resume_dict["_id"])].values())
+            for resume_dict in resume_dicts
+        ]
+
+    def _load_children(self, resume_ids: List[str],
+                       child_names: Collection[str] = CHILD_COLLECTIONS) -> Dict[str, Dict[str, List[dict]]]:
+        # One query per requested child collection, whatever the number of resumes
+        children = {resume_id: {name: [] for name in CHILD_COLLECTIONS} for resume_id in resume_ids}
+        if not resume_ids:
+            return children
+
+        calls = [lambda name=name: list(self.db[name].find({"resume_id": {"$in": resume_ids}})) for name in child_names]
+        if self.child_fetch_pool:
+            results = self.child_fetch_pool.map(calls)
+        else:
+            results = [call() for call in calls]
+
+        for name, records in zip(child_names, results):
+            for record in records:
+                children[record["resume_id"]][name].append(record)
+        return children
+
+class SortedChildren:
+    # Child records in resume_id order, handed out one resume at a time
+    def __init__(self, cursor):
+        self._cursor = iter(cursor)
+        self._next = next(self._cursor, None)
+
+    def take(self, resume_id: str) -> List[dict]:
+        records = []
+        # Records of resumes that no longer exist sort in between and are skipped
+        while self._next is not None and self._next["resume_id"] < resume_id:
+            self._next = next(self._cursor, None)
+        while self._next is not None and self._next["resume_id"] == resume_id:
+            records.append(self._next)
+            self._next = next(self._cursor, None)
+        return records
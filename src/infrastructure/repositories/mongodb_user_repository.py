@@ -1,15 +1,22 @@
-from typing import Optional
-from pymongo import MongoClient
+from typing import List, Optional
+from bson import ObjectId
+from pymongo import MongoClient, IndexModel, ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from ...domain.models.user import User, UserRole
 from ...domain.repositories.user_repository import UserRepository
+from .mongodb_indexes import MongoIndexedRepository, RepositoryQuery
 
-class MongoDBUserRepository(UserRepository):
-    def __init__(self, mongo_client: MongoClient, database_name: str):
-        self.db = mongo_client[database_name]
-        self.collection = self.db.users
+# Emails held by more than one user, as left behind by the old find-then-insert login
+DUPLICATE_EMAILS_PIPELINE = [
+    {"$group": {"_id": "$email", "count": {"$sum": 1}}},
+    {"$match": {"count": {"$gt": 1}}},
+    {"$limit": 10}
+]
 
-    def save(self, user: User) -> User:
-        user_dict = {
+# Mapping between users and their documents, shared with the async repository
+class UserDocumentMapper:
+    def _user_document(self, user: User) -> dict:
+        return {
             "email": user.email,
             "password_hash": user.password_hash,
             "role": user.role,
@@ -17,6 +24,51 @@ class MongoDBUserRepository(UserRepository):
             "updated_at": user.updated_at
         }
 
+    def _upsert_by_email_args(self, user: User) -> tuple:
+        user_dict = self._user_document(user)
+        user_dict["_id"] = str(ObjectId())
+        del user_dict["email"]
+        return {"email": user.email}, {"$setOnInsert": user_dict}
+
+    def _index_build_failed(self, error: OperationFailure, duplicates: List[dict]) -> None:
+        if error.code != 11000:
+            raise error
+        # The upsert login relies on the index to keep concurrent first logins
+        # to one user: refuse to start without it, saying what is in the way
+        raise RuntimeError(
+            "Unique index email_unique cannot be built: users holds duplicate emails ("
+            + ", ".join(f"{duplicate['_id']} x{duplicate['count']}" for duplicate in duplicates)
+            + "). Merge or delete the duplicate users, then start again or run manage_indexes."
+        ) from error
+
+    def _dict_to_user(self, user_dict: dict) -> User:
+        return User(
+            id=str(user_dict["_id"]),
+            email=user_dict["email"],
+            password_hash=user_dict["password_hash"],
+            role=UserRole(user_dict["role"]),
+            created_at=user_dict["created_at"],
+            updated_at=user_dict["updated_at"]
+        )
+
+class MongoDBUserRepository(MongoIndexedRepository, UserDocumentMapper, UserRepository):
+    INDEXES = {
+        "users": [IndexModel([("email", ASCENDING)], unique=True, name="email_unique")]
+    }
+
+    def __init__(self, mongo_client: MongoClient, database_name: str):
+        self.db = mongo_client[database_name]
+        self.collection = self.db.users
+
+    def ensure_indexes(self) -> None:
+        try:
+            super().ensure_indexes()
+        except OperationFailure as error:
+            self._index_build_failed(error, list(self.collection.aggregate(DUPLICATE_EMAILS_PIPELINE)))
+
+    def save(self, user: User) -> User:
+        user_dict = self._user_document(user)
+
         if user.id:
             self.collection.update_one({"_id": user.id}, {"$set": user_dict})
         else:
@@ -25,6 +77,16 @@ class MongoDBUserRepository(UserRepository):
 
         return user
 
+    def find_or_create(self, user: User) -> User:
+        # Single round trip for new and returning users alike; the unique
+        # email index makes concurrent first logins converge on one document
+        try:
+            user_dict = self._upsert_by_email(user)
+        except DuplicateKeyError:
+            # Lost the insert race: the winner's document is there now
+            user_dict = self._upsert_by_email(user)
+        return self._dict_to_user(user_dict)
+
     def find_by_email(self, email: str) -> Optional[User]:
         user_dict = self.collection.find_one({"email": email})
         if user_dict:
@@ -37,12 +99,15 @@ class MongoDBUserRepository(UserRepository):
             return self._dict_to_user(user_dict)
         return None
 
-    def _dict_to_user(self, user_dict: dict) -> User:
-        return User(
-            id=str(user_dict["_id"]),
-            email=user_dict["email"],
-            password_hash=user_dict["password_hash"],
-            role=UserRole(user_dict["role"]),
-            created_at=user_dict["created_at"],
-            updated_at=user_dict["updated_at"]
-        ) 
\ No newline at end of file
+    def _upsert_by_email(self, user: User) -> dict:
+        return self.collection.find_one_and_update(
+            *self._upsert_by_email_args(user),
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    def repository_queries(self) -> List[RepositoryQuery]:
+        return [
+            RepositoryQuery("find_by_email", "users", {"email": "probe"}, "email_unique"),
+            RepositoryQuery("find_by_id", "users", {"_id": "probe"}, "_id_")
+        ]
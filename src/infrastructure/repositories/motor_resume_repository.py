@@ -0,0 +1,277 @@
+import asyncio
+from typing import AsyncIterator, Callable, Collection, Dict, List, Optional, Set, Tuple
+from bson import ObjectId
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+from ...domain.models.resume import Resume, Contact
+from ...domain.repositories.async_resume_repository import AsyncResumeRepository
+from .mongodb_indexes import MotorIndexedRepository
+from .mongodb_resume_documents import (
+    ResumeDocumentMapper, CHILD_COLLECTIONS, USER_RESUMES_SORT, EXPORT_SORT, EXPORT_BATCH_SIZE, document_fields
+)
+from .mongodb_resume_repository import MongoDBResumeRepository, LOAD_MODES, STREAM_BATCH_SIZE
+
+# Split-layout resume repository on the async driver. Queries that do not
+# depend on each other's results are issued concurrently, so a request waits
+# for the slowest round trip rather than for their sum.
+class MotorResumeRepository(MotorIndexedRepository, ResumeDocumentMapper, AsyncResumeRepository):
+    INDEXES = MongoDBResumeRepository.INDEXES
+
+    def __init__(self, mongo_client: AsyncIOMotorClient, database_name: str, load_mode: str = "batched",
+                 use_transactions: bool = False):
+        if load_mode not in LOAD_MODES:
+            raise ValueError(f"Unknown load mode: {load_mode}")
+        self.load_mode = load_mode
+        self.use_transactions = use_transactions
+        self.mongo_client = mongo_client
+        self.db = mongo_client[database_name]
+        self.resumes = self.db.resumes
+        self.education = self.db.education
+        self.experience = self.db.experience
+        self.skills = self.db.skills
+
+    async def save(self, resume: Resume) -> Resume:
+        resume_id = resume.id or str(ObjectId())
+        writes, new_child_ids = self._plan_writes(resume, resume_id)
+
+        if self.use_transactions:
+            async with await self.mongo_client.start_session() as session:
+                await session.with_transaction(lambda session: self._apply_writes(writes, session))
+        else:
+            await self._apply_writes(writes)
+
+        resume.id = resume_id
+        for child, child_id in new_child_ids:
+            child.id = child_id
+        resume.mark_clean()
+        return resume
+
+    async def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        documents, new_ids = self._plan_inserts(resumes)
+
+        if self.use_transactions:
+            try:
+                async with await self.mongo_client.start_session() as session:
+                    await session.with_transaction(lambda session: self._insert_documents(documents, session))
+                rejected = set()
+            except BulkWriteError:
+                rejected = {resume_dict["_id"] for resume_dict in documents["resumes"]}
+        else:
+            rejected = await self._insert_documents(documents)
+
+        return self._assign_ids(resumes, new_ids, rejected)
+
+    async def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        if self.load_mode == "lookup":
+            resumes = await self._load(self._id_query(resume_id), fields=fields)
+            return resumes[0] if resumes else None
+
+        # Children carry the id as given, so they can be read alongside the parent
+        child_names = self._child_names(fields)
+        resume_dict, *records = await asyncio.gather(
+            self.resumes.find_one(self._id_query(resume_id), self._projection(fields)),
+            *(self._find_records(name, {"resume_id": resume_id}) for name in child_names)
+        )
+        if not resume_dict:
+            return None
+        children = {name: [] for name in CHILD_COLLECTIONS}
+        children.update(zip(child_names, records))
+        return self._dict_to_resume(resume_dict, *children.values())
+
+    async def find_version(self, resume_id: str) -> Optional[datetime]:
+        resume_dict = await self.resumes.find_one(self._id_query(resume_id), {"updated_at": 1})
+        return resume_dict["updated_at"] if resume_dict else None
+
+    async def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        records, resume_dict = await asyncio.gather(
+            self._find_records(name, {"resume_id": resume_id}),
+            self.resumes.find_one(self._id_query(resume_id), {"_id": 1})
+        )
+        if not resume_dict:
+            return None
+        return [self._loaded_child(name, record) for record in records]
+
+    async def find_child(self, resume_id: str, name: str, child_id: str):
+        record = await self.db[name].find_one(dict(self._id_query(child_id), resume_id=resume_id))
+        return self._loaded_child(name, record) if record else None
+
+    async def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        child_dict = self._new_child_document(child, resume_id)
+
+        async def write(session):
+            # The entry goes in first and the parent's revision moves last, as in the sync repository
+            await self.db[name].insert_one(child_dict, session=session)
+            result = await self.resumes.update_one(self._id_query(resume_id), self._version_update(updated_at),
+                                                   session=session)
+            if not result.matched_count:
+                await self.db[name].delete_one({"_id": child_dict["_id"]}, session=session)
+            return result.matched_count > 0
+
+        if not await self._write(write):
+            return None
+        child.id = child_dict["_id"]
+        child.mark_clean()
+        return child
+
+    async def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        async def write(session):
+            record = await self.db[name].find_one_and_update(
+                dict(self._id_query(child_id), resume_id=resume_id), {"$set": changes},
+                return_document=ReturnDocument.AFTER, session=session
+            )
+            if record:
+                await self.resumes.update_one(self._id_query(resume_id), self._version_update(updated_at),
+                                              session=session)
+            return record
+
+        record = await self._write(write)
+        return self._loaded_child(name, record) if record else None
+
+    async def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        async def write(session):
+            result = await self.db[name].delete_one(dict(self._id_query(child_id), resume_id=resume_id),
+                                                    session=session)
+            if result.deleted_count:
+                await self.resumes.update_one(self._id_query(resume_id), self._version_update(updated_at),
+                                              session=session)
+            return result.deleted_count > 0
+
+        return await self._write(write)
+
+    async def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        resume_dict = await self.resumes.find_one_and_update(
+            self._contact_query(resume_id), self._version_update(updated_at, self._contact_changes(changes)),
+            {"contact": 1}, return_document=ReturnDocument.AFTER
+        )
+        return self._loaded_contact(resume_dict)
+
+    async def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        result = await self.resumes.update_one(
+            self._id_query(resume_id), self._version_update(updated_at, {"contact": document_fields(contact)})
+        )
+        if not result.matched_count:
+            return None
+        contact.mark_clean()
+        return contact
+
+    async def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return await self._load({"user_id": user_id}, sort=USER_RESUMES_SORT, fields=fields)
+
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> AsyncIterator[Resume]:
+        return self._iter({"user_id": user_id}, sort=USER_RESUMES_SORT, fields=fields)
+
+    async def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                            fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return await self._load(self._page_query(user_id, after), sort=USER_RESUMES_SORT, fields=fields, limit=limit)
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> AsyncIterator[Resume]:
+        return self._iter(self._export_query(user_id, updated_since), sort=EXPORT_SORT, batch_size=EXPORT_BATCH_SIZE)
+
+    async def delete(self, resume_id: str) -> bool:
+        results = await asyncio.gather(
+            self.resumes.delete_one(self._id_query(resume_id)),
+            *(self.db[name].delete_many({"resume_id": resume_id}) for name in CHILD_COLLECTIONS)
+        )
+        return results[0].deleted_count > 0
+
+    async def _write(self, write: Callable):
+        if self.use_transactions:
+            async with await self.mongo_client.start_session() as session:
+                return await session.with_transaction(write)
+        return await write(None)
+
+    async def _apply_writes(self, writes: list, session=None) -> None:
+        operations = [
+            collection.bulk_write(operations, ordered=True, session=session)
+            for collection, operations in writes
+            if operations
+        ]
+        if session is None:
+            # Each collection's batch is independent of the others
+            await asyncio.gather(*operations)
+        else:
+            # A session runs one operation at a time
+            for operation in operations:
+                await operation
+
+    async def _insert_documents(self, documents: Dict[str, List[dict]], session=None) -> Set[str]:
+        names = [name for name, collection_documents in documents.items() if collection_documents]
+        inserts = [self.db[name].insert_many(documents[name], ordered=False, session=session) for name in names]
+        if session is not None:
+            for insert in inserts:
+                await insert
+            return set()
+
+        # The collections are written side by side, so a resume with a rejected
+        # document may have the rest of it written: take that back out
+        rejected = set()
+        for name, result in zip(names, await asyncio.gather(*inserts, return_exceptions=True)):
+            if isinstance(result, BulkWriteError):
+                rejected |= self._rejected_resume_ids(name, documents[name], result)
+            elif isinstance(result, BaseException):
+                raise result
+        if rejected:
+            await asyncio.gather(
+                self.resumes.delete_many({"_id": {"$in": list(rejected)}}),
+                *(self.db[name].delete_many({"resume_id": {"$in": list(rejected)}}) for name in CHILD_COLLECTIONS)
+            )
+        return rejected
+
+    async def _find_records(self, name: str, query: dict) -> List[dict]:
+        return await self.db[name].find(query).to_list(None)
+
+    async def _load(self, query: dict, sort: Optional[list] = None,
+                    fields: Optional[Collection[str]] = None, limit: int = 0) -> List[Resume]:
+        return [resume async for resume in self._iter(query, sort=sort, fields=fields, limit=limit)]
+
+    async def _iter(self, query: dict, sort: Optional[list] = None, fields: Optional[Collection[str]] = None,
+                    batch_size: int = STREAM_BATCH_SIZE, limit: int = 0) -> AsyncIterator[Resume]:
+        child_names = self._child_names(fields)
+
+        if self.load_mode == "lookup":
+            pipeline = self._lookup_pipeline(query, sort, self._projection(fields), child_names, limit)
+            async for resume_dict in self.resumes.aggregate(pipeline, batchSize=batch_size):
+                records = {name: resume_dict.pop(name, []) for name in CHILD_COLLECTIONS}
+                yield self._dict_to_resume(resume_dict, *records.values())
+            return
+
+        cursor = self.resumes.find(query, self._projection(fields)).batch_size(batch_size)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        batch = []
+        async for resume_dict in cursor:
+            batch.append(resume_dict)
+            if len(batch) == batch_size:
+                for resume in await self._assemble(batch, child_names):
+                    yield resume
+                batch = []
+        if batch:
+            for resume in await self._assemble(batch, child_names):
+                yield resume
+
+    async def _assemble(self, resume_dicts: List[dict], child_names: Collection[str] = CHILD_COLLECTIONS) -> List[Resume]:
+        children = await self._load_children([str(resume_dict["_id"]) for resume_dict in resume_dicts], child_names)
+        return [
+            self._dict_to_resume(resume_dict, *children[str(resume_dict["_id"])].values())
+            for resume_dict in resume_dicts
+        ]
+
+    async def _load_children(self, resume_ids: List[str],
+                             child_names: Collection[str] = CHILD_COLLECTIONS) -> Dict[str, Dict[str, List[dict]]]:
+        children = {resume_id: {name: [] for name in CHILD_COLLECTIONS} for resume_id in resume_ids}
+        if not resume_ids:
+            return children
+        # The child collections are read concurrently, one query each
+        results = await asyncio.gather(
+            *(self._find_records(name, {"resume_id": {"$in": resume_ids}}) for name in child_names)
+        )
+        for name, records in zip(child_names, results):
+            for record in records:
+                children[record["resume_id"]][name].append(record)
+        return children
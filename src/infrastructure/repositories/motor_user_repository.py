@@ -0,0 +1,59 @@
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from ...domain.models.user import User
+from ...domain.repositories.async_user_repository import AsyncUserRepository
+from .mongodb_indexes import MotorIndexedRepository
+from .mongodb_user_repository import MongoDBUserRepository, UserDocumentMapper, DUPLICATE_EMAILS_PIPELINE
+
+class MotorUserRepository(MotorIndexedRepository, UserDocumentMapper, AsyncUserRepository):
+    INDEXES = MongoDBUserRepository.INDEXES
+
+    def __init__(self, mongo_client: AsyncIOMotorClient, database_name: str):
+        self.db = mongo_client[database_name]
+        self.collection = self.db.users
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await super().ensure_indexes()
+        except OperationFailure as error:
+            duplicates = await self.collection.aggregate(DUPLICATE_EMAILS_PIPELINE).to_list(None)
+            self._index_build_failed(error, duplicates)
+
+    async def save(self, user: User) -> User:
+        user_dict = self._user_document(user)
+
+        if user.id:
+            await self.collection.update_one({"_id": user.id}, {"$set": user_dict})
+        else:
+            result = await self.collection.insert_one(user_dict)
+            user.id = str(result.inserted_id)
+
+        return user
+
+    async def find_or_create(self, user: User) -> User:
+        try:
+            user_dict = await self._upsert_by_email(user)
+        except DuplicateKeyError:
+            user_dict = await self._upsert_by_email(user)
+        return self._dict_to_user(user_dict)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        user_dict = await self.collection.find_one({"email": email})
+        if user_dict:
+            return self._dict_to_user(user_dict)
+        return None
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        user_dict = await self.collection.find_one({"_id": user_id})
+        if user_dict:
+            return self._dict_to_user(user_dict)
+        return None
+
+    async def _upsert_by_email(self, user: User) -> dict:
+        return await self.collection.find_one_and_update(
+            *self._upsert_by_email_args(user),
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
@@ -0,0 +1,173 @@
+import heapq
+import math
+import re
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+from ...domain.models.resume import Resume, SKILL_LEVELS
+from ...domain.models.resume_search import ResumeSearchHit
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# How much one occurrence of a word counts, by where it occurs
+FIELD_WEIGHTS = {"skill": 3.0, "position": 2.0, "company": 2.0, "summary": 1.0}
+
+LEVEL_RANKS = {level: rank for rank, level in enumerate(SKILL_LEVELS)}
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def skill_key(name: str) -> str:
+    return " ".join(tokenize(name))
+
+# In-process inverted index over skills, experience positions and companies
+# and summaries. Postings map each word to the resumes containing it, with a
+# field-weighted term frequency, so a query only touches the resumes that
+# contain its rarest word. Skill names are indexed whole as well, bucketed by
+# the highest level held, so "Python at Advanced or above" is a union of sets.
+class ResumeSearchIndex:
+    def __init__(self):
+        self._lock = Lock()
+        # word -> resume id -> weight
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # skill name -> one set of resume ids per level rank + 1 (0: unknown level)
+        self._skills: Dict[str, List[Set[str]]] = {}
+        # resume id -> (user_id, title, updated_at, words, (skill name, bucket) pairs);
+        # the words and skills are kept to remove the resume again
+        self._entries: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, resume: Resume) -> None:
+        weights: Dict[str, float] = {}
+        skills: Dict[str, int] = {}
+        for skill in resume.skills:
+            for word in tokenize(skill.name):
+                weights[word] = weights.get(word, 0.0) + FIELD_WEIGHTS["skill"]
+            key = skill_key(skill.name)
+            if key:
+                skills[key] = max(skills.get(key, 0), LEVEL_RANKS.get(skill.level, -1) + 1)
+        for experience in resume.experience:
+            for name in ("position", "company"):
+                for word in tokenize(getattr(experience, name)):
+                    weights[word] = weights.get(word, 0.0) + FIELD_WEIGHTS[name]
+        for word in tokenize(resume.summary):
+            weights[word] = weights.get(word, 0.0) + FIELD_WEIGHTS["summary"]
+
+        with self._lock:
+            self._remove(resume.id)
+            for word, weight in weights.items():
+                self._postings.setdefault(word, {})[resume.id] = weight
+            for key, bucket in skills.items():
+                buckets = self._skills.get(key)
+                if buckets is None:
+                    buckets = self._skills[key] = [set() for _ in range(len(SKILL_LEVELS) + 1)]
+                buckets[bucket].add(resume.id)
+            self._entries[resume.id] = (resume.user_id, resume.title, resume.updated_at,
+                                        tuple(weights), tuple(skills.items()))
+
+    def remove(self, resume_id: str) -> None:
+        with self._lock:
+            self._remove(resume_id)
+
+    def search(self, text: Optional[str] = None, skill: Optional[str] = None,
+               min_skill_level: Optional[str] = None, limit: int = 20,
+               offset: int = 0) -> Tuple[List[ResumeSearchHit], int]:
+        words = list(dict.fromkeys(tokenize(text)))
+        count = offset + limit
+        with self._lock:
+            resume_count = len(self._entries)
+            # Rarest word first: it bounds the candidates every other word is checked against
+            postings = sorted((self._postings.get(word, {}) for word in words), key=len)
+            if postings and not postings[0]:
+                return [], 0
+            levels = self._skill_levels(skill, min_skill_level) if skill else None
+            if levels is not None and not levels:
+                return [], 0
+
+            # Ties go to the resume id, so pages do not shift between identical requests
+            if not postings:
+                ranked, total = self._rank_levels(levels, count)
+            elif levels is None and len(postings) == 1:
+                # One word: its weights already order the matches, idf only scales them
+                idf = math.log(1 + resume_count / len(postings[0]))
+                top = heapq.nlargest(count, postings[0].items(), key=_by_score)
+                ranked, total = [(resume_id, weight * idf) for resume_id, weight in top], len(postings[0])
+            else:
+                scores = self._scores(postings, levels, resume_count)
+                ranked, total = heapq.nlargest(count, scores.items(), key=_by_score), len(scores)
+
+            hits = []
+            for resume_id, score in ranked[offset:]:
+                user_id, title, updated_at, _, _ = self._entries[resume_id]
+                hits.append(ResumeSearchHit(resume_id, user_id, title, updated_at, score))
+            return hits, total
+
+    def _skill_levels(self, skill: str, min_skill_level: Optional[str]) -> List[Tuple[float, Set[str]]]:
+        # Holding the skill at a higher level scores higher; highest level first
+        buckets = self._skills.get(skill_key(skill))
+        if not buckets:
+            return []
+        lowest = LEVEL_RANKS.get(min_skill_level, -1) + 1
+        return [
+            (bucket * FIELD_WEIGHTS["skill"], buckets[bucket])
+            for bucket in range(len(buckets) - 1, lowest - 1, -1) if buckets[bucket]
+        ]
+
+    def _rank_levels(self, levels: List[Tuple[float, Set[str]]], count: int) -> Tuple[list, int]:
+        ranked = []
+        for bonus, resume_ids in levels:
+            if len(ranked) >= count:
+                break
+            ranked.extend((resume_id, bonus) for resume_id in heapq.nlargest(count - len(ranked), resume_ids))
+        return ranked, sum(len(resume_ids) for _, resume_ids in levels)
+
+    def _scores(self, postings: List[Dict[str, float]], levels: Optional[List[Tuple[float, Set[str]]]],
+                resume_count: int) -> Dict[str, float]:
+        idfs = [math.log(1 + resume_count / len(posting)) for posting in postings]
+        # Walk whichever is smaller, the skill holders or the rarest word's
+        # resumes, and look each candidate up in the rest
+        if levels is not None and sum(len(resume_ids) for _, resume_ids in levels) < len(postings[0]):
+            candidates = ((resume_id, bonus) for bonus, resume_ids in levels for resume_id in resume_ids)
+        elif levels is not None:
+            candidates = ((resume_id, _level_bonus(levels, resume_id)) for resume_id in postings[0])
+        else:
+            candidates = ((resume_id, 0.0) for resume_id in postings[0])
+
+        scores = {}
+        for resume_id, score in candidates:
+            if levels is not None and not score:
+                continue
+            for posting, idf in zip(postings, idfs):
+                weight = posting.get(resume_id)
+                if weight is None:
+                    break
+                score += weight * idf
+            else:
+                scores[resume_id] = score
+        return scores
+
+    def _remove(self, resume_id: str) -> None:
+        entry = self._entries.pop(resume_id, None)
+        if entry is None:
+            return
+        _, _, _, words, skills = entry
+        for word in words:
+            posting = self._postings[word]
+            del posting[resume_id]
+            if not posting:
+                del self._postings[word]
+        for key, bucket in skills:
+            buckets = self._skills[key]
+            buckets[bucket].discard(resume_id)
+            if not any(buckets):
+                del self._skills[key]
+
+def _by_score(item: Tuple[str, float]) -> Tuple[float, str]:
+    return item[1], item[0]
+
+def _level_bonus(levels: List[Tuple[float, Set[str]]], resume_id: str) -> float:
+    for bonus, resume_ids in levels:
+        if resume_id in resume_ids:
+            return bonus
+    return 0.0
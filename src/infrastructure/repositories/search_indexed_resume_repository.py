@@ -0,0 +1,207 @@
+import time
+from datetime import datetime, timedelta, UTC
+from threading import Lock, Thread
+from typing import Collection, Iterator, List, Optional, Set, Tuple
+from ...domain.models.resume import Resume, Contact
+from ...domain.models.resume_search import ResumeSearchHit
+from ...domain.repositories.resume_repository import ResumeRepository
+from ...domain.repositories.resume_search import ResumeSearch
+from .resume_search_index import ResumeSearchIndex
+
+# Catch-up reads start this far before the last one did, to cover clock skew
+# between workers and the millisecond precision of stored timestamps
+CATCH_UP_OVERLAP = timedelta(seconds=2)
+
+# Keeps an in-process search index in step with the wrapped repository. This
+# process's writes are indexed as they happen; resumes saved by other workers
+# are picked up on the first search after refresh_seconds, by re-reading
+# what was updated since the last catch-up. Deletions made elsewhere have no
+# timestamp to find them by and drop out on the next full rebuild, every
+# rebuild_seconds (never when 0). Writes to a single entry or the contact do
+# not carry the whole resume: it is re-read and re-indexed on the next search.
+class SearchIndexedResumeRepository(ResumeRepository, ResumeSearch):
+    def __init__(self, repository: ResumeRepository, refresh_seconds: float = 5.0,
+                 rebuild_seconds: float = 3600.0):
+        self.repository = repository
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.index = ResumeSearchIndex()
+
+        self._sync_lock = Lock()
+        self._synced_since: Optional[datetime] = None
+        self._refreshed_at = 0.0
+        self._rebuilt_at = 0.0
+        # Deletions seen while a rebuild or a re-index reads the store, replayed
+        # on what it read; the swap lock keeps a deletion from landing between the two
+        self._swap_lock = Lock()
+        self._deletions_seen: List[Set[str]] = []
+        # Resumes written in part since the last search
+        self._stale_ids: Set[str] = set()
+
+    def rebuild(self) -> None:
+        with self._sync_lock:
+            self._rebuild()
+
+    def refresh(self) -> None:
+        with self._sync_lock:
+            self._catch_up()
+
+    def search(self, text: Optional[str] = None, skill: Optional[str] = None,
+               min_skill_level: Optional[str] = None, limit: int = 20,
+               offset: int = 0) -> Tuple[List[ResumeSearchHit], int]:
+        if self._synced_since is None:
+            # Never built: nothing to answer from until this one is
+            with self._sync_lock:
+                if self._synced_since is None:
+                    self._rebuild()
+
+        now = time.monotonic()
+        if self.rebuild_seconds > 0 and now - self._rebuilt_at >= self.rebuild_seconds:
+            # Reads the whole store; searches keep using the current index meanwhile
+            if self._sync_lock.acquire(blocking=False):
+                Thread(target=self._rebuild_in_background, name="search-index-rebuild", daemon=True).start()
+        elif now - self._refreshed_at >= self.refresh_seconds:
+            # Another thread already catching up is as good as this one doing it
+            if self._sync_lock.acquire(blocking=False):
+                try:
+                    self._catch_up()
+                finally:
+                    self._sync_lock.release()
+        if self._stale_ids:
+            self._reindex_stale()
+        return self.index.search(text, skill, min_skill_level, limit, offset)
+
+    def save(self, resume: Resume) -> Resume:
+        saved = self.repository.save(resume)
+        self.index.add(saved)
+        return saved
+
+    def save_many(self, resumes: List[Resume]) -> List[Resume]:
+        saved = self.repository.save_many(resumes)
+        for resume in saved:
+            if resume.id:
+                self.index.add(resume)
+        return saved
+
+    def find_by_id(self, resume_id: str, fields: Optional[Collection[str]] = None) -> Optional[Resume]:
+        return self.repository.find_by_id(resume_id, fields)
+
+    def find_by_ids(self, resume_ids: Collection[str]) -> List[Resume]:
+        return self.repository.find_by_ids(resume_ids)
+
+    def find_version(self, resume_id: str) -> Optional[datetime]:
+        return self.repository.find_version(resume_id)
+
+    def find_children(self, resume_id: str, name: str) -> Optional[list]:
+        return self.repository.find_children(resume_id, name)
+
+    def find_child(self, resume_id: str, name: str, child_id: str):
+        return self.repository.find_child(resume_id, name, child_id)
+
+    def add_child(self, resume_id: str, name: str, child, updated_at: datetime):
+        return self._stale(resume_id, self.repository.add_child(resume_id, name, child, updated_at))
+
+    def update_child(self, resume_id: str, name: str, child_id: str, changes: dict, updated_at: datetime):
+        return self._stale(resume_id, self.repository.update_child(resume_id, name, child_id, changes, updated_at))
+
+    def remove_child(self, resume_id: str, name: str, child_id: str, updated_at: datetime) -> bool:
+        return self._stale(resume_id, self.repository.remove_child(resume_id, name, child_id, updated_at))
+
+    def update_contact(self, resume_id: str, changes: dict, updated_at: datetime) -> Optional[Contact]:
+        return self._stale(resume_id, self.repository.update_contact(resume_id, changes, updated_at))
+
+    def replace_contact(self, resume_id: str, contact: Contact, updated_at: datetime) -> Optional[Contact]:
+        return self._stale(resume_id, self.repository.replace_contact(resume_id, contact, updated_at))
+
+    def find_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.repository.find_by_user_id(user_id, fields)
+
+    def iter_by_user_id(self, user_id: str, fields: Optional[Collection[str]] = None) -> Iterator[Resume]:
+        return self.repository.iter_by_user_id(user_id, fields)
+
+    def find_page_by_user_id(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                             fields: Optional[Collection[str]] = None) -> List[Resume]:
+        return self.repository.find_page_by_user_id(user_id, limit, after, fields)
+
+    def iter_all(self, user_id: Optional[str] = None,
+                 updated_since: Optional[datetime] = None) -> Iterator[Resume]:
+        return self.repository.iter_all(user_id, updated_since)
+
+    def _rebuild_in_background(self) -> None:
+        # Runs holding the sync lock taken by search
+        try:
+            self._rebuild()
+        finally:
+            self._sync_lock.release()
+
+    def _rebuild(self) -> None:
+        started = datetime.now(UTC)
+        with self._swap_lock:
+            deleted = self._watch_deletions()
+        # Built on the side and swapped in
+        index = ResumeSearchIndex()
+        try:
+            for resume in self.repository.iter_all():
+                index.add(resume)
+        except BaseException:
+            with self._swap_lock:
+                self._unwatch_deletions(deleted)
+            raise
+        with self._swap_lock:
+            self._unwatch_deletions(deleted)
+            for resume_id in deleted:
+                index.remove(resume_id)
+            self.index = index
+        # Saves that went to the old index while this ran are caught up from here
+        self._synced_since = started
+        self._refreshed_at = self._rebuilt_at = time.monotonic()
+
+    def _catch_up(self) -> None:
+        started = datetime.now(UTC)
+        for resume in self.repository.iter_all(updated_since=self._synced_since - CATCH_UP_OVERLAP):
+            self.index.add(resume)
+        self._synced_since = started
+        self._refreshed_at = time.monotonic()
+
+    def _stale(self, resume_id: str, result):
+        if result:
+            with self._swap_lock:
+                self._stale_ids.add(resume_id)
+        return result
+
+    def _reindex_stale(self) -> None:
+        with self._swap_lock:
+            stale_ids, self._stale_ids = self._stale_ids, set()
+            deleted = self._watch_deletions()
+        # One read for all of them, outside the lock so that deletes and other
+        # searches do not wait on the store
+        resumes = None
+        try:
+            resumes = self.repository.find_by_ids(stale_ids)
+        finally:
+            with self._swap_lock:
+                self._unwatch_deletions(deleted)
+                if resumes is None:
+                    # The read failed: try these again on the next search
+                    self._stale_ids |= stale_ids
+                else:
+                    for resume in resumes:
+                        if resume.id not in deleted:
+                            self.index.add(resume)
+
+    def _watch_deletions(self) -> Set[str]:
+        # Called holding the swap lock
+        deleted = set()
+        self._deletions_seen.append(deleted)
+        return deleted
+
+    def _unwatch_deletions(self, deleted: Set[str]) -> None:
+        self._deletions_seen = [seen for seen in self._deletions_seen if seen is not deleted]
+
+    def delete(self, resume_id: str) -> bool:
+        deleted = self.repository.delete(resume_id)
+        with self._swap_lock:
+            self.index.remove(resume_id)
+            for seen in self._deletions_seen:
+                seen.add(resume_id)
+        return deleted
@@ -0,0 +1,63 @@
+import zlib
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+import falcon
+from ...application.services.resume_service import ResumeService
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+GZIP_SUFFIX = "-gzip"
+
+def make_etag(updated_at: datetime, variant: Optional[str] = None) -> str:
+    # Mongo stores milliseconds and returns naive UTC datetimes, so normalise
+    # both ways for the tag handed out after a write to match later reads
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    etag = format((updated_at - EPOCH) // timedelta(milliseconds=1), "x")
+    # Different representations of the same version (e.g. sparse fieldsets) need distinct tags
+    if variant:
+        etag += "-" + format(zlib.crc32(variant.encode()), "x")
+    return etag
+
+def coded_etag(etag: str) -> str:
+    # The tag of a gzip-encoded representation, e.g. "1a2b" -> "1a2b-gzip";
+    # weak tags already tolerate byte differences and are kept
+    if etag.startswith('W/') or not etag.endswith('"'):
+        return etag
+    return etag[:-1] + GZIP_SUFFIX + '"'
+
+def _matches(tag: str, etag: str) -> bool:
+    # A tag handed out with a gzip body names the same version
+    return tag == etag or tag == etag + GZIP_SUFFIX
+
+def not_modified(req: falcon.Request, resp: falcon.Response, version: Optional[datetime],
+                 variant: Optional[str] = None) -> bool:
+    # Decides on the resume's version alone, before anything is loaded or serialized
+    if version is None:
+        raise falcon.HTTPNotFound()
+
+    etag = make_etag(version, variant)
+    resp.etag = etag
+    if req.if_none_match and any(tag == "*" or _matches(tag, etag) for tag in req.if_none_match):
+        resp.status = falcon.HTTP_304
+        return True
+    return False
+
+def check_if_match(req: falcon.Request, resume_service: ResumeService, resume_id: str) -> None:
+    if req.if_match is None:
+        return
+    _check_version(req, resume_service.get_resume_version(resume_id))
+
+async def check_if_match_async(req: falcon.Request, resume_service, resume_id: str) -> None:
+    if req.if_match is None:
+        return
+    _check_version(req, await resume_service.get_resume_version(resume_id))
+
+def _check_version(req: falcon.Request, version: Optional[datetime]) -> None:
+    if version is None:
+        raise falcon.HTTPPreconditionFailed(description="Resume does not exist")
+
+    # If-Match uses the strong comparison
+    etag = make_etag(version)
+    if not any(tag == "*" or (not tag.is_weak and _matches(tag, etag)) for tag in req.if_match):
+        raise falcon.HTTPPreconditionFailed(description="Resume has been modified")
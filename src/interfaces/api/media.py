@@ -0,0 +1,84 @@
+import json
+import zlib
+from datetime import date, datetime
+from functools import partial
+import falcon
+from falcon import media
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+def _default(value):
+    # Types neither encoder handles natively (ObjectId, stdlib datetimes)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+if orjson is not None:
+    # orjson serializes datetimes, enums and dataclasses natively and returns bytes
+    dumps = partial(orjson.dumps, default=_default)
+    loads = orjson.loads
+else:
+    dumps = partial(json.dumps, default=_default, ensure_ascii=False)
+    loads = json.loads
+
+JSON_HANDLER = media.JSONHandler(dumps=dumps, loads=loads)
+
+def dumps_line(value) -> bytes:
+    # One NDJSON line, for responses streamed record by record
+    line = dumps(value)
+    if isinstance(line, str):
+        line = line.encode("utf-8")
+    return line + b"\n"
+
+# Compressed output is flushed in chunks of about this size
+GZIP_CHUNK_BYTES = 64 * 1024
+
+class GzipLineWriter:
+    # Incremental gzip of NDJSON lines: memory stays at one chunk of output
+    # however many records pass through
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        self._pending = []
+        self._pending_bytes = 0
+
+    def write(self, value) -> bytes:
+        compressed = self._compressor.compress(dumps_line(value))
+        if compressed:
+            self._pending.append(compressed)
+            self._pending_bytes += len(compressed)
+        if self._pending_bytes < GZIP_CHUNK_BYTES:
+            return b""
+        return self._take()
+
+    def close(self) -> bytes:
+        self._pending.append(self._compressor.flush())
+        return self._take()
+
+    def _take(self) -> bytes:
+        chunk = b"".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        return chunk
+
+def gzip_ndjson(values, level: int = 6):
+    writer = GzipLineWriter(level)
+    for value in values:
+        chunk = writer.write(value)
+        if chunk:
+            yield chunk
+    yield writer.close()
+
+async def gzip_ndjson_async(values, level: int = 6):
+    writer = GzipLineWriter(level)
+    async for value in values:
+        chunk = writer.write(value)
+        if chunk:
+            yield chunk
+    yield writer.close()
+
+def register_json_handler(app) -> None:
+    for options in (app.req_options, app.resp_options):
+        options.media_handlers[falcon.MEDIA_JSON] = JSON_HANDLER
@@ -1,14 +1,25 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
 import jwt
 from falcon import Request, Response, HTTPUnauthorized, HTTPForbidden
 from ....domain.models.user import UserRole
+from .metrics_middleware import METRICS_PATH
 
 class AuthMiddleware:
-    def __init__(self, secret_key: str):
+    def __init__(self, secret_key: str, token_cache_size: int = 10000):
         self.secret_key = secret_key
+        self.token_cache_size = token_cache_size
+        # sha256(token) -> (exp, claims) for tokens that already passed verification
+        self._token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._token_cache_lock = Lock()
 
     def process_request(self, req: Request, resp: Response):
         if req.path == "/auth" and req.method == "POST":
             return
+        if req.path == METRICS_PATH and req.method == "GET":
+            return
 
         auth_header = req.get_header("Authorization")
         if not auth_header:
@@ -16,7 +27,7 @@ class AuthMiddleware:
 
         try:
             token = auth_header.split(" ")[1]
-            payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+            payload = self._decode(token)
             req.context["user_id"] = payload["sub"]
             req.context["user_email"] = payload["email"]
             req.context["user_role"] = payload["role"]
@@ -27,4 +38,34 @@ class AuthMiddleware:
         except jwt.ExpiredSignatureError:
             raise HTTPUnauthorized(description="Token has expired")
         except jwt.InvalidTokenError:
-            raise HTTPUnauthorized(description="Invalid token") 
\ No newline at end of file
+            raise HTTPUnauthorized(description="Invalid token")
+
+    def _decode(self, token: str) -> dict:
+        if self.token_cache_size <= 0:
+            return jwt.decode(token, self.secret_key, algorithms=["HS256"])
+
+        digest = hashlib.sha256(token.encode()).digest()
+        with self._token_cache_lock:
+            entry = self._token_cache.get(digest)
+            if entry:
+                if entry[0] > time.time():
+                    self._token_cache.move_to_end(digest)
+                    return entry[1]
+                # Expired: fall through so jwt.decode reports it
+                del self._token_cache[digest]
+
+        payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+
+        # Only tokens with an expiry are cached, and never past that expiry
+        expires_at = payload.get("exp")
+        if expires_at:
+            with self._token_cache_lock:
+                self._token_cache[digest] = (expires_at, payload)
+                while len(self._token_cache) > self.token_cache_size:
+                    self._token_cache.popitem(last=False)
+        return payload
+
+# falcon.asgi.App only accepts coroutine middleware; verification itself does no I/O
+class AsyncAuthMiddleware(AuthMiddleware):
+    async def process_request(self, req: Request, resp: Response):
+        super().process_request(req, resp)
@@ -0,0 +1,168 @@
+import inspect
+import zlib
+from falcon import Request, Response
+from ..conditional_requests import coded_etag
+
+# Bodies smaller than this gain little from compression and are sent as-is
+DEFAULT_MIN_SIZE = 1024
+# On resume JSON level 1 saves within a few percent of level 6 at a quarter
+# of the CPU; see benchmarks/bench_response_compression.py
+DEFAULT_LEVEL = 1
+STREAM_READ_BYTES = 64 * 1024
+
+# Formats that are compressed already; running gzip over them again only costs CPU
+COMPRESSED_TYPES = ('application/gzip', 'application/zip', 'application/x-gzip', 'image/', 'audio/', 'video/')
+
+def accepts_gzip(accept_encoding) -> bool:
+    for coding in (accept_encoding or '').split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() not in ('gzip', 'x-gzip', '*'):
+            continue
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+def _sync_flushed(compressor, chunks) -> bytes:
+    # zlib holds input back until it has a block's worth; a sync flush sends
+    # each chunk of a stream (an NDJSON line batch, a page) as it is produced
+    compressed = [compressor.compress(chunk) for chunk in chunks]
+    compressed.append(compressor.flush(zlib.Z_SYNC_FLUSH))
+    return b''.join(compressed)
+
+def _chunks(stream):
+    # Falcon takes either an iterable of chunks or a file-like object
+    if not hasattr(stream, 'read'):
+        yield from stream
+        return
+    try:
+        while chunk := stream.read(STREAM_READ_BYTES):
+            yield chunk
+    finally:
+        if hasattr(stream, 'close'):
+            stream.close()
+
+# Gzip-compresses response bodies of at least min_size bytes for clients
+# sending Accept-Encoding: gzip. Streamed bodies are compressed chunk by chunk
+# as they are sent; only enough of the stream to tell whether it reaches
+# min_size is read up front.
+class CompressionMiddleware:
+    def __init__(self, min_size: int = DEFAULT_MIN_SIZE, level: int = DEFAULT_LEVEL):
+        self.min_size = min_size
+        self.level = level
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded: bool):
+        if not self._compressible(req, resp):
+            return
+        if resp.stream is not None:
+            head, rest = self._peek(_chunks(resp.stream))
+            if rest is None:
+                resp.stream = None
+                self._compress_body(resp, head)
+            else:
+                self._use_gzip(resp)
+                resp.content_length = None
+                resp.stream = self._compress_stream(head, rest)
+            return
+        self._compress_body(resp, resp.render_body())
+
+    def _compressible(self, req: Request, resp: Response) -> bool:
+        if req.method == 'HEAD' or resp.status_code in (204, 304):
+            return False
+        if resp.get_header('Content-Encoding'):
+            return False
+        content_type = (resp.content_type or '').lower()
+        if content_type.startswith(COMPRESSED_TYPES):
+            return False
+        # Caches must keep the plain and gzip representations apart
+        resp.append_header('Vary', 'Accept-Encoding')
+        return accepts_gzip(req.get_header('Accept-Encoding'))
+
+    def _compress_body(self, resp: Response, body) -> None:
+        if body is None:
+            return
+        if len(body) < self.min_size:
+            # Already rendered; keep Falcon from serializing the media again
+            resp.data = body
+            return
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        resp.data = compressor.compress(body) + compressor.flush()
+        self._use_gzip(resp)
+
+    def _peek(self, chunks):
+        # Reads until min_size bytes are buffered; (body, None) when the
+        # stream ends first, (buffered chunks, remaining iterator) otherwise
+        head = []
+        size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= self.min_size:
+                return head, chunks
+        return b''.join(head), None
+
+    def _compress_stream(self, head, rest):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        yield _sync_flushed(compressor, head)
+        for chunk in rest:
+            yield _sync_flushed(compressor, [chunk])
+        yield compressor.flush()
+
+    def _use_gzip(self, resp: Response) -> None:
+        resp.set_header('Content-Encoding', 'gzip')
+        etag = resp.get_header('ETag')
+        if etag:
+            # A strong validator names exact bytes, so the gzip body needs its own
+            resp.set_header('ETag', coded_etag(etag))
+
+class AsyncCompressionMiddleware(CompressionMiddleware):
+    async def process_response(self, req: Request, resp: Response, resource, req_succeeded: bool):
+        if not self._compressible(req, resp):
+            return
+        if resp.stream is not None:
+            head, rest = await self._peek_async(_async_chunks(resp.stream))
+            if rest is None:
+                resp.stream = None
+                self._compress_body(resp, head)
+            else:
+                self._use_gzip(resp)
+                resp.content_length = None
+                resp.stream = self._compress_stream_async(head, rest)
+            return
+        self._compress_body(resp, await resp.render_body())
+
+    async def _peek_async(self, chunks):
+        head = []
+        size = 0
+        async for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= self.min_size:
+                return head, chunks
+        return b''.join(head), None
+
+    async def _compress_stream_async(self, head, rest):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        yield _sync_flushed(compressor, head)
+        async for chunk in rest:
+            yield _sync_flushed(compressor, [chunk])
+        yield compressor.flush()
+
+async def _async_chunks(stream):
+    # falcon.asgi takes an async iterable of chunks or an object with an async read()
+    if not hasattr(stream, 'read'):
+        async for chunk in stream:
+            yield chunk
+        return
+    try:
+        while chunk := await stream.read(STREAM_READ_BYTES):
+            yield chunk
+    finally:
+        if hasattr(stream, 'close'):
+            closed = stream.close()
+            if inspect.isawaitable(closed):
+                await closed
@@ -0,0 +1,38 @@
+import time
+from falcon import Request, Response
+from ....infrastructure.metrics import MetricsRegistry
+
+METRICS_PATH = '/metrics'
+
+# Requests rejected before routing (e.g. by AuthMiddleware) and unknown paths
+UNROUTED = 'unrouted'
+
+# Per-route request latency by status; the histogram's _count series are the
+# response counts. Routes are labelled by URI template, so /resumes/{resume_id}
+# is one series however many resumes there are. Latency covers the middleware
+# stack, the responder and rendering the body; a streamed body is sent after
+# it is measured.
+class MetricsMiddleware:
+    def __init__(self, registry: MetricsRegistry):
+        self.latency = registry.histogram(
+            'http_request_duration_seconds', 'Time spent handling requests, by route and status',
+            ('method', 'route', 'status')
+        )
+
+    def process_request(self, req: Request, resp: Response):
+        if req.path != METRICS_PATH:
+            req.context.metrics_started = time.perf_counter()
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded: bool):
+        started = req.context.get('metrics_started')
+        if started is None:
+            return
+        self.latency.observe((req.method, req.uri_template or UNROUTED, resp.status_code),
+                             time.perf_counter() - started)
+
+class AsyncMetricsMiddleware(MetricsMiddleware):
+    async def process_request(self, req: Request, resp: Response):
+        super().process_request(req, resp)
+
+    async def process_response(self, req: Request, resp: Response, resource, req_succeeded: bool):
+        super().process_response(req, resp, resource, req_succeeded)
@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime, timedelta, UTC
+from typing import Optional, Tuple
+import falcon
+from ...domain.models.resume import Resume
+from .conditional_requests import EPOCH
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Cursors are opaque to clients: the (updated_at, id) key of the last resume
+# on a page, which the next page starts after
+def encode_cursor(resume: Resume) -> str:
+    updated_at = resume.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    # Milliseconds, the precision Mongo stores
+    millis = (updated_at - EPOCH) // timedelta(milliseconds=1)
+    raw = f"{millis:x}.{resume.id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(value: Optional[str]) -> Optional[Tuple[datetime, str]]:
+    if value is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        millis, resume_id = raw.split(".", 1)
+        updated_at = EPOCH + timedelta(milliseconds=int(millis, 16))
+    except (ValueError, OverflowError):
+        raise falcon.HTTPBadRequest(description="Invalid cursor")
+    if not resume_id:
+        raise falcon.HTTPBadRequest(description="Invalid cursor")
+    return updated_at, resume_id
+
+def page_size(req: falcon.Request) -> Optional[int]:
+    # None when the client asked for neither a limit nor a cursor: unpaged listing
+    limit = req.get_param_as_int('limit', min_value=1, max_value=MAX_PAGE_SIZE)
+    if limit is None and req.get_param('after') is not None:
+        return DEFAULT_PAGE_SIZE
+    return limit
@@ -0,0 +1,12 @@
+import falcon
+from marshmallow import ValidationError
+from .auth_resource import AuthResource
+
+class AsyncAuthResource(AuthResource):
+    async def on_post(self, req, resp):
+        try:
+            data = self.schema.load(await req.get_media())
+            token = await self.auth_service.authenticate_user(data["email"])
+            resp.media = {"access_token": token, "token_type": "bearer"}
+        except (ValidationError, ValueError) as e:
+            raise falcon.HTTPBadRequest(description=str(e))
@@ -0,0 +1,99 @@
+import falcon
+from marshmallow import ValidationError
+from ....application.services.async_resume_service import AsyncResumeService
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match_async
+from .education_resource import EducationResource
+from .experience_resource import ExperienceResource
+from .skill_resource import SkillResource
+
+# The education, experience and skills resources only differ in their schema
+# and child collection, so the async variants share one implementation
+class AsyncChildResource:
+    child_name: str
+    resume_service: AsyncResumeService
+
+    async def _get(self, req, resp, resume_id, child_id=None):
+        if not_modified(req, resp, await self.resume_service.get_resume_version(resume_id)):
+            return
+
+        if child_id:
+            child = await self.resume_service.get_resume_child(resume_id, self.child_name, child_id)
+            if not child:
+                raise falcon.HTTPNotFound()
+            resp.media = to_dict(child)
+            return
+
+        children = await self.resume_service.get_resume_children(resume_id, self.child_name)
+        if children is None:
+            raise falcon.HTTPNotFound()
+        resp.media = [to_dict(child) for child in children]
+
+    async def on_post(self, req, resp, resume_id):
+        try:
+            data = self.schema.load(await req.get_media())
+            await check_if_match_async(req, self.resume_service, resume_id)
+            added = await self.resume_service.add_resume_child(resume_id, self.child_name, data)
+            if not added:
+                raise falcon.HTTPNotFound()
+            child, updated_at = added
+            resp.status = falcon.HTTP_201
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(child)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def _patch(self, req, resp, resume_id, child_id):
+        try:
+            data = self.schema.load(await req.get_media(), partial=True)
+            await check_if_match_async(req, self.resume_service, resume_id)
+            updated = await self.resume_service.update_resume_child(resume_id, self.child_name, child_id, data)
+            if not updated:
+                raise falcon.HTTPNotFound()
+            child, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(child)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def _delete(self, req, resp, resume_id, child_id):
+        await check_if_match_async(req, self.resume_service, resume_id)
+        if not await self.resume_service.remove_resume_child(resume_id, self.child_name, child_id):
+            raise falcon.HTTPNotFound()
+        resp.status = falcon.HTTP_204
+
+class AsyncEducationResource(AsyncChildResource, EducationResource):
+    child_name = "education"
+
+    async def on_get(self, req, resp, resume_id, education_id=None):
+        await self._get(req, resp, resume_id, education_id)
+
+    async def on_patch(self, req, resp, resume_id, education_id):
+        await self._patch(req, resp, resume_id, education_id)
+
+    async def on_delete(self, req, resp, resume_id, education_id):
+        await self._delete(req, resp, resume_id, education_id)
+
+class AsyncExperienceResource(AsyncChildResource, ExperienceResource):
+    child_name = "experience"
+
+    async def on_get(self, req, resp, resume_id, experience_id=None):
+        await self._get(req, resp, resume_id, experience_id)
+
+    async def on_patch(self, req, resp, resume_id, experience_id):
+        await self._patch(req, resp, resume_id, experience_id)
+
+    async def on_delete(self, req, resp, resume_id, experience_id):
+        await self._delete(req, resp, resume_id, experience_id)
+
+class AsyncSkillResource(AsyncChildResource, SkillResource):
+    child_name = "skills"
+
+    async def on_get(self, req, resp, resume_id, skill_id=None):
+        await self._get(req, resp, resume_id, skill_id)
+
+    async def on_patch(self, req, resp, resume_id, skill_id):
+        await self._patch(req, resp, resume_id, skill_id)
+
+    async def on_delete(self, req, resp, resume_id, skill_id):
+        await self._delete(req, resp, resume_id, skill_id)
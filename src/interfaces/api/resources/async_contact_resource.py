@@ -0,0 +1,75 @@
+import falcon
+from marshmallow import ValidationError
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match_async
+from .contact_resource import ContactResource
+
+class AsyncContactResource(ContactResource):
+    async def on_get(self, req, resp, resume_id, contact_id=None):
+        if not_modified(req, resp, await self.resume_service.get_resume_version(resume_id)):
+            return
+        resume = await self.resume_service.get_resume(resume_id, fields=["contact"])
+        if not resume:
+            raise falcon.HTTPNotFound()
+
+        if contact_id:
+            if not resume.contact or str(resume.contact.id) != contact_id:
+                raise falcon.HTTPNotFound()
+            resp.media = to_dict(resume.contact)
+        else:
+            resp.media = to_dict(resume.contact) if resume.contact else {}
+
+    async def on_post(self, req, resp, resume_id):
+        try:
+            data = self.schema.load(await req.get_media())
+            await check_if_match_async(req, self.resume_service, resume_id)
+            replaced = await self.resume_service.replace_resume_contact(resume_id, data)
+            if not replaced:
+                raise falcon.HTTPNotFound()
+            contact, updated_at = replaced
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(contact)
+            resp.status = falcon.HTTP_201
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def on_put(self, req, resp, resume_id, contact_id):
+        try:
+            data = self.schema.load(await req.get_media())
+            await check_if_match_async(req, self.resume_service, resume_id)
+            resume = await self.resume_service.get_resume(resume_id)
+            if not resume or not resume.contact or str(resume.contact.id) != contact_id:
+                raise falcon.HTTPNotFound()
+            await self._update_contact(resp, resume, data)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def on_delete(self, req, resp, resume_id, contact_id):
+        await check_if_match_async(req, self.resume_service, resume_id)
+        resume = await self.resume_service.get_resume(resume_id)
+        if not resume or not resume.contact or str(resume.contact.id) != contact_id:
+            raise falcon.HTTPNotFound()
+
+        await self.resume_service.update_resume(resume_id, {"contact": None})
+        resp.status = falcon.HTTP_204
+
+    async def on_patch(self, req, resp, resume_id):
+        try:
+            data = self.schema.load(await req.get_media())
+            await check_if_match_async(req, self.resume_service, resume_id)
+            updated = await self.resume_service.update_resume_contact(resume_id, data)
+            if not updated:
+                raise falcon.HTTPNotFound()
+            contact, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(contact)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def _update_contact(self, resp, resume, data: dict):
+        for key, value in data.items():
+            setattr(resume.contact, key, value)
+
+        updated_resume = await self.resume_service.update_resume(resume.id, {"contact": resume.contact})
+        resp.etag = make_etag(updated_resume.updated_at)
+        resp.media = to_dict(updated_resume.contact)
@@ -0,0 +1,5 @@
+from .metrics_resource import MetricsResource
+
+class AsyncMetricsResource(MetricsResource):
+    async def on_get(self, req, resp):
+        super().on_get(req, resp)
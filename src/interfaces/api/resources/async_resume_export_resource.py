@@ -0,0 +1,9 @@
+from ....domain.models.serialization import to_dict
+from ..media import gzip_ndjson_async
+from .resume_export_resource import ResumeExportResource
+
+class AsyncResumeExportResource(ResumeExportResource):
+    async def on_get(self, req, resp):
+        resumes = self.resume_service.export_resumes(self._user_id(req), self._updated_since(req))
+        self._prepare(resp)
+        resp.stream = gzip_ndjson_async(to_dict(resume) async for resume in resumes)
@@ -0,0 +1,34 @@
+import falcon
+from .resume_import_resource import ResumeImportResource, ImportReport, LineSplitter, IMPORT_BATCH_SIZE
+
+class AsyncResumeImportResource(ResumeImportResource):
+    async def on_post(self, req, resp):
+        user_id = req.get_param('user_id')
+        if not user_id:
+            raise falcon.HTTPBadRequest(description="user_id parameter is required")
+
+        report = ImportReport()
+        batch, lines = [], []
+        number = 0
+        async for line in _read_lines(req.stream):
+            number += 1
+            record = self._validate(report, number, line)
+            if record is None:
+                continue
+            batch.append(record)
+            lines.append(number)
+            if len(batch) == IMPORT_BATCH_SIZE:
+                report.add_saved(lines, await self.resume_service.import_resumes(user_id, batch))
+                batch, lines = [], []
+        if batch:
+            report.add_saved(lines, await self.resume_service.import_resumes(user_id, batch))
+
+        resp.media = report.to_dict()
+
+async def _read_lines(stream):
+    splitter = LineSplitter()
+    async for chunk in stream:
+        for line in splitter.feed(chunk):
+            yield line
+    for line in splitter.close():
+        yield line
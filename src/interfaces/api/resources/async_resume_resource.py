@@ -0,0 +1,79 @@
+import falcon
+from marshmallow import ValidationError
+from ..conditional_requests import make_etag, not_modified, check_if_match_async
+from ..media import dumps_line
+from ..pagination import decode_cursor, page_size
+from .resume_resource import ResumeResource, NDJSON, prefers_ndjson
+
+class AsyncResumeResource(ResumeResource):
+    async def on_get(self, req, resp, resume_id=None):
+        fields = self._requested_fields(req)
+        if resume_id:
+            variant = ','.join(fields) if fields is not None else None
+            if not_modified(req, resp, await self.resume_service.get_resume_version(resume_id), variant):
+                return
+            resume = await self.resume_service.get_resume(resume_id, fields)
+            if not resume:
+                raise falcon.HTTPNotFound()
+            if resume.updated_at:
+                resp.etag = make_etag(resume.updated_at, variant)
+            resp.media = self._serialize_resume(resume, fields)
+        else:
+            user_id = req.get_param('user_id')
+            if not user_id:
+                raise falcon.HTTPBadRequest(description="user_id parameter is required")
+            limit = page_size(req)
+            if limit is not None:
+                resumes = await self.resume_service.get_user_resumes_page(
+                    user_id, limit + 1, decode_cursor(req.get_param('after')), self._page_fields(fields)
+                )
+                self._respond_page(req, resp, resumes, limit, fields)
+                return
+            if prefers_ndjson(req):
+                resp.content_type = NDJSON
+                resp.stream = self._stream_ndjson_async(self.resume_service.iter_user_resumes(user_id, fields), fields)
+                return
+            resumes = await self.resume_service.get_user_resumes(user_id, fields)
+            resp.media = [self._serialize_resume(resume, fields) for resume in resumes]
+
+    async def on_post(self, req, resp):
+        try:
+            data = self.schema.load(await req.get_media())
+            user_id = req.get_param('user_id')
+            if not user_id:
+                raise falcon.HTTPBadRequest(description="user_id parameter is required")
+
+            resume = await self.resume_service.create_resume(
+                user_id=user_id,
+                title=data['title'],
+                contact=data['contact'],
+                summary=data['summary']
+            )
+            resp.status = falcon.HTTP_201
+            resp.etag = make_etag(resume.updated_at)
+            resp.media = self._serialize_resume(resume)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def on_put(self, req, resp, resume_id):
+        try:
+            data = self.schema.load(await req.get_media())
+            await check_if_match_async(req, self.resume_service, resume_id)
+            resume = await self.resume_service.update_resume(resume_id, data)
+            if not resume:
+                raise falcon.HTTPNotFound()
+            resp.etag = make_etag(resume.updated_at)
+            resp.media = self._serialize_resume(resume)
+        except ValidationError as e:
+            raise falcon.HTTPBadRequest(description=str(e))
+
+    async def on_delete(self, req, resp, resume_id):
+        await check_if_match_async(req, self.resume_service, resume_id)
+        success = await self.resume_service.delete_resume(resume_id)
+        if not success:
+            raise falcon.HTTPNotFound()
+        resp.status = falcon.HTTP_204
+
+    async def _stream_ndjson_async(self, resumes, fields=None):
+        async for resume in resumes:
+            yield dumps_line(self._serialize_resume(resume, fields))
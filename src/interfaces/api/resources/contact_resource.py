@@ -1,6 +1,8 @@
 import falcon
 from marshmallow import Schema, fields, ValidationError
 from ....application.services.resume_service import ResumeService
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match
 
 class ContactSchema(Schema):
     email = fields.Email(required=True)
@@ -18,7 +20,10 @@ class ContactResource:
         self.schema = ContactSchema(partial=True)
 
     def on_get(self, req, resp, resume_id, contact_id=None):
-        resume = self.resume_service.get_resume(resume_id)
+        if not_modified(req, resp, self.resume_service.get_resume_version(resume_id)):
+            return
+        # The contact lives on the resume document: skip every child collection
+        resume = self.resume_service.get_resume(resume_id, fields=["contact"])
         if not resume:
             raise falcon.HTTPNotFound()
         
@@ -26,22 +31,22 @@ class ContactResource:
             # Handle single contact retrieval
             if not resume.contact or str(resume.contact.id) != contact_id:
                 raise falcon.HTTPNotFound()
-            resp.media = resume.contact.__dict__
+            resp.media = to_dict(resume.contact)
         else:
             # Handle contact retrieval for resume
-            resp.media = resume.contact.__dict__ if resume.contact else {}
+            resp.media = to_dict(resume.contact) if resume.contact else {}
 
     def on_post(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            # Replaces the contact in one write to the resume document
+            replaced = self.resume_service.replace_resume_contact(resume_id, data)
+            if not replaced:
                 raise falcon.HTTPNotFound()
-
-            # Create new contact
-            resume.contact = data
-            updated_resume = self.resume_service.update_resume(resume_id, {"contact": resume.contact})
-            resp.media = updated_resume.contact.__dict__
+            contact, updated_at = replaced
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(contact)
             resp.status = falcon.HTTP_201
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
@@ -49,6 +54,7 @@ class ContactResource:
     def on_put(self, req, resp, resume_id, contact_id):
         try:
             data = self.schema.load(req.media)
+            check_if_match(req, self.resume_service, resume_id)
             resume = self.resume_service.get_resume(resume_id)
             if not resume or not resume.contact or str(resume.contact.id) != contact_id:
                 raise falcon.HTTPNotFound()
@@ -58,11 +64,13 @@ class ContactResource:
                 setattr(resume.contact, key, value)
 
             updated_resume = self.resume_service.update_resume(resume_id, {"contact": resume.contact})
-            resp.media = updated_resume.contact.__dict__
+            resp.etag = make_etag(updated_resume.updated_at)
+            resp.media = to_dict(updated_resume.contact)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_delete(self, req, resp, resume_id, contact_id):
+        check_if_match(req, self.resume_service, resume_id)
         resume = self.resume_service.get_resume(resume_id)
         if not resume or not resume.contact or str(resume.contact.id) != contact_id:
             raise falcon.HTTPNotFound()
@@ -75,15 +83,13 @@ class ContactResource:
     def on_patch(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            # Only the given fields are set, in place
+            updated = self.resume_service.update_resume_contact(resume_id, data)
+            if not updated:
                 raise falcon.HTTPNotFound()
-
-            # Update contact fields
-            for key, value in data.items():
-                setattr(resume.contact, key, value)
-
-            updated_resume = self.resume_service.update_resume(resume_id, {"contact": resume.contact})
-            resp.media = updated_resume.contact.__dict__
+            contact, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(contact)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e)) 
\ No newline at end of file
@@ -1,6 +1,8 @@
 import falcon
 from marshmallow import Schema, fields, ValidationError
 from ....application.services.resume_service import ResumeService
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match
 
 class EducationSchema(Schema):
     institution = fields.Str(required=True)
@@ -15,61 +17,53 @@ class EducationResource:
         self.resume_service = resume_service
         self.schema = EducationSchema()
 
-    def on_get(self, req, resp, resume_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+    def on_get(self, req, resp, resume_id, education_id=None):
+        if not_modified(req, resp, self.resume_service.get_resume_version(resume_id)):
+            return
+
+        # Only the education collection is read, never the whole resume
+        if education_id:
+            edu = self.resume_service.get_resume_child(resume_id, "education", education_id)
+            if not edu:
+                raise falcon.HTTPNotFound()
+            resp.media = to_dict(edu)
+            return
+
+        education = self.resume_service.get_resume_children(resume_id, "education")
+        if education is None:
             raise falcon.HTTPNotFound()
-        resp.media = [edu.__dict__ for edu in resume.education]
+        resp.media = [to_dict(edu) for edu in education]
 
     def on_post(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            # One insert and a version bump; the resume itself is never read
+            added = self.resume_service.add_resume_child(resume_id, "education", data)
+            if not added:
                 raise falcon.HTTPNotFound()
-
-            resume.education.append(data)
-            updated_resume = self.resume_service.update_resume(resume_id, {"education": resume.education})
+            edu, updated_at = added
             resp.status = falcon.HTTP_201
-            resp.media = updated_resume.education[-1].__dict__
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(edu)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_patch(self, req, resp, resume_id, education_id):
         try:
             data = self.schema.load(req.media, partial=True)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            updated = self.resume_service.update_resume_child(resume_id, "education", education_id, data)
+            if not updated:
                 raise falcon.HTTPNotFound()
-
-            try:
-                education_id = int(education_id)
-                if education_id >= len(resume.education):
-                    raise falcon.HTTPNotFound()
-            except ValueError:
-                raise falcon.HTTPBadRequest(description="Invalid education ID")
-
-            # Update education fields
-            for key, value in data.items():
-                setattr(resume.education[education_id], key, value)
-
-            updated_resume = self.resume_service.update_resume(resume_id, {"education": resume.education})
-            resp.media = updated_resume.education[education_id].__dict__
+            edu, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(edu)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_delete(self, req, resp, resume_id, education_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+        check_if_match(req, self.resume_service, resume_id)
+        if not self.resume_service.remove_resume_child(resume_id, "education", education_id):
             raise falcon.HTTPNotFound()
-
-        try:
-            education_id = int(education_id)
-            if education_id >= len(resume.education):
-                raise falcon.HTTPNotFound()
-        except ValueError:
-            raise falcon.HTTPBadRequest(description="Invalid education ID")
-
-        resume.education.pop(education_id)
-        self.resume_service.update_resume(resume_id, {"education": resume.education})
-        resp.status = falcon.HTTP_204 
\ No newline at end of file
+        resp.status = falcon.HTTP_204
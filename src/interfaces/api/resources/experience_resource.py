@@ -1,6 +1,8 @@
 import falcon
 from marshmallow import Schema, fields, ValidationError
 from ....application.services.resume_service import ResumeService
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match
 
 class ExperienceSchema(Schema):
     company = fields.Str(required=True)
@@ -15,61 +17,53 @@ class ExperienceResource:
         self.resume_service = resume_service
         self.schema = ExperienceSchema()
 
-    def on_get(self, req, resp, resume_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+    def on_get(self, req, resp, resume_id, experience_id=None):
+        if not_modified(req, resp, self.resume_service.get_resume_version(resume_id)):
+            return
+
+        # Only the experience collection is read, never the whole resume
+        if experience_id:
+            exp = self.resume_service.get_resume_child(resume_id, "experience", experience_id)
+            if not exp:
+                raise falcon.HTTPNotFound()
+            resp.media = to_dict(exp)
+            return
+
+        experience = self.resume_service.get_resume_children(resume_id, "experience")
+        if experience is None:
             raise falcon.HTTPNotFound()
-        resp.media = [exp.__dict__ for exp in resume.experience]
+        resp.media = [to_dict(exp) for exp in experience]
 
     def on_post(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            # One insert and a version bump; the resume itself is never read
+            added = self.resume_service.add_resume_child(resume_id, "experience", data)
+            if not added:
                 raise falcon.HTTPNotFound()
-
-            resume.experience.append(data)
-            updated_resume = self.resume_service.update_resume(resume_id, {"experience": resume.experience})
+            exp, updated_at = added
             resp.status = falcon.HTTP_201
-            resp.media = updated_resume.experience[-1].__dict__
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(exp)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_patch(self, req, resp, resume_id, experience_id):
         try:
             data = self.schema.load(req.media, partial=True)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            updated = self.resume_service.update_resume_child(resume_id, "experience", experience_id, data)
+            if not updated:
                 raise falcon.HTTPNotFound()
-
-            try:
-                experience_id = int(experience_id)
-                if experience_id >= len(resume.experience):
-                    raise falcon.HTTPNotFound()
-            except ValueError:
-                raise falcon.HTTPBadRequest(description="Invalid experience ID")
-
-            # Update experience fields
-            for key, value in data.items():
-                setattr(resume.experience[experience_id], key, value)
-
-            updated_resume = self.resume_service.update_resume(resume_id, {"experience": resume.experience})
-            resp.media = updated_resume.experience[experience_id].__dict__
+            exp, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(exp)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_delete(self, req, resp, resume_id, experience_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+        check_if_match(req, self.resume_service, resume_id)
+        if not self.resume_service.remove_resume_child(resume_id, "experience", experience_id):
             raise falcon.HTTPNotFound()
-
-        try:
-            experience_id = int(experience_id)
-            if experience_id >= len(resume.experience):
-                raise falcon.HTTPNotFound()
-        except ValueError:
-            raise falcon.HTTPBadRequest(description="Invalid experience ID")
-
-        resume.experience.pop(experience_id)
-        self.resume_service.update_resume(resume_id, {"experience": resume.experience})
-        resp.status = falcon.HTTP_204 
\ No newline at end of file
+        resp.status = falcon.HTTP_204
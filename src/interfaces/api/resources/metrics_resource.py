@@ -0,0 +1,11 @@
+from ....infrastructure.metrics import CONTENT_TYPE, MetricsRegistry
+
+# Serves the registry in Prometheus text format. Exempt from authentication
+# so scrapers need no token; keep it off public listeners.
+class MetricsResource:
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    def on_get(self, req, resp):
+        resp.content_type = CONTENT_TYPE
+        resp.data = self.registry.render()
@@ -0,0 +1,41 @@
+from datetime import datetime, UTC
+import falcon
+from ....application.services.resume_service import ResumeService
+from ....domain.models.serialization import to_dict
+from ....domain.models.user import UserRole
+from ..media import gzip_ndjson
+
+# GET /resumes:export streams every resume, children included, as gzip
+# compressed NDJSON; ?user_id= and ?updated_since= (ISO 8601) narrow it down.
+# Only owners export other users' resumes; everyone else gets their own.
+class ResumeExportResource:
+    def __init__(self, resume_service: ResumeService):
+        self.resume_service = resume_service
+
+    def on_get(self, req, resp):
+        resumes = self.resume_service.export_resumes(self._user_id(req), self._updated_since(req))
+        self._prepare(resp)
+        resp.stream = gzip_ndjson(to_dict(resume) for resume in resumes)
+
+    def _prepare(self, resp):
+        resp.content_type = 'application/gzip'
+        resp.downloadable_as = 'resumes.ndjson.gz'
+
+    def _user_id(self, req):
+        user_id = req.get_param('user_id')
+        if req.context["user_role"] == UserRole.OWNER:
+            return user_id
+        if user_id is not None and user_id != req.context["user_id"]:
+            raise falcon.HTTPForbidden(description="Only owners can export other users' resumes")
+        return req.context["user_id"]
+
+    def _updated_since(self, req):
+        value = req.get_param('updated_since')
+        if value is None:
+            return None
+        try:
+            updated_since = datetime.fromisoformat(value)
+        except ValueError:
+            raise falcon.HTTPBadRequest(description="updated_since must be an ISO 8601 timestamp")
+        # Stored timestamps are UTC
+        return updated_since if updated_since.tzinfo else updated_since.replace(tzinfo=UTC)
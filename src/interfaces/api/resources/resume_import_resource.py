@@ -0,0 +1,138 @@
+import falcon
+from typing import List
+from marshmallow import fields, ValidationError
+from ....application.services.resume_service import ResumeService
+from ..media import loads
+from .education_resource import EducationSchema
+from .experience_resource import ExperienceSchema
+from .resume_resource import ResumeSchema
+from .skill_resource import SkillSchema
+
+# Valid records written per insert_many round; with the line limit this bounds
+# what an import holds in memory, however large the upload
+IMPORT_BATCH_SIZE = 500
+# Longer lines are reported as errors without being buffered
+MAX_LINE_BYTES = 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+# Errors past this many are counted but not listed
+MAX_REPORTED_ERRORS = 100
+
+class ResumeImportSchema(ResumeSchema):
+    education = fields.List(fields.Nested(EducationSchema), load_default=list)
+    experience = fields.List(fields.Nested(ExperienceSchema), load_default=list)
+    skills = fields.List(fields.Nested(SkillSchema), load_default=list)
+
+class ImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line: int, errors) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": errors})
+
+    def add_saved(self, lines: List[int], resumes: list) -> None:
+        # A resume the store rejected comes back without an id
+        for line, resume in zip(lines, resumes):
+            if resume.id:
+                self.imported += 1
+            else:
+                self.add_error(line, "Rejected by the database")
+
+    def to_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+# POST /resumes:bulk takes one full resume per NDJSON line, children included.
+# Lines are validated as they arrive; invalid ones are reported by line
+# number and do not stop the import.
+class ResumeImportResource:
+    def __init__(self, resume_service: ResumeService):
+        self.resume_service = resume_service
+        self.schema = ResumeImportSchema()
+
+    def on_post(self, req, resp):
+        user_id = req.get_param('user_id')
+        if not user_id:
+            raise falcon.HTTPBadRequest(description="user_id parameter is required")
+
+        report = ImportReport()
+        batch, lines = [], []
+        for number, line in enumerate(_read_lines(req.bounded_stream), 1):
+            record = self._validate(report, number, line)
+            if record is None:
+                continue
+            batch.append(record)
+            lines.append(number)
+            if len(batch) == IMPORT_BATCH_SIZE:
+                report.add_saved(lines, self.resume_service.import_resumes(user_id, batch))
+                batch, lines = [], []
+        if batch:
+            report.add_saved(lines, self.resume_service.import_resumes(user_id, batch))
+
+        resp.media = report.to_dict()
+
+    def _validate(self, report: ImportReport, number: int, line):
+        if line is None:
+            report.add_error(number, f"Line exceeds {MAX_LINE_BYTES} bytes")
+            return None
+        if not line.strip():
+            return None
+
+        try:
+            data = loads(line)
+        except ValueError:
+            report.add_error(number, "Invalid JSON")
+            return None
+        if not isinstance(data, dict):
+            report.add_error(number, "Expected a JSON object")
+            return None
+
+        try:
+            return self.schema.load(data)
+        except ValidationError as e:
+            report.add_error(number, e.messages)
+            return None
+
+class LineSplitter:
+    # Cuts a chunked body into lines, handing out None in place of a line
+    # longer than MAX_LINE_BYTES so that such a line is never buffered whole
+    def __init__(self):
+        self._buffer = b""
+        self._oversized = False
+
+    def feed(self, chunk: bytes) -> list:
+        lines = []
+        buffer = self._buffer + chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            oversized = self._oversized or end - start > MAX_LINE_BYTES
+            lines.append(None if oversized else buffer[start:end + 1])
+            start = end + 1
+            self._oversized = False
+
+        self._buffer = buffer[start:]
+        if len(self._buffer) > MAX_LINE_BYTES:
+            self._oversized = True
+            self._buffer = b""
+        return lines
+
+    def close(self) -> list:
+        if self._oversized:
+            return [None]
+        return [self._buffer] if self._buffer else []
+
+def _read_lines(stream):
+    splitter = LineSplitter()
+    for chunk in iter(lambda: stream.read(READ_CHUNK_BYTES), b""):
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
@@ -1,7 +1,21 @@
-import json
 import falcon
 from marshmallow import Schema, fields, ValidationError
 from ....application.services.resume_service import ResumeService
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match
+from ..media import dumps_line
+from ..pagination import encode_cursor, decode_cursor, page_size
+
+NDJSON = 'application/x-ndjson'
+
+def prefers_ndjson(req) -> bool:
+    # Negotiated on q-values; JSON is listed first so that */* keeps getting JSON
+    return req.client_prefers((falcon.MEDIA_JSON, NDJSON)) == NDJSON
+
+# Fields a client can pick with ?fields=; id is always returned
+RESUME_FIELDS = ('user_id', 'title', 'contact', 'summary', 'education', 'experience', 'skills',
+                 'created_at', 'updated_at')
+CHILD_FIELDS = ('education', 'experience', 'skills')
 
 class ResumeSchema(Schema):
     title = fields.Str(required=True)
@@ -14,17 +28,36 @@ class ResumeResource:
         self.schema = ResumeSchema()
 
     def on_get(self, req, resp, resume_id=None):
+        fields = self._requested_fields(req)
         if resume_id:
-            resume = self.resume_service.get_resume(resume_id)
+            variant = ','.join(fields) if fields is not None else None
+            if not_modified(req, resp, self.resume_service.get_resume_version(resume_id), variant):
+                return
+            resume = self.resume_service.get_resume(resume_id, fields)
             if not resume:
                 raise falcon.HTTPNotFound()
-            resp.media = self._serialize_resume(resume)
+            if resume.updated_at:
+                resp.etag = make_etag(resume.updated_at, variant)
+            resp.media = self._serialize_resume(resume, fields)
         else:
             user_id = req.get_param('user_id')
             if not user_id:
                 raise falcon.HTTPBadRequest(description="user_id parameter is required")
-            resumes = self.resume_service.get_user_resumes(user_id)
-            resp.media = [self._serialize_resume(resume) for resume in resumes]
+            limit = page_size(req)
+            if limit is not None:
+                # One extra resume tells whether there is a next page
+                resumes = self.resume_service.get_user_resumes_page(
+                    user_id, limit + 1, decode_cursor(req.get_param('after')), self._page_fields(fields)
+                )
+                self._respond_page(req, resp, resumes, limit, fields)
+                return
+            if prefers_ndjson(req):
+                # One resume per line, written as soon as its batch is assembled
+                resp.content_type = NDJSON
+                resp.stream = self._stream_ndjson(self.resume_service.iter_user_resumes(user_id, fields), fields)
+                return
+            resumes = self.resume_service.get_user_resumes(user_id, fields)
+            resp.media = [self._serialize_resume(resume, fields) for resume in resumes]
 
     def on_post(self, req, resp):
         try:
@@ -40,6 +73,7 @@ class ResumeResource:
                 summary=data['summary']
             )
             resp.status = falcon.HTTP_201
+            resp.etag = make_etag(resume.updated_at)
             resp.media = self._serialize_resume(resume)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
@@ -47,29 +81,66 @@ class ResumeResource:
     def on_put(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
+            check_if_match(req, self.resume_service, resume_id)
             resume = self.resume_service.update_resume(resume_id, data)
             if not resume:
                 raise falcon.HTTPNotFound()
+            resp.etag = make_etag(resume.updated_at)
             resp.media = self._serialize_resume(resume)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_delete(self, req, resp, resume_id):
+        check_if_match(req, self.resume_service, resume_id)
         success = self.resume_service.delete_resume(resume_id)
         if not success:
             raise falcon.HTTPNotFound()
         resp.status = falcon.HTTP_204
 
-    def _serialize_resume(self, resume):
-        return {
-            'id': resume.id,
-            'user_id': resume.user_id,
-            'title': resume.title,
-            'contact': resume.contact.__dict__,
-            'summary': resume.summary,
-            'education': [edu.__dict__ for edu in resume.education],
-            'experience': [exp.__dict__ for exp in resume.experience],
-            'skills': [skill.__dict__ for skill in resume.skills],
-            'created_at': resume.created_at.isoformat(),
-            'updated_at': resume.updated_at.isoformat()
-        } 
\ No newline at end of file
+    def _requested_fields(self, req):
+        values = req.get_param_as_list('fields')
+        if values is None:
+            return None
+
+        # Accept both ?fields=a,b and repeated ?fields=a&fields=b
+        fields = {name.strip() for value in values for name in value.split(',') if name.strip()}
+
+        unknown = set(fields) - set(RESUME_FIELDS) - {'id'}
+        if unknown:
+            raise falcon.HTTPBadRequest(description=f"Unknown fields: {', '.join(sorted(unknown))}")
+        # Canonical order, so equivalent requests share an ETag
+        return [name for name in RESUME_FIELDS if name in fields]
+
+    def _page_fields(self, fields):
+        # The cursor is built from updated_at, so a sparse fieldset still loads it
+        if fields is None or 'updated_at' in fields:
+            return fields
+        return fields + ['updated_at']
+
+    def _respond_page(self, req, resp, resumes, limit, fields):
+        if len(resumes) > limit:
+            resumes = resumes[:limit]
+            resp.set_header('X-Next-Cursor', encode_cursor(resumes[-1]))
+        if prefers_ndjson(req):
+            # A page is bounded and already loaded; no need to stream it
+            resp.content_type = NDJSON
+            resp.data = b''.join(self._stream_ndjson(resumes, fields))
+        else:
+            resp.media = [self._serialize_resume(resume, fields) for resume in resumes]
+
+    def _stream_ndjson(self, resumes, fields=None):
+        for resume in resumes:
+            yield dumps_line(self._serialize_resume(resume, fields))
+
+    def _serialize_resume(self, resume, fields=None):
+        serialized = {'id': resume.id}
+        for name in RESUME_FIELDS if fields is None else fields:
+            value = getattr(resume, name)
+            if name in CHILD_FIELDS:
+                value = [to_dict(item) for item in value]
+            elif name == 'contact':
+                value = to_dict(value) if value else None
+            elif name in ('created_at', 'updated_at'):
+                value = value.isoformat()
+            serialized[name] = value
+        return serialized 
\ No newline at end of file
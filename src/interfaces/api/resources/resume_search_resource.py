@@ -0,0 +1,39 @@
+import falcon
+from ....application.services.resume_service import ResumeService
+from ....domain.models.resume import SKILL_LEVELS
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+# Ranking needs every result up to the page, so deep pages are bounded too
+MAX_SEARCH_OFFSET = 10000
+
+# GET /resumes:search?q=&skill=&min_level=&limit=&offset=
+class ResumeSearchResource:
+    def __init__(self, resume_service: ResumeService):
+        self.resume_service = resume_service
+
+    def on_get(self, req, resp):
+        text = req.get_param('q')
+        skill = req.get_param('skill')
+        if not text and not skill:
+            raise falcon.HTTPBadRequest(description="q or skill parameter is required")
+        min_level = req.get_param('min_level')
+        if min_level is not None and min_level not in SKILL_LEVELS:
+            raise falcon.HTTPBadRequest(description=f"min_level must be one of: {', '.join(SKILL_LEVELS)}")
+        limit = req.get_param_as_int('limit', min_value=1, max_value=MAX_SEARCH_LIMIT, default=DEFAULT_SEARCH_LIMIT)
+        offset = req.get_param_as_int('offset', min_value=0, max_value=MAX_SEARCH_OFFSET, default=0)
+
+        hits, total = self.resume_service.search_resumes(text, skill, min_level, limit, offset)
+        resp.media = {
+            'total': total,
+            'results': [
+                {
+                    'id': hit.resume_id,
+                    'user_id': hit.user_id,
+                    'title': hit.title,
+                    'updated_at': hit.updated_at.isoformat(),
+                    'score': round(hit.score, 4)
+                }
+                for hit in hits
+            ]
+        }
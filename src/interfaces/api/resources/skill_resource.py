@@ -1,71 +1,66 @@
 import falcon
 from marshmallow import Schema, fields, ValidationError
 from ....application.services.resume_service import ResumeService
+from ....domain.models.resume import SKILL_LEVELS
+from ....domain.models.serialization import to_dict
+from ..conditional_requests import make_etag, not_modified, check_if_match
 
 class SkillSchema(Schema):
     name = fields.Str(required=True)
-    level = fields.Str(required=True, validate=lambda x: x in ["Beginner", "Intermediate", "Advanced", "Expert"])
+    level = fields.Str(required=True, validate=lambda x: x in SKILL_LEVELS)
 
 class SkillResource:
     def __init__(self, resume_service: ResumeService):
         self.resume_service = resume_service
         self.schema = SkillSchema()
 
-    def on_get(self, req, resp, resume_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+    def on_get(self, req, resp, resume_id, skill_id=None):
+        if not_modified(req, resp, self.resume_service.get_resume_version(resume_id)):
+            return
+
+        # Only the skills collection is read, never the whole resume
+        if skill_id:
+            skill = self.resume_service.get_resume_child(resume_id, "skills", skill_id)
+            if not skill:
+                raise falcon.HTTPNotFound()
+            resp.media = to_dict(skill)
+            return
+
+        skills = self.resume_service.get_resume_children(resume_id, "skills")
+        if skills is None:
             raise falcon.HTTPNotFound()
-        resp.media = [skill.__dict__ for skill in resume.skills]
+        resp.media = [to_dict(skill) for skill in skills]
 
     def on_post(self, req, resp, resume_id):
         try:
             data = self.schema.load(req.media)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            # One insert and a version bump; the resume itself is never read
+            added = self.resume_service.add_resume_child(resume_id, "skills", data)
+            if not added:
                 raise falcon.HTTPNotFound()
-
-            resume.skills.append(data)
-            updated_resume = self.resume_service.update_resume(resume_id, {"skills": resume.skills})
+            skill, updated_at = added
             resp.status = falcon.HTTP_201
-            resp.media = updated_resume.skills[-1].__dict__
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(skill)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_patch(self, req, resp, resume_id, skill_id):
         try:
             data = self.schema.load(req.media, partial=True)
-            resume = self.resume_service.get_resume(resume_id)
-            if not resume:
+            check_if_match(req, self.resume_service, resume_id)
+            updated = self.resume_service.update_resume_child(resume_id, "skills", skill_id, data)
+            if not updated:
                 raise falcon.HTTPNotFound()
-
-            try:
-                skill_id = int(skill_id)
-                if skill_id >= len(resume.skills):
-                    raise falcon.HTTPNotFound()
-            except ValueError:
-                raise falcon.HTTPBadRequest(description="Invalid skill ID")
-
-            # Update skill fields
-            for key, value in data.items():
-                setattr(resume.skills[skill_id], key, value)
-
-            updated_resume = self.resume_service.update_resume(resume_id, {"skills": resume.skills})
-            resp.media = updated_resume.skills[skill_id].__dict__
+            skill, updated_at = updated
+            resp.etag = make_etag(updated_at)
+            resp.media = to_dict(skill)
         except ValidationError as e:
             raise falcon.HTTPBadRequest(description=str(e))
 
     def on_delete(self, req, resp, resume_id, skill_id):
-        resume = self.resume_service.get_resume(resume_id)
-        if not resume:
+        check_if_match(req, self.resume_service, resume_id)
+        if not self.resume_service.remove_resume_child(resume_id, "skills", skill_id):
             raise falcon.HTTPNotFound()
-
-        try:
-            skill_id = int(skill_id)
-            if skill_id >= len(resume.skills):
-                raise falcon.HTTPNotFound()
-        except ValueError:
-            raise falcon.HTTPBadRequest(description="Invalid skill ID")
-
-        resume.skills.pop(skill_id)
-        self.resume_service.update_resume(resume_id, {"skills": resume.skills})
-        resp.status = falcon.HTTP_204 
\ No newline at end of file
+        resp.status = falcon.HTTP_204
@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+from datetime import datetime, UTC
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from ...domain.models.serialization import to_dict
+from ...infrastructure.mongodb_client import mongo_client_settings
+from ...infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+from ...infrastructure.repositories.mongodb_embedded_resume_repository import MongoDBEmbeddedResumeRepository
+from ..api.media import gzip_ndjson
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export resumes, children included, as gzip-compressed NDJSON in a single pass."
+    )
+    parser.add_argument("--output", default="-", help="File to write, or - for stdout (default)")
+    parser.add_argument("--user-id", default=None, help="Only export this user's resumes")
+    parser.add_argument("--updated-since", type=datetime.fromisoformat, default=None,
+                        help="Only export resumes updated at or after this ISO 8601 timestamp (UTC if no offset)")
+    parser.add_argument("--level", type=int, default=6, help="gzip compression level, 1-9")
+    args = parser.parse_args()
+
+    updated_since = args.updated_since
+    if updated_since is not None and updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=UTC)
+
+    load_dotenv()
+    mongo_client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'), **mongo_client_settings())
+    database_name = os.getenv('MONGODB_DATABASE', 'resume_api')
+    if os.getenv('RESUME_STORAGE_LAYOUT', 'split') == 'embedded':
+        repository = MongoDBEmbeddedResumeRepository(
+            mongo_client, database_name, dual_read=os.getenv('RESUME_DUAL_READ', 'true') == 'true'
+        )
+    else:
+        repository = MongoDBResumeRepository(mongo_client, database_name)
+
+    exported = 0
+
+    def records():
+        nonlocal exported
+        for resume in repository.iter_all(args.user_id, updated_since):
+            exported += 1
+            yield to_dict(resume)
+
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for chunk in gzip_ndjson(records(), level=args.level):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+    print(f"{exported} resumes exported", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from ...infrastructure.mongodb_client import mongo_client_settings
+from ...infrastructure.repositories.mongodb_resume_repository import MongoDBResumeRepository
+from ...infrastructure.repositories.mongodb_embedded_resume_repository import MongoDBEmbeddedResumeRepository
+from ...infrastructure.repositories.mongodb_user_repository import MongoDBUserRepository
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or verify the indexes the Mongo repositories rely on.")
+    parser.add_argument("--verify", action="store_true", help="Only report missing indexes, do not create them")
+    parser.add_argument("--explain", action="store_true",
+                        help="Explain every repository query and fail if any of them does not use its index")
+    args = parser.parse_args()
+
+    load_dotenv()
+    mongo_client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'), **mongo_client_settings())
+    database_name = os.getenv('MONGODB_DATABASE', 'resume_api')
+    repositories = [
+        MongoDBResumeRepository(mongo_client, database_name),
+        MongoDBEmbeddedResumeRepository(mongo_client, database_name),
+        MongoDBUserRepository(mongo_client, database_name)
+    ]
+
+    failed = False
+    for repository in repositories:
+        label = type(repository).__name__
+        if not args.verify:
+            try:
+                repository.ensure_indexes()
+            except RuntimeError as error:
+                # Reported below as missing, along with the other repositories' indexes
+                print(f"{label}: {error}")
+
+        for index in repository.missing_indexes():
+            print(f"{label}: missing index {index}")
+            failed = True
+
+        if args.explain:
+            for query in repository.misplanned_queries():
+                print(f"{label}: {query}")
+                failed = True
+
+    print("Indexes FAILED verification" if failed else "Indexes OK")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import os
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from ...infrastructure.mongodb_client import mongo_client_settings
+from ...infrastructure.migrations.embedded_resume_migration import EmbeddedResumeMigration
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move education, experience and skills into their resume documents. "
+                    "Safe to interrupt and re-run: only resumes that are not migrated yet are processed."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many resumes are pending")
+    args = parser.parse_args()
+
+    load_dotenv()
+    mongo_client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'), **mongo_client_settings())
+    database_name = os.getenv('MONGODB_DATABASE', 'resume_api')
+    migration = EmbeddedResumeMigration(mongo_client, database_name, batch_size=args.batch_size)
+
+    print(f"{migration.pending()} resumes pending")
+    if args.dry_run:
+        return
+
+    report = migration.run(
+        max_batches=args.max_batches,
+        progress=lambda count: print(f"{count} resumes migrated", flush=True)
+    )
+    # Skipped resumes changed while their batch was migrated; a re-run picks them up
+    print(f"Done: {report.migrated} resumes migrated, {report.skipped} skipped, {migration.pending()} pending")
+
+if __name__ == "__main__":
+    main()